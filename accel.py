@@ -0,0 +1,104 @@
+# Hot loops used by writer.py and eink.py.
+#
+# On MicroPython ports with the native emitter the versions in
+# accel_native.py are used; elsewhere (including CPython on the host) the
+# pure Python versions below. Both are always importable from here as
+# py_<name> and native_<name> for benchmarking; NATIVE says which is active.
+import sys
+
+
+# Invert the first n bytes of buf in place.
+def py_invert(buf, n):
+    for i in range(n):
+        buf[i] = 0xFF & ~buf[i]
+
+
+# dst[doff + i] = table[src[soff - i]] for i in range(n): copies n bytes
+# backwards from src, translating each through table.
+def py_reverse_bytes(dst, doff, src, soff, n, table):
+    for i in range(n):
+        dst[doff + i] = table[src[soff - i]]
+
+
+# Printable width of a glyph less any blank columns on the right.
+def py_truelen(glyph, ht, wd):
+    gbytes = (wd + 7) >> 3
+    mc = 0  # Max non-blank column
+    for row in range(ht):
+        o = row * gbytes
+        for col in range(wd - 1, mc, -1):
+            if glyph[o + (col >> 3)] & (0x80 >> (col & 7)):
+                mc = col  # Eventually gives rightmost lit pixel
+                break
+        if mc + 1 == wd:
+            break  # All done: no trailing space
+    return mc + 1
+
+
+# Writer.stringlen: width of string in pixels from get_ch. With oh, return
+# whether it overhangs wd when started at column sc.
+def py_stringlen(get_ch, string, sc, wd, oh):
+    if not len(string):
+        return 0
+    l = 0
+    for char in string[:-1]:
+        _, _, char_width = get_ch(char)
+        l += char_width
+        if oh and l + sc > wd:
+            return True  # All done. Save time.
+    glyph, char_height, char_width = get_ch(string[-1])
+    if oh and l + sc + char_width > wd:
+        l += truelen(glyph, char_height, char_width)  # Last char might have blank cols on RHS
+    else:
+        l += char_width  # Public method. Return same value as old code.
+    return l + sc > wd if oh else l
+
+
+# Decode a glyph stored as PackBits (src[start:end]) into dst and undo the row
+# delta: each row of stride bytes was stored XORed with the row above.
+# Returns the number of bytes written.
+def py_unpack(dst, src, start, end, stride):
+    i = start
+    o = 0
+    while i < end:
+        n = src[i]
+        i += 1
+        if n < 128:  # n + 1 literal bytes
+            for k in range(n + 1):
+                dst[o + k] = src[i + k]
+            i += n + 1
+            o += n + 1
+        elif n > 128:  # 257 - n copies of the next byte
+            b = src[i]
+            i += 1
+            for k in range(257 - n):
+                dst[o + k] = b
+            o += 257 - n
+    for k in range(stride, o):
+        dst[k] ^= dst[k - stride]
+    return o
+
+
+NATIVE = False
+if sys.implementation.name == "micropython":
+    try:
+        import accel_native
+
+        NATIVE = True
+    except (ImportError, SyntaxError):
+        pass
+
+if NATIVE:
+    native_invert = invert = accel_native.invert
+    native_reverse_bytes = reverse_bytes = accel_native.reverse_bytes
+    native_truelen = truelen = accel_native.truelen
+    native_stringlen = stringlen = accel_native.stringlen
+    native_unpack = unpack = accel_native.unpack
+else:
+    native_invert = native_reverse_bytes = native_truelen = native_stringlen = None
+    native_unpack = None
+    invert = py_invert
+    reverse_bytes = py_reverse_bytes
+    truelen = py_truelen
+    stringlen = py_stringlen
+    unpack = py_unpack
@@ -0,0 +1,85 @@
+# Native/viper versions of the hot loops in accel.py. MicroPython only.
+# Importing this on a port without the native emitter raises SyntaxError;
+# accel.py then falls back to its pure Python versions.
+import micropython
+
+
+@micropython.viper
+def invert(buf, n: int):
+    p = ptr8(buf)
+    for i in range(n):
+        p[i] = p[i] ^ 0xFF
+
+
+@micropython.viper
+def reverse_bytes(dst, doff: int, src, soff: int, n: int, table):
+    d = ptr8(dst)
+    s = ptr8(src)
+    t = ptr8(table)
+    for i in range(n):
+        d[doff + i] = t[s[soff - i]]
+
+
+@micropython.viper
+def truelen(glyph, ht: int, wd: int) -> int:
+    g = ptr8(glyph)
+    gbytes = (wd + 7) >> 3
+    mc = 0
+    for row in range(ht):
+        o = row * gbytes
+        col = wd - 1
+        while col > mc:
+            if g[o + (col >> 3)] & (0x80 >> (col & 7)):
+                mc = col
+                break
+            col -= 1
+        if mc + 1 == wd:
+            break
+    return mc + 1
+
+
+@micropython.viper
+def unpack(dst, src, start: int, end: int, stride: int) -> int:
+    d = ptr8(dst)
+    s = ptr8(src)
+    i = start
+    o = 0
+    while i < end:
+        n = s[i]
+        i += 1
+        if n < 128:
+            n += 1
+            for k in range(n):
+                d[o + k] = s[i + k]
+            i += n
+            o += n
+        elif n > 128:
+            n = 257 - n
+            b = s[i]
+            i += 1
+            for k in range(n):
+                d[o + k] = b
+            o += n
+    k = stride
+    while k < o:
+        d[k] = d[k] ^ d[k - stride]
+        k += 1
+    return o
+
+
+@micropython.native
+def stringlen(get_ch, string, sc, wd, oh):
+    if not len(string):
+        return 0
+    l = 0
+    for char in string[:-1]:
+        _, _, char_width = get_ch(char)
+        l += char_width
+        if oh and l + sc > wd:
+            return True
+    glyph, char_height, char_width = get_ch(string[-1])
+    if oh and l + sc + char_width > wd:
+        l += truelen(glyph, char_height, char_width)
+    else:
+        l += char_width
+    return l + sc > wd if oh else l
@@ -0,0 +1,250 @@
+# On-device benchmarks. Run from the REPL, e.g.:
+#   mpremote run bench.py
+#   >>> import bench; bench.transfer()
+import gc
+import time
+import accel
+import eink
+
+_epd = None
+
+
+def _device():
+    global _epd
+
+    if _epd is None:
+        _epd = eink.EPD_2in9_B()
+
+    return _epd
+
+
+def _time(f, runs):
+    gc.collect()
+    start = time.ticks_us()
+    for _ in range(runs):
+        f()
+    return time.ticks_diff(time.ticks_us(), start) // runs
+
+
+def transfer(runs=3):
+    """Compare the per-byte and bulk frame transfer paths.
+
+    Only the SPI transfer is timed; the panel is not refreshed.
+    """
+    epd = _device()
+    epd.imageblack.fill(0xFF)
+    epd.imagered.fill(0xFF)
+    epd.imageblack.text("bench", 0, 10, 0x00)
+    epd.imagered.text("bench", 0, 25, 0x00)
+
+    # "native" is a frame drawn in scan order (see EPD_2in9_B rotate).
+    results = {}
+    for name, bulk, flip in (
+        ("bytewise", False, True),
+        ("bulk", True, True),
+        ("native", True, False),
+    ):
+        epd.bulk = bulk
+        results[name] = _time(lambda: epd.transfer(flip, flip), runs)
+        print(f"transfer {name}: {results[name] / 1000:.1f}ms")
+
+    epd.bulk = True
+    print(f"transfer speedup: {results['bytewise'] / results['bulk']:.1f}x")
+    print(f"transfer speedup (native): {results['bytewise'] / results['native']:.1f}x")
+    return results
+
+
+def hot_paths(runs=20):
+    """Compare the pure Python and native versions of the accel routines."""
+    from fonts import arial35
+
+    if not accel.NATIVE:
+        print("hot_paths: native emitter not available on this port")
+        return None
+
+    glyph, ht, wd = arial35.get_ch("8")
+    buf = bytearray(glyph)
+    wide = eink.EPD_WIDTH // 8
+    row = bytearray(wide)
+    src = bytearray(range(wide))
+    s = "light intensity shower rain"
+
+    cases = (
+        ("invert", lambda f: f(buf, len(buf))),
+        ("reverse_bytes", lambda f: f(row, 0, src, wide - 1, wide, eink._REVERSE)),
+        ("truelen", lambda f: f(glyph, ht, wd)),
+        ("stringlen", lambda f: f(arial35.get_ch, s, 0, 152, False)),
+    )
+
+    results = {}
+    for name, call in cases:
+        py = getattr(accel, "py_" + name)
+        native = getattr(accel, "native_" + name)
+        t_py = _time(lambda: call(py), runs)
+        t_native = _time(lambda: call(native), runs)
+        results[name] = (t_py, t_native)
+        print(f"{name}: python {t_py}us, native {t_native}us, "
+              f"{t_py / max(t_native, 1):.1f}x")
+
+    return results
+
+
+def measure(runs=20):
+    """Compare measuring a string through get_ch() with the metric tables."""
+    from fonts import arial35, metrics
+
+    s = "light intensity shower rain"
+    m = metrics.of(arial35)  # Builds the tables outside the timed runs
+    t_get_ch = _time(lambda: accel.stringlen(arial35.get_ch, s, 0, 152, False), runs)
+    t_tables = _time(lambda: m.stringlen(s), runs)
+    print(f"stringlen: get_ch {t_get_ch}us, tables {t_tables}us, "
+          f"{t_get_ch / max(t_tables, 1):.1f}x")
+    return t_get_ch, t_tables
+
+
+def fonts(names=("arial10", "arial35", "arial50"), runs=20):
+    """Heap and load time of font modules against font files.
+
+    Run on a fresh boot: a module that is already imported is not measured.
+    """
+    import sys
+    from fonts import store
+
+    results = {}
+    for name in names:
+        row = {}
+        for kind in ("module", "file"):
+            module = "fonts." + name
+            if kind == "module" and module in sys.modules:
+                print(f"fonts {name}: module already imported; skipped")
+                continue
+
+            gc.collect()
+            free = gc.mem_free()
+            start = time.ticks_us()
+            if kind == "module":
+                font = getattr(__import__(module), name)
+            else:
+                font = store.FontFile(store._DIR + "/" + name + ".fnt")
+            load_us = time.ticks_diff(time.ticks_us(), start)
+            gc.collect()
+            heap = free - gc.mem_free()
+            get_us = _time(lambda: font.get_ch("8"), runs)
+            row[kind] = (heap, load_us, get_us)
+            print(f"fonts {name} {kind}: heap {heap}B, load {load_us}us, "
+                  f"get_ch {get_us}us")
+        results[name] = row
+
+    return results
+
+
+def get_ch(names=("arial10", "arial35", "arial50"), runs=20):
+    """Time get_ch() over the digits for each font module and font file."""
+    from fonts import store
+
+    chars = "-0123456789"
+    results = {}
+    for name in names:
+        module = getattr(__import__("fonts." + name), name)
+        font = store.FontFile(store._DIR + "/" + name + ".fnt")
+        row = {}
+        for kind, f in (("module", module.get_ch), ("file", font.get_ch)):
+            def lookup():
+                for c in chars:
+                    f(c)
+
+            row[kind] = _time(lookup, runs) // len(chars)
+        results[name] = row
+        print(f"get_ch {name}: module {row['module']}us, file {row['file']}us")
+        font.close()
+
+    return results
+
+
+def packed(names=("arial10", "arial35", "arial50"), runs=20):
+    """Flash saved by packed glyphs against the time spent decoding them.
+
+    get_ch("8") is timed with the hot-glyph cache off, so it reads and (if
+    the glyph is packed) decodes every time. Writer's glyph cache means that
+    happens once per glyph in normal use.
+    """
+    from fonts import store
+
+    results = {}
+    for name in names:
+        font = store.FontFile(store._DIR + "/" + name + ".fnt")
+        get_us = _time(lambda: font.get_ch("8"), runs)
+        stats = font.stats()
+        per_decode = stats["decode_us"] // max(stats["decodes"], 1)
+        saved = stats["unpacked"] - stats["stored"]
+        results[name] = (saved, get_us, per_decode)
+        print(f"packed {name}: {stats['stored']}B stored, {saved}B saved; "
+              f"get_ch {get_us}us, decode {per_decode}us")
+        font.close()
+
+    return results
+
+
+class _Proxy:
+    # Writer needs width/height, which FrameBuffer does not expose.
+    def __init__(self, fb, width, height):
+        self.fb = fb
+        self.width = width
+        self.height = height
+        self.blit = fb.blit
+        self.fill_rect = fb.fill_rect
+        self.scroll = fb.scroll
+
+
+def text(runs=10):
+    """Compare per-character and whole-string (line_mode) text rendering.
+
+    The glyph cache is warm for both, so this times composition and blits.
+    Run it on the device before turning on settings.TEXT_LINE_MODE; on the
+    host the two are about even.
+    """
+    from writer import Writer
+    from fonts import arial10, arial35, arial50
+
+    epd = _device()
+    device = _Proxy(epd.imageblack, epd.width, epd.height)
+    lines = (
+        (arial50, "-88.88"),
+        (arial35, "88.88"),
+        (arial35, "WNW"),
+        (arial10, "few clouds"),
+        (arial10, "Feels like -88.88"),
+        (arial10, "Updated 22:02"),
+    )
+    writers = [(Writer(device, font), string) for font, string in lines]
+
+    def draw():
+        row = 0
+        for w, string in writers:
+            Writer.set_textpos(device, row, 0)
+            w.printstring(string)
+            row += w.height
+
+    results = {}
+    frames = {}
+    for name, line_mode in (("per-char", False), ("line", True)):
+        for w, _ in writers:
+            w.line_mode = line_mode
+        epd.imageblack.fill(0xFF)
+        draw()  # Warm the glyph cache
+        frames[name] = bytes(epd.buffer_black)
+        results[name] = _time(draw, runs)
+        print(f"text {name}: {results[name]}us")
+
+    print(f"text speedup: {results['per-char'] / max(results['line'], 1):.1f}x")
+    print("text output identical:", frames["per-char"] == frames["line"])
+    return results
+
+
+if __name__ == "__main__":
+    transfer()
+    hot_paths()
+    measure()
+    get_ch()
+    packed()
+    text()
@@ -0,0 +1,78 @@
+# Display driver interface.
+#
+# screen.py only talks to a Panel. A driver declares what its hardware can do
+# and create() turns on the cheapest transfer and refresh strategies the
+# panel supports, so larger panels are not stuck with the full-frame path.
+# The fast full-refresh waveform is the exception: it is only used on request.
+
+
+class Panel:
+    # Resolution in pixels, as drawn (after any rotation).
+    width = 0
+    height = 0
+
+    # Colour planes, each a framebuf.FrameBuffer where 0 is ink and 1 is
+    # background. The first is the main (black) plane.
+    planes = ("black",)
+
+    # Capabilities.
+    supports_partial = False  # Refresh only the changed region
+    supports_fast_lut = False  # Faster full-refresh waveform
+    supports_dma = False  # Frame transfer without the CPU
+
+    def plane(self, name):
+        """FrameBuffer for a plane; falls back to the main plane."""
+        raise NotImplementedError
+
+    def buffer(self, name):
+        """The bytes behind a plane, for saving and restoring whole frames."""
+        raise NotImplementedError
+
+    def configure(self, partial=False, fast=False):
+        """Enable the partial and fast refresh strategies. Drivers only get
+        options their capabilities allow (see create())."""
+        pass
+
+    @property
+    def busy(self):
+        return False
+
+    def changed(self):
+        """Share of the frame that differs from the panel, None if unknown."""
+        return None
+
+    def display(self, callback=None, deep=False):
+        """Show the frame buffers. With a callback, return without waiting for
+        the refresh; callback(panel) is called when it finishes. `deep` asks
+        for the slow, ghost-clearing waveform."""
+        raise NotImplementedError
+
+    def clear(self, callback=None):
+        """Wipe the panel to background. Same callback rules as display()."""
+        raise NotImplementedError
+
+    def sleep(self):
+        pass
+
+    @property
+    def asleep(self):
+        """True while the controller is in its sleep state (see sleep())."""
+        return False
+
+
+def create(driver, dma=True, partial=True, fast=False, **kwargs):
+    """Instantiate `driver` ("module.Class") with the cheapest strategies it
+    supports. dma/partial can be set to False to opt out and fast to True to
+    opt in; other keyword arguments go to the driver."""
+    module, name = driver.rsplit(".", 1)
+    cls = getattr(__import__(module), name)
+
+    if cls.supports_dma:
+        kwargs["dma"] = dma
+
+    panel = cls(**kwargs)
+    panel.configure(
+        partial=partial and cls.supports_partial,
+        fast=fast and cls.supports_fast_lut,
+    )
+    return panel
@@ -32,6 +32,14 @@
 from machine import Pin, SPI
 import framebuf
 import utime
+import accel
+import waveform
+from display import Panel
+
+try:
+    import asyncio
+except ImportError:
+    asyncio = None
 
 # Display resolution
 EPD_WIDTH = 152
@@ -82,32 +90,115 @@ byte_lookup = [
     0x0F, 0x8F, 0x4F, 0xCF, 0x2F, 0xAF, 0x6F, 0xEF, 0x1F, 0x9F, 0x5F, 0xDF, 0x3F, 0xBF, 0x7F, 0xFF
 ]
 
+# byte_lookup as `bytes`; indexing it is cheaper than a list of ints.
+_REVERSE = bytes(byte_lookup)
+
+# Number of rows transformed into the scratch buffer per SPI write.
+CHUNK_ROWS = 8
+
+# Controller states, see EPD_2in9_B.wake().
+STATE_POWERED = 0  # Reset; registers at their defaults
+STATE_READY = 1  # Initialised and accepting commands
+STATE_SLEEP = 2  # Deep sleep; RAM retained, needs a hardware reset to wake
+
+# Largest share of the frame, in changed bytes, still sent as a partial
+# refresh. Anything bigger gets a full refresh to clear ghosting.
+PARTIAL_LIMIT = 0.25
+
+
+class EPD_2in9_B(Panel):
+    width = EPD_WIDTH
+    height = EPD_HEIGHT
+    planes = ("black", "red")
+    supports_partial = True
+    supports_fast_lut = True
+    supports_dma = True
+
+    # rotate: 0 or 180. Rotation is applied when drawing, not on transfer: for
+    # 180 the frame buffers are MONO_HMSB (bit order reversed) and the
+    # controller fills RAM with decrementing X and Y, so the buffers are
+    # already in scan order and are sent with a straight copy.
+    # dma: send full frames with the rp2 DMA engine (spidma.py) instead of
+    # spi.write, leaving the CPU free during the transfer.
+    def __init__(self, rotate=0, dma=False):
+        if rotate not in (0, 180):
+            raise ValueError(f"rotate ({rotate}) must be 0 or 180")
 
-class EPD_2in9_B:
-    def __init__(self):
         self.reset_pin = Pin(RST_PIN, Pin.OUT)
 
         self.busy_pin = Pin(BUSY_PIN, Pin.IN, Pin.PULL_UP)
         self.cs_pin = Pin(CS_PIN, Pin.OUT)
-        self.width = EPD_WIDTH
-        self.height = EPD_HEIGHT
         self.lut = WF_PARTIAL_2IN66
 
+        self.state = STATE_POWERED
+        # Milliseconds taken by the last full init() and wake(), and the total
+        # saved by waking with less than a full init.
+        self.stats = {"init_ms": 0, "wake_ms": 0, "saved_ms": 0}
+
         self.spi = SPI(1)
         self.spi.init(baudrate=4000_000)
         self.dc_pin = Pin(DC_PIN, Pin.OUT)
 
+        self.rotate = rotate
+
+        # Legacy transfer-time flips. Prefer `rotate`, which costs nothing.
         self.invert_x = False
         self.invert_y = False
 
+        # Stream whole planes with CS held low. Set to False to fall back to
+        # the original one-byte-per-transaction path.
+        self.bulk = True
+
+        self.dma = None
+        self._transferring = False
+        if dma:
+            from spidma import SPIDMA
+            self.dma = SPIDMA(1)
+
+        self.wide = self.width // 8 + (1 if self.width % 8 else 0)
+        self._scratch = bytearray(self.wide * CHUNK_ROWS)
+
+        # Use the partial LUT for small updates. Copies of the last frame sent
+        # to the panel are kept to find what changed; None means unknown.
+        self.partial = True
+        self._prev_black = None
+        self._prev_red = None
+        # Waveform used for full refreshes outside of Clear(), which always
+        # uses the OTP waveform. See waveform.py.
+        self.full_waveform = waveform.OTP
+        self.waveforms = waveform.Waveforms(self)
+        self.waveforms.register(waveform.PARTIAL, self.lut)
+
+        # Non-blocking refresh state; see TurnOnDisplay(callback=...).
+        self._refreshing = False
+        self._on_refresh = None
+        self._busy_handler = self._busy_irq  # Bound once; no alloc in IRQ
+        self._idle = None
+        if asyncio is not None and hasattr(asyncio, "ThreadSafeFlag"):
+            self._idle = asyncio.ThreadSafeFlag()
+
+        fmt = framebuf.MONO_HMSB if rotate == 180 else framebuf.MONO_HLSB
         self.buffer_black = bytearray(self.height * self.width // 8)
         self.buffer_red = bytearray(self.height * self.width // 8)
         self.imageblack = framebuf.FrameBuffer(
-            self.buffer_black, self.width, self.height, framebuf.MONO_HLSB)
+            self.buffer_black, self.width, self.height, fmt)
         self.imagered = framebuf.FrameBuffer(
-            self.buffer_red, self.width, self.height, framebuf.MONO_HLSB)
+            self.buffer_red, self.width, self.height, fmt)
         self.init()
 
+    def plane(self, name):
+        return self.imagered if name == "red" else self.imageblack
+
+    def buffer(self, name):
+        return self.buffer_red if name == "red" else self.buffer_black
+
+    def configure(self, partial=False, fast=False):
+        self.partial = partial
+        self.full_waveform = waveform.FAST if fast else waveform.OTP
+
+    def clear(self, callback=None):
+        self.Clear(0xFF, 0xFF, callback)
+
     def digital_write(self, pin, value):
         pin.value(value)
 
@@ -125,6 +216,8 @@ class EPD_2in9_B:
 
     # Hardware reset
     def reset(self):
+        self.state = STATE_POWERED
+        self.waveforms.reset()
         self.digital_write(self.reset_pin, 1)
         self.delay_ms(50)
         self.digital_write(self.reset_pin, 0)
@@ -132,7 +225,16 @@ class EPD_2in9_B:
         self.digital_write(self.reset_pin, 1)
         self.delay_ms(50)
 
+    # Commands are ignored while refreshing. Waiting here would let the
+    # refresh callback run (and e.g. put the controller to sleep) before the
+    # command is sent, so a non-blocking refresh must be allowed to finish.
     def send_command(self, command):
+        if self._refreshing:
+            raise OSError("EPD: refresh in progress")
+
+        self._command(command)
+
+    def _command(self, command):
         self.digital_write(self.dc_pin, 0)
         self.digital_write(self.cs_pin, 0)
         self.spi_writebyte([command])
@@ -144,6 +246,13 @@ class EPD_2in9_B:
         self.spi_writebyte([data])
         self.digital_write(self.cs_pin, 1)
 
+    # Send a block of data in one SPI transaction.
+    def send_buffer(self, data):
+        self.digital_write(self.dc_pin, 1)
+        self.digital_write(self.cs_pin, 0)
+        self.spi.write(data)
+        self.digital_write(self.cs_pin, 1)
+
     def SetWindow(self, x_start, y_start, x_end, y_end):
         self.send_command(0x44)
         self.send_data((x_start >> 3) & 0x1f)
@@ -170,38 +279,353 @@ class EPD_2in9_B:
 
         utime.sleep_ms(50)
 
-    def TurnOnDisplay(self):
+    # Poll BUSY without ReadBusy's fixed delays. For short register updates.
+    def WaitBusy(self):
+        while self.busy_pin.value() == 1:
+            utime.sleep_ms(1)
+
+    @property
+    def busy(self):
+        """True while a non-blocking transfer or refresh is in progress."""
+        return self._refreshing or self._transferring
+
+    async def wait_idle(self):
+        """Wait for a non-blocking refresh to finish."""
+        while self._transferring:
+            await asyncio.sleep(0.01)
+        while self._refreshing:
+            if self._idle is not None:
+                await self._idle.wait()
+            else:
+                await asyncio.sleep(0.01)
+
+    # Without a callback the refresh blocks until BUSY is released. With one,
+    # this returns as soon as the refresh starts and callback(epd) is called
+    # once BUSY falls. wait_idle() can be awaited instead of, or as well as,
+    # passing a callback.
+    def TurnOnDisplay(self, callback=None):
+        control = self.waveforms.update_control()
+        if control is not None:
+            self.send_command(0x22)
+            self.send_data(control)
+
+        if callback is not None:
+            self._refresh_async(callback)
+            return
+
         self.send_command(0x20)
         self.ReadBusy()
 
+    # Everything is armed before 0x20 so a BUSY IRQ that comes straight away
+    # still finds the refresh in progress.
+    def _refresh_async(self, callback):
+        self._on_refresh = callback
+        self._refreshing = True
+        self.busy_pin.irq(trigger=Pin.IRQ_FALLING, handler=self._busy_handler)
+        self._command(0x20)
+
+    def _busy_irq(self, _):
+        if self.busy_pin.value() == 0:
+            self._refresh_done()
+
+    def _refresh_done(self):
+        if not self._refreshing:
+            return
+
+        self._refreshing = False
+        self.busy_pin.irq(handler=None)
+        if self._idle is not None:
+            self._idle.set()
+
+        callback = self._on_refresh
+        self._on_refresh = None
+        callback(self)
+
     def init(self):
+        start = utime.ticks_ms()
         self.reset()
         self.ReadBusy()
         self.send_command(0x12)
         self.ReadBusy()  # waiting for the electronic paper IC to release the idle signal
 
-        self.send_command(0x11)
-        self.send_data(0x03)
+        self._configure()
+        self.ReadBusy()
+        self.state = STATE_READY
+        self.stats["init_ms"] = utime.ticks_diff(utime.ticks_ms(), start)
 
-        self.SetWindow(0, 0, self.width-1, self.height-1)
+    def _configure(self):
+        self.send_command(0x11)  # data entry mode
+        self.send_data(0x00 if self.rotate == 180 else 0x03)
 
-        self.send_command(0x21)  # resolution setting
-        self.send_data(0x00)
+        self.send_command(0x21)  # display update control
+        self.send_data(0x80)  # Invert red RAM; frame buffers use 0 for red
         self.send_data(0x80)
 
-        self.SetCursor(0, 0)
-        self.ReadBusy()
+        self.SetArea(0, self.wide - 1, 0, self.height - 1)
 
-    def display(self, invert_x=None, invert_y=None):
-        high = self.height
-        if (self.width % 8 == 0):
-            wide = self.width // 8
+    # Hardware reset, then restore the registers. A hardware reset already
+    # puts them at their defaults, so the 0x12 software reset is not needed.
+    def _restart(self):
+        self.reset()
+        self.WaitBusy()
+        self._configure()
+        self.WaitBusy()
+        self.state = STATE_READY
+
+    def wake(self):
+        """Make sure the controller is initialised, doing as little as needed.
+
+        Nothing is sent if it already is, and nothing is counted: one update
+        calls this several times. Out of deep sleep (or after a bare reset)
+        the registers are restored without a software reset or ReadBusy's
+        fixed delays; that takes stats["wake_ms"] and the time saved against
+        init() is added to stats["saved_ms"].
+        """
+        if self.state == STATE_READY:
+            return
+
+        start = utime.ticks_ms()
+        self._restart()
+        took = utime.ticks_diff(utime.ticks_ms(), start)
+        self.stats["wake_ms"] = took
+        self.stats["saved_ms"] += max(self.stats["init_ms"] - took, 0)
+
+    # Set the RAM window and cursor. Byte columns and rows are given in scan
+    # order, as if rotate were 0; rotation is handled here.
+    def SetArea(self, x_start, x_end, y_start, y_end):
+        if self.rotate == 180:
+            x_start, x_end = self.wide - 1 - x_start, self.wide - 1 - x_end
+            y_start, y_end = self.height - 1 - y_start, self.height - 1 - y_end
+
+        self.SetWindow(x_start * 8, y_start, x_end * 8, y_end)
+        self.SetCursor(x_start, y_start)
+
+    def display(self, invert_x=None, invert_y=None, full=False, callback=None,
+                full_waveform=None, deep=False):
+        """Send the frame buffers and refresh the panel.
+
+        Only the regions that changed since the last call are written. Small
+        black-only changes use the partial LUT; everything else gets a full
+        refresh. Returns False if nothing changed and no refresh was done.
+
+        If `callback` is given the refresh does not block; see TurnOnDisplay.
+        It is called straight away when there is nothing to refresh.
+
+        A full refresh uses `full_waveform`, or self.full_waveform if None.
+        `deep` forces a full refresh with the OTP waveform.
+        """
+        ix = invert_x if invert_x is not None else self.invert_x
+        iy = invert_y if invert_y is not None else self.invert_y
+
+        if deep:
+            full = True
+            full_waveform = waveform.OTP
+
+        if full or not self.partial or self._prev_black is None:
+            self.wake()
+        else:
+            rects = self.dirty_rects()
+            if not rects:
+                if callback is not None:
+                    callback(self)
+                return False
+
+            self.wake()
+            if self._partial_ok(rects):
+                self._display_partial(rects, ix, iy)
+                self._remember()
+                self.TurnOnDisplay(callback)
+                return True
+
+        if full_waveform is None:
+            full_waveform = self.full_waveform
+        self.waveforms.select(full_waveform)
+        self._remember()
+        if callback is None:
+            self.transfer(ix, iy)
+            self.TurnOnDisplay()
         else:
-            wide = self.width // 8 + 1
+            self.transfer(ix, iy, lambda: self.TurnOnDisplay(callback))
+        return True
 
+    # With a callback, a DMA transfer returns at once and callback() is called
+    # when it is done; the other paths call it before returning.
+    def transfer(self, invert_x=None, invert_y=None, callback=None):
         ix = invert_x if invert_x is not None else self.invert_x
         iy = invert_y if invert_y is not None else self.invert_y
 
+        self.wake()
+        self.SetArea(0, self.wide - 1, 0, self.height - 1)
+
+        if self.dma is not None and self.bulk and not ix and not iy:
+            self._transfer_dma(callback)
+            return
+
+        if self.bulk:
+            self._write_plane(0x24, self.buffer_black, ix, iy)
+            self._write_plane(0x26, self.buffer_red, ix, iy)
+        else:
+            self._transfer_bytewise(ix, iy)
+
+        if callback is not None:
+            callback()
+
+    def _transfer_dma(self, callback):
+        def red_done():
+            self.digital_write(self.cs_pin, 1)
+            self._transferring = False
+            if callback is not None:
+                callback()
+
+        def black_done():
+            self.digital_write(self.cs_pin, 1)
+            self.send_command(0x26)
+            self.digital_write(self.dc_pin, 1)
+            self.digital_write(self.cs_pin, 0)
+            self.dma.write(self.buffer_red, red_done)
+
+        self._transferring = True
+        self.send_command(0x24)
+        self.digital_write(self.dc_pin, 1)
+        self.digital_write(self.cs_pin, 0)
+        self.dma.write(self.buffer_black, black_done)
+
+        if callback is None:
+            while self._transferring:
+                self.dma.wait()
+
+    def dirty_rects(self):
+        """Byte-aligned rectangles that differ from the last frame sent.
+
+        Returns a list of (row_start, row_end, col_start, col_end, red) in
+        frame buffer coordinates. Ends are inclusive and columns are bytes.
+        Runs of consecutive changed rows are merged into one rectangle. `red`
+        is True if the red plane changed within the rectangle.
+        """
+        if self._prev_black is None:
+            return [(0, self.height - 1, 0, self.wide - 1, True)]
+
+        wide = self.wide
+        black = memoryview(self.buffer_black)
+        red = memoryview(self.buffer_red)
+        prev_black = memoryview(self._prev_black)
+        prev_red = memoryview(self._prev_red)
+
+        rects = []
+        rect = None
+        for j in range(self.height):
+            o = j * wide
+            e = o + wide
+            black_same = black[o:e] == prev_black[o:e]
+            red_same = red[o:e] == prev_red[o:e]
+            if black_same and red_same:
+                rect = None
+                continue
+
+            first = wide
+            last = -1
+            for i in range(o, e):
+                if black[i] != prev_black[i] or red[i] != prev_red[i]:
+                    if first == wide:
+                        first = i - o
+                    last = i - o
+
+            if rect is None:
+                rect = [j, j, first, last, not red_same]
+                rects.append(rect)
+            else:
+                rect[1] = j
+                rect[2] = min(rect[2], first)
+                rect[3] = max(rect[3], last)
+                rect[4] = rect[4] or not red_same
+
+        return [tuple(r) for r in rects]
+
+    def changed(self):
+        """Share of the frame (0.0 to 1.0) that differs from the panel.
+
+        None if the panel contents are unknown, e.g. after a reboot.
+        """
+        if self._prev_black is None:
+            return None
+
+        return self._area(self.dirty_rects()) / len(self.buffer_black)
+
+    @staticmethod
+    def _area(rects):
+        return sum((r1 - r0 + 1) * (c1 - c0 + 1) for (r0, r1, c0, c1, _) in rects)
+
+    def _partial_ok(self, rects):
+        # The partial waveform only drives black/white. Red needs a full cycle.
+        for rect in rects:
+            if rect[4]:
+                return False
+
+        return self._area(rects) <= len(self.buffer_black) * PARTIAL_LIMIT
+
+    def _remember(self):
+        if self._prev_black is None:
+            self._prev_black = bytearray(self.buffer_black)
+            self._prev_red = bytearray(self.buffer_red)
+        else:
+            self._prev_black[:] = self.buffer_black
+            self._prev_red[:] = self.buffer_red
+
+    def _display_partial(self, rects, ix, iy):
+        self.waveforms.select(waveform.PARTIAL)
+
+        for (r0, r1, c0, c1, _) in rects:
+            # Frame buffer rectangle to panel RAM window.
+            y0, y1 = (self.height - 1 - r1, self.height - 1 - r0) if ix else (r0, r1)
+            x0, x1 = (self.wide - 1 - c1, self.wide - 1 - c0) if iy else (c0, c1)
+
+            self.SetArea(x0, x1, y0, y1)
+            self._write_plane(0x24, self.buffer_black, ix, iy, r0, r1, c0, c1)
+
+    def _write_plane(self, command, buf, ix, iy, r0=0, r1=None, c0=0, c1=None):
+        wide = self.wide
+        if r1 is None:
+            r1 = self.height - 1
+        if c1 is None:
+            c1 = wide - 1
+        count = c1 - c0 + 1
+
+        self.send_command(command)
+
+        if not iy and not ix and count == wide:
+            # Rows are contiguous and already in panel order; send as is.
+            self.send_buffer(memoryview(buf)[r0 * wide:(r1 + 1) * wide])
+            return
+
+        self.digital_write(self.dc_pin, 1)
+        self.digital_write(self.cs_pin, 0)
+        scratch = self._scratch
+        size = len(scratch) - len(scratch) % count
+        mv = memoryview(buf)
+        rows = range(r1, r0 - 1, -1) if ix else range(r0, r1 + 1)
+        n = 0
+        for j in rows:
+            o = j * wide
+            if iy:
+                accel.reverse_bytes(scratch, n, buf, o + c1, count, _REVERSE)
+            else:
+                scratch[n:n + count] = mv[o + c0:o + c0 + count]
+
+            n += count
+            if n == size:
+                self.spi.write(memoryview(scratch)[:n])
+                n = 0
+
+        if n:
+            self.spi.write(memoryview(scratch)[:n])
+
+        self.digital_write(self.cs_pin, 1)
+
+    # Original Waveshare transfer: one SPI transaction per byte.
+    def _transfer_bytewise(self, ix, iy):
+        high = self.height
+        wide = self.wide
+
         def iter_x(value):
             r = range(0, value)
             return r if ix is not True else reversed(r)
@@ -222,18 +646,41 @@ class EPD_2in9_B:
         self.send_command(0x26)
         for j in iter_x(high):
             for i in iter_y(wide):
-                b = ~self.buffer_red[i + j * wide]
+                b = self.buffer_red[i + j * wide]
                 b = bl_y(b)
                 self.send_data(b)
 
-        self.TurnOnDisplay()
-
-    def Clear(self, colorblack, colorred):
+    def Clear(self, colorblack, colorred, callback=None):
         high = self.height
-        if (self.width % 8 == 0):
-            wide = self.width // 8
-        else:
-            wide = self.width // 8 + 1
+        wide = self.wide
+
+        self.wake()
+        self.waveforms.select(waveform.OTP)  # Deep clean
+
+        self.SetArea(0, self.wide - 1, 0, self.height - 1)
+
+        # Panel no longer shows the frame buffers.
+        self._prev_black = None
+        self._prev_red = None
+
+        if self.bulk:
+            scratch = self._scratch
+            for command, color in ((0x24, colorblack), (0x26, colorred)):
+                for i in range(len(scratch)):
+                    scratch[i] = color
+
+                self.send_command(command)
+                self.digital_write(self.dc_pin, 1)
+                self.digital_write(self.cs_pin, 0)
+                full, rest = divmod(high, CHUNK_ROWS)
+                for _ in range(full):
+                    self.spi.write(scratch)
+                if rest:
+                    self.spi.write(memoryview(scratch)[:rest * wide])
+                self.digital_write(self.cs_pin, 1)
+
+            self.TurnOnDisplay(callback)
+            return
 
         self.send_command(0x24)
 
@@ -244,13 +691,18 @@ class EPD_2in9_B:
 
         for j in range(0, high):
             for i in range(0, wide):
-                self.send_data(~colorred)
+                self.send_data(colorred)
+
+        self.TurnOnDisplay(callback)
 
-        self.TurnOnDisplay()
+    @property
+    def asleep(self):
+        return self.state == STATE_SLEEP
 
     def sleep(self):
         self.send_command(0X10)  # deep sleep
         self.send_data(0x01)
+        self.state = STATE_SLEEP
 
 
 # if __name__=='__main__':
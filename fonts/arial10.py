@@ -1,5 +1,8 @@
 # Code generated by font-to-py.py.
 # Font: Arial.ttf
+# Glyph layout: see fonts/index.py (tools/fontpy.py).
+from fonts import index
+
 version = '0.25'
 
 def height():
@@ -24,116 +27,93 @@ def max_ch():
     return 126
 
 _font =\
-b'\x06\x00\x70\x88\x08\x10\x20\x20\x00\x20\x00\x00\x03\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x02\x00\x80\x80\x80\x80\x80\x80'\
-b'\x00\x80\x00\x00\x04\x00\xa0\xa0\xa0\x00\x00\x00\x00\x00\x00\x00'\
-b'\x06\x00\x28\x28\xf8\x50\x50\xf8\xa0\xa0\x00\x00\x06\x00\x70\xa8'\
-b'\xa0\x70\x28\x28\xa8\x70\x20\x00\x0a\x00\x62\x00\x94\x00\x94\x00'\
-b'\x68\x00\x0b\x00\x14\x80\x14\x80\x23\x00\x00\x00\x00\x00\x07\x00'\
-b'\x30\x48\x48\x30\x50\x8c\x88\x74\x00\x00\x02\x00\x80\x80\x80\x00'\
-b'\x00\x00\x00\x00\x00\x00\x04\x00\x20\x40\x80\x80\x80\x80\x80\x80'\
-b'\x40\x20\x04\x00\x80\x40\x20\x20\x20\x20\x20\x20\x40\x80\x04\x00'\
-b'\x40\xe0\x40\xa0\x00\x00\x00\x00\x00\x00\x06\x00\x00\x00\x20\x20'\
-b'\xf8\x20\x20\x00\x00\x00\x03\x00\x00\x00\x00\x00\x00\x00\x00\x80'\
-b'\x80\x80\x04\x00\x00\x00\x00\x00\x00\xe0\x00\x00\x00\x00\x03\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x80\x00\x00\x03\x00\x20\x20\x40\x40'\
-b'\x40\x40\x80\x80\x00\x00\x06\x00\x70\x88\x88\x88\x88\x88\x88\x70'\
-b'\x00\x00\x06\x00\x20\x60\xa0\x20\x20\x20\x20\x20\x00\x00\x06\x00'\
-b'\x70\x88\x08\x08\x10\x20\x40\xf8\x00\x00\x06\x00\x70\x88\x08\x30'\
-b'\x08\x08\x88\x70\x00\x00\x06\x00\x10\x30\x50\x50\x90\xf8\x10\x10'\
-b'\x00\x00\x06\x00\x78\x40\x80\xf0\x08\x08\x88\x70\x00\x00\x06\x00'\
-b'\x70\x88\x80\xf0\x88\x88\x88\x70\x00\x00\x06\x00\xf8\x10\x10\x20'\
-b'\x20\x40\x40\x40\x00\x00\x06\x00\x70\x88\x88\x70\x88\x88\x88\x70'\
-b'\x00\x00\x06\x00\x70\x88\x88\x88\x78\x08\x88\x70\x00\x00\x03\x00'\
-b'\x00\x00\x80\x00\x00\x00\x00\x80\x00\x00\x03\x00\x00\x00\x80\x00'\
-b'\x00\x00\x00\x80\x80\x80\x06\x00\x00\x00\x08\x70\x80\x70\x08\x00'\
-b'\x00\x00\x06\x00\x00\x00\x00\xf8\x00\xf8\x00\x00\x00\x00\x06\x00'\
-b'\x00\x00\x80\x70\x08\x70\x80\x00\x00\x00\x06\x00\x70\x88\x08\x10'\
-b'\x20\x20\x00\x20\x00\x00\x0b\x00\x1f\x00\x60\x80\x4d\x40\x93\x40'\
-b'\xa2\x40\xa2\x40\xa6\x80\x9b\x00\x40\x40\x3f\x80\x08\x00\x10\x28'\
-b'\x28\x28\x44\x7c\x82\x82\x00\x00\x07\x00\xf8\x84\x84\xfc\x84\x84'\
-b'\x84\xf8\x00\x00\x07\x00\x38\x44\x80\x80\x80\x80\x44\x38\x00\x00'\
-b'\x07\x00\xf0\x88\x84\x84\x84\x84\x88\xf0\x00\x00\x06\x00\xf8\x80'\
-b'\x80\xf8\x80\x80\x80\xf8\x00\x00\x06\x00\xf8\x80\x80\xf0\x80\x80'\
-b'\x80\x80\x00\x00\x08\x00\x38\x44\x82\x80\x8e\x82\x44\x38\x00\x00'\
-b'\x07\x00\x84\x84\x84\xfc\x84\x84\x84\x84\x00\x00\x02\x00\x80\x80'\
-b'\x80\x80\x80\x80\x80\x80\x00\x00\x05\x00\x10\x10\x10\x10\x10\x90'\
-b'\x90\x60\x00\x00\x07\x00\x84\x88\x90\xb0\xd0\x88\x88\x84\x00\x00'\
-b'\x06\x00\x80\x80\x80\x80\x80\x80\x80\xf8\x00\x00\x08\x00\x82\xc6'\
-b'\xc6\xaa\xaa\xaa\x92\x92\x00\x00\x07\x00\x84\xc4\xa4\xa4\x94\x94'\
-b'\x8c\x84\x00\x00\x08\x00\x38\x44\x82\x82\x82\x82\x44\x38\x00\x00'\
-b'\x06\x00\xf0\x88\x88\x88\xf0\x80\x80\x80\x00\x00\x08\x00\x38\x44'\
-b'\x82\x82\x82\x9a\x44\x3e\x00\x00\x07\x00\xf8\x84\x84\xf8\x90\x88'\
-b'\x88\x84\x00\x00\x07\x00\x78\x84\x80\x60\x18\x04\x84\x78\x00\x00'\
-b'\x06\x00\xf8\x20\x20\x20\x20\x20\x20\x20\x00\x00\x07\x00\x84\x84'\
-b'\x84\x84\x84\x84\x84\x78\x00\x00\x08\x00\x82\x82\x44\x44\x28\x28'\
-b'\x10\x10\x00\x00\x0b\x00\x84\x20\x8a\x20\x4a\x40\x4a\x40\x51\x40'\
-b'\x51\x40\x20\x80\x20\x80\x00\x00\x00\x00\x07\x00\x84\x48\x48\x30'\
-b'\x30\x48\x48\x84\x00\x00\x08\x00\x82\x44\x44\x28\x10\x10\x10\x10'\
-b'\x00\x00\x07\x00\x7c\x08\x10\x10\x20\x20\x40\xfc\x00\x00\x03\x00'\
-b'\xc0\x80\x80\x80\x80\x80\x80\x80\x80\xc0\x03\x00\x80\x80\x40\x40'\
-b'\x40\x40\x20\x20\x00\x00\x03\x00\xc0\x40\x40\x40\x40\x40\x40\x40'\
-b'\x40\xc0\x05\x00\x20\x50\x50\x88\x00\x00\x00\x00\x00\x00\x06\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\xfc\x00\x04\x00\x80\x40\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x06\x00\x00\x00\x70\x88\x78\x88\x98\xe8'\
-b'\x00\x00\x06\x00\x80\x80\xb0\xc8\x88\x88\xc8\xb0\x00\x00\x06\x00'\
-b'\x00\x00\x70\x88\x80\x80\x88\x70\x00\x00\x06\x00\x08\x08\x68\x98'\
-b'\x88\x88\x98\x68\x00\x00\x06\x00\x00\x00\x70\x88\xf8\x80\x88\x70'\
-b'\x00\x00\x04\x00\x20\x40\xe0\x40\x40\x40\x40\x40\x00\x00\x06\x00'\
-b'\x00\x00\x68\x98\x88\x88\x98\x68\x08\xf0\x06\x00\x80\x80\xb0\xc8'\
-b'\x88\x88\x88\x88\x00\x00\x02\x00\x80\x00\x80\x80\x80\x80\x80\x80'\
-b'\x00\x00\x02\x00\x40\x00\x40\x40\x40\x40\x40\x40\x40\x80\x05\x00'\
-b'\x80\x80\x90\xa0\xc0\xe0\xa0\x90\x00\x00\x02\x00\x80\x80\x80\x80'\
-b'\x80\x80\x80\x80\x00\x00\x08\x00\x00\x00\xbc\xd2\x92\x92\x92\x92'\
-b'\x00\x00\x06\x00\x00\x00\xf0\x88\x88\x88\x88\x88\x00\x00\x06\x00'\
-b'\x00\x00\x70\x88\x88\x88\x88\x70\x00\x00\x06\x00\x00\x00\xb0\xc8'\
-b'\x88\x88\xc8\xb0\x80\x80\x06\x00\x00\x00\x68\x98\x88\x88\x98\x68'\
-b'\x08\x08\x04\x00\x00\x00\xa0\xc0\x80\x80\x80\x80\x00\x00\x06\x00'\
-b'\x00\x00\x70\x88\x60\x10\x88\x70\x00\x00\x03\x00\x40\x40\xe0\x40'\
-b'\x40\x40\x40\x60\x00\x00\x06\x00\x00\x00\x88\x88\x88\x88\x98\x68'\
-b'\x00\x00\x06\x00\x00\x00\x88\x88\x50\x50\x20\x20\x00\x00\x0a\x00'\
-b'\x00\x00\x00\x00\x88\x80\x94\x80\x55\x00\x55\x00\x22\x00\x22\x00'\
-b'\x00\x00\x00\x00\x06\x00\x00\x00\x88\x50\x20\x20\x50\x88\x00\x00'\
-b'\x06\x00\x00\x00\x88\x88\x50\x50\x20\x20\x20\x40\x06\x00\x00\x00'\
-b'\xf8\x10\x20\x20\x40\xf8\x00\x00\x04\x00\x20\x40\x40\x40\x80\x40'\
-b'\x40\x40\x40\x20\x02\x00\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80'\
-b'\x04\x00\x80\x40\x40\x40\x20\x40\x40\x40\x40\x80\x06\x00\x00\x00'\
-b'\x00\xe8\xb0\x00\x00\x00\x00\x00'
-
-_index =\
-b'\x00\x00\x0c\x00\x0c\x00\x18\x00\x18\x00\x24\x00\x24\x00\x30\x00'\
-b'\x30\x00\x3c\x00\x3c\x00\x48\x00\x48\x00\x5e\x00\x5e\x00\x6a\x00'\
-b'\x6a\x00\x76\x00\x76\x00\x82\x00\x82\x00\x8e\x00\x8e\x00\x9a\x00'\
-b'\x9a\x00\xa6\x00\xa6\x00\xb2\x00\xb2\x00\xbe\x00\xbe\x00\xca\x00'\
-b'\xca\x00\xd6\x00\xd6\x00\xe2\x00\xe2\x00\xee\x00\xee\x00\xfa\x00'\
-b'\xfa\x00\x06\x01\x06\x01\x12\x01\x12\x01\x1e\x01\x1e\x01\x2a\x01'\
-b'\x2a\x01\x36\x01\x36\x01\x42\x01\x42\x01\x4e\x01\x4e\x01\x5a\x01'\
-b'\x5a\x01\x66\x01\x66\x01\x72\x01\x72\x01\x7e\x01\x7e\x01\x8a\x01'\
-b'\x8a\x01\x96\x01\x96\x01\xac\x01\xac\x01\xb8\x01\xb8\x01\xc4\x01'\
-b'\xc4\x01\xd0\x01\xd0\x01\xdc\x01\xdc\x01\xe8\x01\xe8\x01\xf4\x01'\
-b'\xf4\x01\x00\x02\x00\x02\x0c\x02\x0c\x02\x18\x02\x18\x02\x24\x02'\
-b'\x24\x02\x30\x02\x30\x02\x3c\x02\x3c\x02\x48\x02\x48\x02\x54\x02'\
-b'\x54\x02\x60\x02\x60\x02\x6c\x02\x6c\x02\x78\x02\x78\x02\x84\x02'\
-b'\x84\x02\x90\x02\x90\x02\x9c\x02\x9c\x02\xa8\x02\xa8\x02\xb4\x02'\
-b'\xb4\x02\xca\x02\xca\x02\xd6\x02\xd6\x02\xe2\x02\xe2\x02\xee\x02'\
-b'\xee\x02\xfa\x02\xfa\x02\x06\x03\x06\x03\x12\x03\x12\x03\x1e\x03'\
-b'\x1e\x03\x2a\x03\x2a\x03\x36\x03\x36\x03\x42\x03\x42\x03\x4e\x03'\
-b'\x4e\x03\x5a\x03\x5a\x03\x66\x03\x66\x03\x72\x03\x72\x03\x7e\x03'\
-b'\x7e\x03\x8a\x03\x8a\x03\x96\x03\x96\x03\xa2\x03\xa2\x03\xae\x03'\
-b'\xae\x03\xba\x03\xba\x03\xc6\x03\xc6\x03\xd2\x03\xd2\x03\xde\x03'\
-b'\xde\x03\xea\x03\xea\x03\xf6\x03\xf6\x03\x02\x04\x02\x04\x0e\x04'\
-b'\x0e\x04\x1a\x04\x1a\x04\x26\x04\x26\x04\x32\x04\x32\x04\x3e\x04'\
-b'\x3e\x04\x54\x04\x54\x04\x60\x04\x60\x04\x6c\x04\x6c\x04\x78\x04'\
-b'\x78\x04\x84\x04\x84\x04\x90\x04\x90\x04\x9c\x04\x9c\x04\xa8\x04'\
+b'\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x02\x00\x80\x80'\
+b'\x80\x80\x80\x80\x00\x80\x00\x00\x04\x00\xa0\xa0\xa0\x00\x00\x00'\
+b'\x00\x00\x00\x00\x06\x00\x28\x28\xf8\x50\x50\xf8\xa0\xa0\x00\x00'\
+b'\x06\x00\x70\xa8\xa0\x70\x28\x28\xa8\x70\x20\x00\x0a\x00\x62\x00'\
+b'\x94\x00\x94\x00\x68\x00\x0b\x00\x14\x80\x14\x80\x23\x00\x00\x00'\
+b'\x00\x00\x07\x00\x30\x48\x48\x30\x50\x8c\x88\x74\x00\x00\x02\x00'\
+b'\x80\x80\x80\x00\x00\x00\x00\x00\x00\x00\x04\x00\x20\x40\x80\x80'\
+b'\x80\x80\x80\x80\x40\x20\x04\x00\x80\x40\x20\x20\x20\x20\x20\x20'\
+b'\x40\x80\x04\x00\x40\xe0\x40\xa0\x00\x00\x00\x00\x00\x00\x06\x00'\
+b'\x00\x00\x20\x20\xf8\x20\x20\x00\x00\x00\x03\x00\x00\x00\x00\x00'\
+b'\x00\x00\x00\x80\x80\x80\x04\x00\x00\x00\x00\x00\x00\xe0\x00\x00'\
+b'\x00\x00\x03\x00\x00\x00\x00\x00\x00\x00\x00\x80\x00\x00\x03\x00'\
+b'\x20\x20\x40\x40\x40\x40\x80\x80\x00\x00\x06\x00\x70\x88\x88\x88'\
+b'\x88\x88\x88\x70\x00\x00\x06\x00\x20\x60\xa0\x20\x20\x20\x20\x20'\
+b'\x00\x00\x06\x00\x70\x88\x08\x08\x10\x20\x40\xf8\x00\x00\x06\x00'\
+b'\x70\x88\x08\x30\x08\x08\x88\x70\x00\x00\x06\x00\x10\x30\x50\x50'\
+b'\x90\xf8\x10\x10\x00\x00\x06\x00\x78\x40\x80\xf0\x08\x08\x88\x70'\
+b'\x00\x00\x06\x00\x70\x88\x80\xf0\x88\x88\x88\x70\x00\x00\x06\x00'\
+b'\xf8\x10\x10\x20\x20\x40\x40\x40\x00\x00\x06\x00\x70\x88\x88\x70'\
+b'\x88\x88\x88\x70\x00\x00\x06\x00\x70\x88\x88\x88\x78\x08\x88\x70'\
+b'\x00\x00\x03\x00\x00\x00\x80\x00\x00\x00\x00\x80\x00\x00\x03\x00'\
+b'\x00\x00\x80\x00\x00\x00\x00\x80\x80\x80\x06\x00\x00\x00\x08\x70'\
+b'\x80\x70\x08\x00\x00\x00\x06\x00\x00\x00\x00\xf8\x00\xf8\x00\x00'\
+b'\x00\x00\x06\x00\x00\x00\x80\x70\x08\x70\x80\x00\x00\x00\x0b\x00'\
+b'\x1f\x00\x60\x80\x4d\x40\x93\x40\xa2\x40\xa2\x40\xa6\x80\x9b\x00'\
+b'\x40\x40\x3f\x80\x08\x00\x10\x28\x28\x28\x44\x7c\x82\x82\x00\x00'\
+b'\x07\x00\xf8\x84\x84\xfc\x84\x84\x84\xf8\x00\x00\x07\x00\x38\x44'\
+b'\x80\x80\x80\x80\x44\x38\x00\x00\x07\x00\xf0\x88\x84\x84\x84\x84'\
+b'\x88\xf0\x00\x00\x06\x00\xf8\x80\x80\xf8\x80\x80\x80\xf8\x00\x00'\
+b'\x06\x00\xf8\x80\x80\xf0\x80\x80\x80\x80\x00\x00\x08\x00\x38\x44'\
+b'\x82\x80\x8e\x82\x44\x38\x00\x00\x07\x00\x84\x84\x84\xfc\x84\x84'\
+b'\x84\x84\x00\x00\x02\x00\x80\x80\x80\x80\x80\x80\x80\x80\x00\x00'\
+b'\x05\x00\x10\x10\x10\x10\x10\x90\x90\x60\x00\x00\x07\x00\x84\x88'\
+b'\x90\xb0\xd0\x88\x88\x84\x00\x00\x06\x00\x80\x80\x80\x80\x80\x80'\
+b'\x80\xf8\x00\x00\x08\x00\x82\xc6\xc6\xaa\xaa\xaa\x92\x92\x00\x00'\
+b'\x07\x00\x84\xc4\xa4\xa4\x94\x94\x8c\x84\x00\x00\x08\x00\x38\x44'\
+b'\x82\x82\x82\x82\x44\x38\x00\x00\x06\x00\xf0\x88\x88\x88\xf0\x80'\
+b'\x80\x80\x00\x00\x08\x00\x38\x44\x82\x82\x82\x9a\x44\x3e\x00\x00'\
+b'\x07\x00\xf8\x84\x84\xf8\x90\x88\x88\x84\x00\x00\x07\x00\x78\x84'\
+b'\x80\x60\x18\x04\x84\x78\x00\x00\x06\x00\xf8\x20\x20\x20\x20\x20'\
+b'\x20\x20\x00\x00\x07\x00\x84\x84\x84\x84\x84\x84\x84\x78\x00\x00'\
+b'\x08\x00\x82\x82\x44\x44\x28\x28\x10\x10\x00\x00\x0b\x00\x84\x20'\
+b'\x8a\x20\x4a\x40\x4a\x40\x51\x40\x51\x40\x20\x80\x20\x80\x00\x00'\
+b'\x00\x00\x07\x00\x84\x48\x48\x30\x30\x48\x48\x84\x00\x00\x08\x00'\
+b'\x82\x44\x44\x28\x10\x10\x10\x10\x00\x00\x07\x00\x7c\x08\x10\x10'\
+b'\x20\x20\x40\xfc\x00\x00\x03\x00\xc0\x80\x80\x80\x80\x80\x80\x80'\
+b'\x80\xc0\x03\x00\x80\x80\x40\x40\x40\x40\x20\x20\x00\x00\x03\x00'\
+b'\xc0\x40\x40\x40\x40\x40\x40\x40\x40\xc0\x05\x00\x20\x50\x50\x88'\
+b'\x00\x00\x00\x00\x00\x00\x06\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+b'\xfc\x00\x04\x00\x80\x40\x00\x00\x00\x00\x00\x00\x00\x00\x06\x00'\
+b'\x00\x00\x70\x88\x78\x88\x98\xe8\x00\x00\x06\x00\x80\x80\xb0\xc8'\
+b'\x88\x88\xc8\xb0\x00\x00\x06\x00\x00\x00\x70\x88\x80\x80\x88\x70'\
+b'\x00\x00\x06\x00\x08\x08\x68\x98\x88\x88\x98\x68\x00\x00\x06\x00'\
+b'\x00\x00\x70\x88\xf8\x80\x88\x70\x00\x00\x04\x00\x20\x40\xe0\x40'\
+b'\x40\x40\x40\x40\x00\x00\x06\x00\x00\x00\x68\x98\x88\x88\x98\x68'\
+b'\x08\xf0\x06\x00\x80\x80\xb0\xc8\x88\x88\x88\x88\x00\x00\x02\x00'\
+b'\x80\x00\x80\x80\x80\x80\x80\x80\x00\x00\x02\x00\x40\x00\x40\x40'\
+b'\x40\x40\x40\x40\x40\x80\x05\x00\x80\x80\x90\xa0\xc0\xe0\xa0\x90'\
+b'\x00\x00\x02\x00\x80\x80\x80\x80\x80\x80\x80\x80\x00\x00\x08\x00'\
+b'\x00\x00\xbc\xd2\x92\x92\x92\x92\x00\x00\x06\x00\x00\x00\xf0\x88'\
+b'\x88\x88\x88\x88\x00\x00\x06\x00\x00\x00\x70\x88\x88\x88\x88\x70'\
+b'\x00\x00\x06\x00\x00\x00\xb0\xc8\x88\x88\xc8\xb0\x80\x80\x06\x00'\
+b'\x00\x00\x68\x98\x88\x88\x98\x68\x08\x08\x04\x00\x00\x00\xa0\xc0'\
+b'\x80\x80\x80\x80\x00\x00\x06\x00\x00\x00\x70\x88\x60\x10\x88\x70'\
+b'\x00\x00\x03\x00\x40\x40\xe0\x40\x40\x40\x40\x60\x00\x00\x06\x00'\
+b'\x00\x00\x88\x88\x88\x88\x98\x68\x00\x00\x06\x00\x00\x00\x88\x88'\
+b'\x50\x50\x20\x20\x00\x00\x0a\x00\x00\x00\x00\x00\x88\x80\x94\x80'\
+b'\x55\x00\x55\x00\x22\x00\x22\x00\x00\x00\x00\x00\x06\x00\x00\x00'\
+b'\x88\x50\x20\x20\x50\x88\x00\x00\x06\x00\x00\x00\x88\x88\x50\x50'\
+b'\x20\x20\x20\x40\x06\x00\x00\x00\xf8\x10\x20\x20\x40\xf8\x00\x00'\
+b'\x04\x00\x20\x40\x40\x40\x80\x40\x40\x40\x40\x20\x02\x00\x80\x80'\
+b'\x80\x80\x80\x80\x80\x80\x80\x80\x04\x00\x80\x40\x40\x40\x20\x40'\
+b'\x40\x40\x40\x80\x06\x00\x00\x00\x00\xe8\xb0\x00\x00\x00\x00\x00'\
+b'\x06\x00\x70\x88\x08\x10\x20\x20\x00\x20\x00\x00'
 
-_mvfont = memoryview(_font)
+_codes =\
+b'\x20\x00\x21\x00\x22\x00\x23\x00\x24\x00\x25\x00\x26\x00\x27\x00'\
+b'\x28\x00\x29\x00\x2a\x00\x2b\x00\x2c\x00\x2d\x00\x2e\x00\x2f\x00'\
+b'\x30\x00\x31\x00\x32\x00\x33\x00\x34\x00\x35\x00\x36\x00\x37\x00'\
+b'\x38\x00\x39\x00\x3a\x00\x3b\x00\x3c\x00\x3d\x00\x3e\x00\x40\x00'\
+b'\x41\x00\x42\x00\x43\x00\x44\x00\x45\x00\x46\x00\x47\x00\x48\x00'\
+b'\x49\x00\x4a\x00\x4b\x00\x4c\x00\x4d\x00\x4e\x00\x4f\x00\x50\x00'\
+b'\x51\x00\x52\x00\x53\x00\x54\x00\x55\x00\x56\x00\x57\x00\x58\x00'\
+b'\x59\x00\x5a\x00\x5b\x00\x5c\x00\x5d\x00\x5e\x00\x5f\x00\x60\x00'\
+b'\x61\x00\x62\x00\x63\x00\x64\x00\x65\x00\x66\x00\x67\x00\x68\x00'\
+b'\x69\x00\x6a\x00\x6b\x00\x6c\x00\x6d\x00\x6e\x00\x6f\x00\x70\x00'\
+b'\x71\x00\x72\x00\x73\x00\x74\x00\x75\x00\x76\x00\x77\x00\x78\x00'\
+b'\x79\x00\x7a\x00\x7b\x00\x7c\x00\x7d\x00\x7e\x00'
 
-def get_ch(ch):
-    ordch = ord(ch)
-    ordch = ordch + 1 if ordch >= 32 and ordch <= 126 else 32
-    idx_offs = 4 * (ordch - 32)
-    offset = int.from_bytes(_index[idx_offs : idx_offs + 2], 'little')
-    next_offs = int.from_bytes(_index[idx_offs + 2 : idx_offs + 4], 'little')
-    width = int.from_bytes(_font[offset:offset + 2], 'little')
-    return _mvfont[offset + 2:next_offs], 10, width
- 
+get_ch = index.build(_font, 10, 32, _codes)
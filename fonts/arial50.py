@@ -1,6 +1,9 @@
 # Code generated by font_to_py.py.
 # Font: Arial.ttf Char set: -0123456789
 # Cmd: font_to_py.py Arial.ttf 50 arial_50.py -x -c 0123456789-
+# Glyph layout: see fonts/index.py (tools/fontpy.py).
+from fonts import index
+
 version = '0.33'
 
 def height():
@@ -25,57 +28,40 @@ def min_ch():
     return 45
 
 def max_ch():
-    return 63
+    return 57
 
 _font =\
-b'\x25\x00\x00\x03\xfe\x00\x00\x00\x1f\xff\xc0\x00\x00\x7f\xff\xf0'\
-b'\x00\x00\xff\xff\xf8\x00\x01\xff\xff\xfc\x00\x03\xff\xff\xfe\x00'\
-b'\x07\xfe\x03\xff\x00\x07\xf8\x00\xff\x80\x0f\xf0\x00\x7f\x80\x0f'\
-b'\xe0\x00\x3f\x80\x0f\xc0\x00\x1f\xc0\x1f\xc0\x00\x1f\xc0\x1f\xc0'\
-b'\x00\x0f\xc0\x1f\x80\x00\x0f\xc0\x03\x80\x00\x0f\xc0\x00\x00\x00'\
-b'\x0f\xc0\x00\x00\x00\x0f\xc0\x00\x00\x00\x1f\x80\x00\x00\x00\x3f'\
-b'\x80\x00\x00\x00\x7f\x00\x00\x00\x00\xff\x00\x00\x00\x01\xfe\x00'\
-b'\x00\x00\x03\xfc\x00\x00\x00\x07\xf8\x00\x00\x00\x0f\xf0\x00\x00'\
-b'\x00\x1f\xe0\x00\x00\x00\x3f\xc0\x00\x00\x00\x7f\x80\x00\x00\x00'\
-b'\x7f\x00\x00\x00\x00\xfe\x00\x00\x00\x00\xfc\x00\x00\x00\x01\xfc'\
-b'\x00\x00\x00\x01\xfc\x00\x00\x00\x01\xf8\x00\x00\x00\x01\xf8\x00'\
-b'\x00\x00\x01\xf8\x00\x00\x00\x01\xf8\x00\x00\x00\x01\xf8\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\xf8\x00\x00\x00\x01'\
-b'\xf8\x00\x00\x00\x01\xf8\x00\x00\x00\x01\xf8\x00\x00\x00\x01\xf8'\
-b'\x00\x00\x00\x01\xf8\x00\x00\x00\x00\x00\x00\x00\x16\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+b'\x16\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
 b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
 b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
 b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
 b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x3f\xff\xf0\x3f\xff\xf0\x3f\xff\xf0\x3f\xff'\
-b'\xf0\x3f\xff\xf0\x3f\xff\xf0\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x3f\xff\xf0\x3f\xff\xf0\x3f'\
+b'\xff\xf0\x3f\xff\xf0\x3f\xff\xf0\x3f\xff\xf0\x00\x00\x00\x00\x00'\
 b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
 b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x25\x00\x00\x00\x00\x00\x00\x00\x03\xfe\x00\x00'\
-b'\x00\x0f\xff\x80\x00\x00\x3f\xff\xe0\x00\x00\x7f\xff\xf0\x00\x00'\
-b'\xff\xff\xf8\x00\x01\xff\xff\xfc\x00\x03\xfe\x07\xfc\x00\x03\xfc'\
-b'\x01\xfe\x00\x07\xf0\x00\xfe\x00\x07\xf0\x00\x7f\x00\x07\xe0\x00'\
-b'\x3f\x00\x0f\xe0\x00\x3f\x00\x0f\xc0\x00\x1f\x80\x0f\xc0\x00\x1f'\
-b'\x80\x0f\xc0\x00\x1f\x80\x0f\xc0\x00\x1f\x80\x1f\xc0\x00\x0f\xc0'\
-b'\x1f\x80\x00\x0f\xc0\x1f\x80\x00\x0f\xc0\x1f\x80\x00\x0f\xc0\x1f'\
-b'\x80\x00\x0f\xc0\x1f\x80\x00\x0f\xc0\x1f\x80\x00\x0f\xc0\x1f\x80'\
+b'\x00\x00\x00\x00\x00\x00\x00\x00\x25\x00\x00\x00\x00\x00\x00\x00'\
+b'\x03\xfe\x00\x00\x00\x0f\xff\x80\x00\x00\x3f\xff\xe0\x00\x00\x7f'\
+b'\xff\xf0\x00\x00\xff\xff\xf8\x00\x01\xff\xff\xfc\x00\x03\xfe\x07'\
+b'\xfc\x00\x03\xfc\x01\xfe\x00\x07\xf0\x00\xfe\x00\x07\xf0\x00\x7f'\
+b'\x00\x07\xe0\x00\x3f\x00\x0f\xe0\x00\x3f\x00\x0f\xc0\x00\x1f\x80'\
+b'\x0f\xc0\x00\x1f\x80\x0f\xc0\x00\x1f\x80\x0f\xc0\x00\x1f\x80\x1f'\
+b'\xc0\x00\x0f\xc0\x1f\x80\x00\x0f\xc0\x1f\x80\x00\x0f\xc0\x1f\x80'\
 b'\x00\x0f\xc0\x1f\x80\x00\x0f\xc0\x1f\x80\x00\x0f\xc0\x1f\x80\x00'\
 b'\x0f\xc0\x1f\x80\x00\x0f\xc0\x1f\x80\x00\x0f\xc0\x1f\x80\x00\x0f'\
 b'\xc0\x1f\x80\x00\x0f\xc0\x1f\x80\x00\x0f\xc0\x1f\x80\x00\x0f\xc0'\
-b'\x0f\xc0\x00\x1f\x80\x0f\xc0\x00\x1f\x80\x0f\xc0\x00\x1f\x80\x0f'\
-b'\xc0\x00\x1f\x80\x0f\xe0\x00\x3f\x80\x07\xe0\x00\x3f\x00\x07\xf0'\
-b'\x00\x7f\x00\x07\xf8\x00\xff\x00\x03\xfc\x01\xfe\x00\x03\xff\x07'\
-b'\xfe\x00\x01\xff\xff\xfc\x00\x00\xff\xff\xf8\x00\x00\x7f\xff\xf0'\
-b'\x00\x00\x3f\xff\xe0\x00\x00\x0f\xff\x80\x00\x00\x03\xfe\x00\x00'\
-b'\x25\x00\x00\x00\x00\x00\x00\x00\x00\x07\x80\x00\x00\x00\x0f\x80'\
-b'\x00\x00\x00\x0f\x80\x00\x00\x00\x1f\x80\x00\x00\x00\x3f\x80\x00'\
-b'\x00\x00\x7f\x80\x00\x00\x00\xff\x80\x00\x00\x03\xff\x80\x00\x00'\
-b'\x07\xff\x80\x00\x00\x0f\xff\x80\x00\x00\x3f\xff\x80\x00\x00\xff'\
-b'\xdf\x80\x00\x01\xff\x9f\x80\x00\x01\xfe\x1f\x80\x00\x01\xfc\x1f'\
-b'\x80\x00\x01\xf0\x1f\x80\x00\x01\xc0\x1f\x80\x00\x00\x00\x1f\x80'\
-b'\x00\x00\x00\x1f\x80\x00\x00\x00\x1f\x80\x00\x00\x00\x1f\x80\x00'\
+b'\x1f\x80\x00\x0f\xc0\x1f\x80\x00\x0f\xc0\x1f\x80\x00\x0f\xc0\x1f'\
+b'\x80\x00\x0f\xc0\x0f\xc0\x00\x1f\x80\x0f\xc0\x00\x1f\x80\x0f\xc0'\
+b'\x00\x1f\x80\x0f\xc0\x00\x1f\x80\x0f\xe0\x00\x3f\x80\x07\xe0\x00'\
+b'\x3f\x00\x07\xf0\x00\x7f\x00\x07\xf8\x00\xff\x00\x03\xfc\x01\xfe'\
+b'\x00\x03\xff\x07\xfe\x00\x01\xff\xff\xfc\x00\x00\xff\xff\xf8\x00'\
+b'\x00\x7f\xff\xf0\x00\x00\x3f\xff\xe0\x00\x00\x0f\xff\x80\x00\x00'\
+b'\x03\xfe\x00\x00\x25\x00\x00\x00\x00\x00\x00\x00\x00\x07\x80\x00'\
+b'\x00\x00\x0f\x80\x00\x00\x00\x0f\x80\x00\x00\x00\x1f\x80\x00\x00'\
+b'\x00\x3f\x80\x00\x00\x00\x7f\x80\x00\x00\x00\xff\x80\x00\x00\x03'\
+b'\xff\x80\x00\x00\x07\xff\x80\x00\x00\x0f\xff\x80\x00\x00\x3f\xff'\
+b'\x80\x00\x00\xff\xdf\x80\x00\x01\xff\x9f\x80\x00\x01\xfe\x1f\x80'\
+b'\x00\x01\xfc\x1f\x80\x00\x01\xf0\x1f\x80\x00\x01\xc0\x1f\x80\x00'\
 b'\x00\x00\x1f\x80\x00\x00\x00\x1f\x80\x00\x00\x00\x1f\x80\x00\x00'\
 b'\x00\x1f\x80\x00\x00\x00\x1f\x80\x00\x00\x00\x1f\x80\x00\x00\x00'\
 b'\x1f\x80\x00\x00\x00\x1f\x80\x00\x00\x00\x1f\x80\x00\x00\x00\x1f'\
@@ -84,149 +70,153 @@ b'\x00\x00\x00\x1f\x80\x00\x00\x00\x1f\x80\x00\x00\x00\x1f\x80\x00'\
 b'\x00\x00\x1f\x80\x00\x00\x00\x1f\x80\x00\x00\x00\x1f\x80\x00\x00'\
 b'\x00\x1f\x80\x00\x00\x00\x1f\x80\x00\x00\x00\x1f\x80\x00\x00\x00'\
 b'\x1f\x80\x00\x00\x00\x1f\x80\x00\x00\x00\x1f\x80\x00\x00\x00\x1f'\
-b'\x80\x00\x00\x00\x1f\x80\x00\x00\x00\x00\x00\x00\x25\x00\x00\x00'\
-b'\x00\x00\x00\x00\x03\xfe\x00\x00\x00\x1f\xff\xc0\x00\x00\x7f\xff'\
-b'\xe0\x00\x01\xff\xff\xf8\x00\x03\xff\xff\xfc\x00\x03\xff\xff\xfc'\
-b'\x00\x07\xfe\x07\xfe\x00\x0f\xf0\x00\xff\x00\x0f\xe0\x00\x7f\x00'\
-b'\x0f\xc0\x00\x3f\x00\x1f\xc0\x00\x3f\x80\x1f\x80\x00\x1f\x80\x1f'\
-b'\x80\x00\x1f\x80\x03\x80\x00\x1f\x80\x00\x00\x00\x1f\x80\x00\x00'\
-b'\x00\x1f\x80\x00\x00\x00\x1f\x80\x00\x00\x00\x3f\x00\x00\x00\x00'\
-b'\x3f\x00\x00\x00\x00\x7f\x00\x00\x00\x00\xfe\x00\x00\x00\x01\xfe'\
-b'\x00\x00\x00\x03\xfc\x00\x00\x00\x07\xf8\x00\x00\x00\x0f\xf0\x00'\
-b'\x00\x00\x1f\xf0\x00\x00\x00\x3f\xe0\x00\x00\x00\x7f\xc0\x00\x00'\
-b'\x00\xff\x80\x00\x00\x01\xfe\x00\x00\x00\x03\xfc\x00\x00\x00\x07'\
-b'\xf8\x00\x00\x00\x1f\xf0\x00\x00\x00\x3f\xe0\x00\x00\x00\x7f\xc0'\
-b'\x00\x00\x00\xff\x80\x00\x00\x01\xfe\x00\x00\x00\x03\xfc\x00\x00'\
-b'\x00\x07\xf8\x00\x00\x00\x07\xf0\x00\x00\x00\x0f\xe0\x00\x00\x00'\
-b'\x0f\xe0\x00\x00\x00\x1f\xff\xff\xff\x80\x1f\xff\xff\xff\x80\x3f'\
-b'\xff\xff\xff\x80\x3f\xff\xff\xff\x80\x3f\xff\xff\xff\x80\x3f\xff'\
-b'\xff\xff\x80\x00\x00\x00\x00\x00\x25\x00\x00\x00\x00\x00\x00\x00'\
-b'\x07\xfc\x00\x00\x00\x1f\xff\x80\x00\x00\x7f\xff\xe0\x00\x00\xff'\
-b'\xff\xf0\x00\x01\xff\xff\xf8\x00\x03\xff\xff\xfc\x00\x07\xfe\x07'\
-b'\xfe\x00\x0f\xf0\x01\xfe\x00\x0f\xe0\x00\xfe\x00\x0f\xc0\x00\x7f'\
-b'\x00\x1f\xc0\x00\x3f\x00\x1f\x80\x00\x3f\x00\x03\x80\x00\x3f\x00'\
-b'\x00\x00\x00\x3f\x00\x00\x00\x00\x3f\x00\x00\x00\x00\x7e\x00\x00'\
-b'\x00\x00\xfe\x00\x00\x00\x01\xfc\x00\x00\x00\x0f\xf8\x00\x00\x01'\
-b'\xff\xf0\x00\x00\x01\xff\xe0\x00\x00\x01\xff\xe0\x00\x00\x01\xff'\
-b'\xf8\x00\x00\x01\xff\xfc\x00\x00\x01\x8f\xfe\x00\x00\x00\x01\xff'\
-b'\x00\x00\x00\x00\x7f\x00\x00\x00\x00\x3f\x80\x00\x00\x00\x1f\x80'\
-b'\x00\x00\x00\x1f\xc0\x00\x00\x00\x0f\xc0\x00\x00\x00\x0f\xc0\x00'\
-b'\x00\x00\x0f\xc0\x00\x00\x00\x0f\xc0\x00\x00\x00\x0f\xc0\x03\x80'\
-b'\x00\x0f\xc0\x1f\x80\x00\x0f\xc0\x1f\xc0\x00\x1f\x80\x1f\xc0\x00'\
-b'\x1f\x80\x0f\xe0\x00\x3f\x80\x0f\xf0\x00\x7f\x00\x07\xf8\x00\xff'\
-b'\x00\x07\xfe\x03\xfe\x00\x03\xff\xff\xfc\x00\x01\xff\xff\xf8\x00'\
-b'\x00\xff\xff\xf0\x00\x00\x7f\xff\xe0\x00\x00\x1f\xff\x80\x00\x00'\
-b'\x03\xfc\x00\x00\x25\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x01\xf0\x00\x00\x00\x03\xf0\x00\x00\x00\x07\xf0\x00\x00'\
-b'\x00\x0f\xf0\x00\x00\x00\x0f\xf0\x00\x00\x00\x1f\xf0\x00\x00\x00'\
-b'\x3f\xf0\x00\x00\x00\x7f\xf0\x00\x00\x00\x7f\xf0\x00\x00\x00\xff'\
-b'\xf0\x00\x00\x01\xff\xf0\x00\x00\x01\xff\xf0\x00\x00\x03\xfb\xf0'\
-b'\x00\x00\x07\xf3\xf0\x00\x00\x0f\xf3\xf0\x00\x00\x0f\xe3\xf0\x00'\
-b'\x00\x1f\xc3\xf0\x00\x00\x3f\x83\xf0\x00\x00\x7f\x83\xf0\x00\x00'\
-b'\x7f\x03\xf0\x00\x00\xfe\x03\xf0\x00\x01\xfc\x03\xf0\x00\x03\xfc'\
-b'\x03\xf0\x00\x03\xf8\x03\xf0\x00\x07\xf0\x03\xf0\x00\x0f\xf0\x03'\
-b'\xf0\x00\x0f\xe0\x03\xf0\x00\x1f\xc0\x03\xf0\x00\x3f\x80\x03\xf0'\
-b'\x00\x7f\x80\x03\xf0\x00\x7f\xff\xff\xff\xc0\x7f\xff\xff\xff\xc0'\
-b'\x7f\xff\xff\xff\xc0\x7f\xff\xff\xff\xc0\x7f\xff\xff\xff\xc0\x7f'\
-b'\xff\xff\xff\xc0\x00\x00\x03\xf0\x00\x00\x00\x03\xf0\x00\x00\x00'\
-b'\x03\xf0\x00\x00\x00\x03\xf0\x00\x00\x00\x03\xf0\x00\x00\x00\x03'\
+b'\x80\x00\x00\x00\x1f\x80\x00\x00\x00\x1f\x80\x00\x00\x00\x1f\x80'\
+b'\x00\x00\x00\x1f\x80\x00\x00\x00\x1f\x80\x00\x00\x00\x00\x00\x00'\
+b'\x25\x00\x00\x00\x00\x00\x00\x00\x03\xfe\x00\x00\x00\x1f\xff\xc0'\
+b'\x00\x00\x7f\xff\xe0\x00\x01\xff\xff\xf8\x00\x03\xff\xff\xfc\x00'\
+b'\x03\xff\xff\xfc\x00\x07\xfe\x07\xfe\x00\x0f\xf0\x00\xff\x00\x0f'\
+b'\xe0\x00\x7f\x00\x0f\xc0\x00\x3f\x00\x1f\xc0\x00\x3f\x80\x1f\x80'\
+b'\x00\x1f\x80\x1f\x80\x00\x1f\x80\x03\x80\x00\x1f\x80\x00\x00\x00'\
+b'\x1f\x80\x00\x00\x00\x1f\x80\x00\x00\x00\x1f\x80\x00\x00\x00\x3f'\
+b'\x00\x00\x00\x00\x3f\x00\x00\x00\x00\x7f\x00\x00\x00\x00\xfe\x00'\
+b'\x00\x00\x01\xfe\x00\x00\x00\x03\xfc\x00\x00\x00\x07\xf8\x00\x00'\
+b'\x00\x0f\xf0\x00\x00\x00\x1f\xf0\x00\x00\x00\x3f\xe0\x00\x00\x00'\
+b'\x7f\xc0\x00\x00\x00\xff\x80\x00\x00\x01\xfe\x00\x00\x00\x03\xfc'\
+b'\x00\x00\x00\x07\xf8\x00\x00\x00\x1f\xf0\x00\x00\x00\x3f\xe0\x00'\
+b'\x00\x00\x7f\xc0\x00\x00\x00\xff\x80\x00\x00\x01\xfe\x00\x00\x00'\
+b'\x03\xfc\x00\x00\x00\x07\xf8\x00\x00\x00\x07\xf0\x00\x00\x00\x0f'\
+b'\xe0\x00\x00\x00\x0f\xe0\x00\x00\x00\x1f\xff\xff\xff\x80\x1f\xff'\
+b'\xff\xff\x80\x3f\xff\xff\xff\x80\x3f\xff\xff\xff\x80\x3f\xff\xff'\
+b'\xff\x80\x3f\xff\xff\xff\x80\x00\x00\x00\x00\x00\x25\x00\x00\x00'\
+b'\x00\x00\x00\x00\x07\xfc\x00\x00\x00\x1f\xff\x80\x00\x00\x7f\xff'\
+b'\xe0\x00\x00\xff\xff\xf0\x00\x01\xff\xff\xf8\x00\x03\xff\xff\xfc'\
+b'\x00\x07\xfe\x07\xfe\x00\x0f\xf0\x01\xfe\x00\x0f\xe0\x00\xfe\x00'\
+b'\x0f\xc0\x00\x7f\x00\x1f\xc0\x00\x3f\x00\x1f\x80\x00\x3f\x00\x03'\
+b'\x80\x00\x3f\x00\x00\x00\x00\x3f\x00\x00\x00\x00\x3f\x00\x00\x00'\
+b'\x00\x7e\x00\x00\x00\x00\xfe\x00\x00\x00\x01\xfc\x00\x00\x00\x0f'\
+b'\xf8\x00\x00\x01\xff\xf0\x00\x00\x01\xff\xe0\x00\x00\x01\xff\xe0'\
+b'\x00\x00\x01\xff\xf8\x00\x00\x01\xff\xfc\x00\x00\x01\x8f\xfe\x00'\
+b'\x00\x00\x01\xff\x00\x00\x00\x00\x7f\x00\x00\x00\x00\x3f\x80\x00'\
+b'\x00\x00\x1f\x80\x00\x00\x00\x1f\xc0\x00\x00\x00\x0f\xc0\x00\x00'\
+b'\x00\x0f\xc0\x00\x00\x00\x0f\xc0\x00\x00\x00\x0f\xc0\x00\x00\x00'\
+b'\x0f\xc0\x03\x80\x00\x0f\xc0\x1f\x80\x00\x0f\xc0\x1f\xc0\x00\x1f'\
+b'\x80\x1f\xc0\x00\x1f\x80\x0f\xe0\x00\x3f\x80\x0f\xf0\x00\x7f\x00'\
+b'\x07\xf8\x00\xff\x00\x07\xfe\x03\xfe\x00\x03\xff\xff\xfc\x00\x01'\
+b'\xff\xff\xf8\x00\x00\xff\xff\xf0\x00\x00\x7f\xff\xe0\x00\x00\x1f'\
+b'\xff\x80\x00\x00\x03\xfc\x00\x00\x25\x00\x00\x00\x00\x00\x00\x00'\
+b'\x00\x00\x00\x00\x00\x00\x01\xf0\x00\x00\x00\x03\xf0\x00\x00\x00'\
+b'\x07\xf0\x00\x00\x00\x0f\xf0\x00\x00\x00\x0f\xf0\x00\x00\x00\x1f'\
+b'\xf0\x00\x00\x00\x3f\xf0\x00\x00\x00\x7f\xf0\x00\x00\x00\x7f\xf0'\
+b'\x00\x00\x00\xff\xf0\x00\x00\x01\xff\xf0\x00\x00\x01\xff\xf0\x00'\
+b'\x00\x03\xfb\xf0\x00\x00\x07\xf3\xf0\x00\x00\x0f\xf3\xf0\x00\x00'\
+b'\x0f\xe3\xf0\x00\x00\x1f\xc3\xf0\x00\x00\x3f\x83\xf0\x00\x00\x7f'\
+b'\x83\xf0\x00\x00\x7f\x03\xf0\x00\x00\xfe\x03\xf0\x00\x01\xfc\x03'\
+b'\xf0\x00\x03\xfc\x03\xf0\x00\x03\xf8\x03\xf0\x00\x07\xf0\x03\xf0'\
+b'\x00\x0f\xf0\x03\xf0\x00\x0f\xe0\x03\xf0\x00\x1f\xc0\x03\xf0\x00'\
+b'\x3f\x80\x03\xf0\x00\x7f\x80\x03\xf0\x00\x7f\xff\xff\xff\xc0\x7f'\
+b'\xff\xff\xff\xc0\x7f\xff\xff\xff\xc0\x7f\xff\xff\xff\xc0\x7f\xff'\
+b'\xff\xff\xc0\x7f\xff\xff\xff\xc0\x00\x00\x03\xf0\x00\x00\x00\x03'\
 b'\xf0\x00\x00\x00\x03\xf0\x00\x00\x00\x03\xf0\x00\x00\x00\x03\xf0'\
-b'\x00\x00\x00\x03\xf0\x00\x00\x00\x03\xf0\x00\x00\x00\x00\x00\x00'\
-b'\x25\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7f\xff\xff'\
-b'\x00\x00\x7f\xff\xff\x00\x00\xff\xff\xff\x00\x00\xff\xff\xff\x00'\
-b'\x00\xff\xff\xff\x00\x00\xff\xff\xff\x00\x00\xfc\x00\x00\x00\x01'\
-b'\xfc\x00\x00\x00\x01\xf8\x00\x00\x00\x01\xf8\x00\x00\x00\x01\xf8'\
-b'\x00\x00\x00\x01\xf8\x00\x00\x00\x03\xf8\x00\x00\x00\x03\xf0\x00'\
-b'\x00\x00\x03\xf0\x00\x00\x00\x03\xf0\x7f\x00\x00\x03\xf3\xff\xc0'\
-b'\x00\x07\xf7\xff\xf0\x00\x07\xff\xff\xf8\x00\x07\xff\xff\xfc\x00'\
-b'\x07\xff\xff\xfe\x00\x07\xfe\x03\xff\x00\x0f\xf8\x00\xff\x00\x0f'\
-b'\xf0\x00\x7f\x80\x0f\xe0\x00\x3f\x80\x01\xc0\x00\x1f\x80\x00\x00'\
-b'\x00\x1f\xc0\x00\x00\x00\x0f\xc0\x00\x00\x00\x0f\xc0\x00\x00\x00'\
-b'\x0f\xc0\x00\x00\x00\x0f\xc0\x00\x00\x00\x0f\xc0\x00\x00\x00\x0f'\
-b'\xc0\x00\x00\x00\x0f\xc0\x00\x00\x00\x0f\xc0\x1f\x80\x00\x1f\x80'\
-b'\x1f\x80\x00\x1f\x80\x1f\xc0\x00\x1f\x80\x0f\xc0\x00\x3f\x00\x0f'\
-b'\xe0\x00\x7f\x00\x07\xf0\x00\xfe\x00\x07\xfc\x03\xfe\x00\x03\xff'\
-b'\xff\xfc\x00\x01\xff\xff\xf8\x00\x00\xff\xff\xf0\x00\x00\x7f\xff'\
-b'\xe0\x00\x00\x1f\xff\x80\x00\x00\x07\xfc\x00\x00\x25\x00\x00\x00'\
-b'\x00\x00\x00\x00\x01\xfe\x00\x00\x00\x0f\xff\xc0\x00\x00\x3f\xff'\
-b'\xf0\x00\x00\x7f\xff\xf8\x00\x00\xff\xff\xfc\x00\x01\xff\xff\xfe'\
-b'\x00\x03\xff\x03\xfe\x00\x03\xf8\x00\xff\x00\x07\xf0\x00\x7f\x00'\
-b'\x07\xf0\x00\x3f\x00\x0f\xe0\x00\x3f\x80\x0f\xc0\x00\x1f\x80\x0f'\
-b'\xc0\x00\x00\x00\x1f\x80\x00\x00\x00\x1f\x80\x00\x00\x00\x1f\x80'\
-b'\x00\x00\x00\x1f\x80\x00\x00\x00\x1f\x00\xff\x00\x00\x3f\x07\xff'\
-b'\xc0\x00\x3f\x0f\xff\xf0\x00\x3f\x3f\xff\xf8\x00\x3f\x7f\xff\xfc'\
-b'\x00\x3f\x7f\xff\xfe\x00\x3f\xfe\x03\xff\x00\x3f\xf0\x00\xff\x00'\
-b'\x3f\xe0\x00\x7f\x80\x3f\xc0\x00\x3f\x80\x3f\x80\x00\x1f\x80\x3f'\
-b'\x80\x00\x1f\xc0\x3f\x00\x00\x0f\xc0\x3f\x00\x00\x0f\xc0\x3f\x00'\
-b'\x00\x0f\xc0\x3f\x00\x00\x0f\xc0\x1f\x00\x00\x0f\xc0\x1f\x00\x00'\
-b'\x0f\xc0\x1f\x00\x00\x0f\xc0\x1f\x80\x00\x1f\xc0\x1f\x80\x00\x1f'\
-b'\x80\x0f\xc0\x00\x1f\x80\x0f\xc0\x00\x3f\x80\x07\xe0\x00\x7f\x00'\
-b'\x07\xf8\x00\xff\x00\x03\xfe\x03\xfe\x00\x01\xff\xff\xfc\x00\x01'\
-b'\xff\xff\xfc\x00\x00\x7f\xff\xf8\x00\x00\x3f\xff\xe0\x00\x00\x0f'\
-b'\xff\xc0\x00\x00\x03\xfe\x00\x00\x25\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x1f\xff\xff\xff\xc0\x1f\xff\xff\xff\xc0\x1f\xff'\
-b'\xff\xff\xc0\x1f\xff\xff\xff\xc0\x1f\xff\xff\xff\xc0\x1f\xff\xff'\
-b'\xff\x80\x00\x00\x00\x0f\x80\x00\x00\x00\x1f\x00\x00\x00\x00\x3e'\
-b'\x00\x00\x00\x00\x7c\x00\x00\x00\x00\xfc\x00\x00\x00\x01\xf8\x00'\
-b'\x00\x00\x01\xf0\x00\x00\x00\x03\xf0\x00\x00\x00\x07\xe0\x00\x00'\
-b'\x00\x07\xc0\x00\x00\x00\x0f\xc0\x00\x00\x00\x1f\x80\x00\x00\x00'\
-b'\x1f\x80\x00\x00\x00\x3f\x00\x00\x00\x00\x3f\x00\x00\x00\x00\x7e'\
-b'\x00\x00\x00\x00\x7e\x00\x00\x00\x00\xfc\x00\x00\x00\x00\xfc\x00'\
-b'\x00\x00\x01\xf8\x00\x00\x00\x01\xf8\x00\x00\x00\x03\xf0\x00\x00'\
-b'\x00\x03\xf0\x00\x00\x00\x03\xf0\x00\x00\x00\x07\xe0\x00\x00\x00'\
-b'\x07\xe0\x00\x00\x00\x07\xe0\x00\x00\x00\x0f\xc0\x00\x00\x00\x0f'\
-b'\xc0\x00\x00\x00\x0f\xc0\x00\x00\x00\x0f\xc0\x00\x00\x00\x1f\x80'\
-b'\x00\x00\x00\x1f\x80\x00\x00\x00\x1f\x80\x00\x00\x00\x1f\x80\x00'\
-b'\x00\x00\x1f\x80\x00\x00\x00\x3f\x00\x00\x00\x00\x3f\x00\x00\x00'\
-b'\x00\x3f\x00\x00\x00\x00\x3f\x00\x00\x00\x00\x3f\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x25\x00\x00\x00\x00\x00\x00\x00\x03\xfe\x00\x00'\
-b'\x00\x1f\xff\x80\x00\x00\x3f\xff\xe0\x00\x00\x7f\xff\xf0\x00\x00'\
-b'\xff\xff\xf8\x00\x01\xff\xff\xfc\x00\x03\xfe\x03\xfe\x00\x03\xf8'\
-b'\x00\xfe\x00\x03\xf0\x00\x7e\x00\x07\xf0\x00\x7f\x00\x07\xe0\x00'\
-b'\x3f\x00\x07\xe0\x00\x3f\x00\x07\xe0\x00\x3f\x00\x07\xe0\x00\x3f'\
-b'\x00\x07\xe0\x00\x3f\x00\x07\xf0\x00\x7f\x00\x03\xf0\x00\x7e\x00'\
-b'\x03\xf8\x00\xfe\x00\x01\xfe\x03\xfc\x00\x00\xff\xff\xf8\x00\x00'\
-b'\x7f\xff\xf0\x00\x00\x1f\xff\xc0\x00\x00\x3f\xff\xe0\x00\x00\xff'\
-b'\xff\xf8\x00\x01\xff\xff\xfc\x00\x03\xfe\x03\xfe\x00\x07\xf8\x00'\
-b'\xff\x00\x07\xe0\x00\x7f\x00\x0f\xe0\x00\x3f\x80\x0f\xc0\x00\x1f'\
-b'\x80\x1f\xc0\x00\x1f\xc0\x1f\x80\x00\x0f\xc0\x1f\x80\x00\x0f\xc0'\
+b'\x00\x00\x00\x03\xf0\x00\x00\x00\x03\xf0\x00\x00\x00\x03\xf0\x00'\
+b'\x00\x00\x03\xf0\x00\x00\x00\x03\xf0\x00\x00\x00\x03\xf0\x00\x00'\
+b'\x00\x00\x00\x00\x25\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+b'\x00\x7f\xff\xff\x00\x00\x7f\xff\xff\x00\x00\xff\xff\xff\x00\x00'\
+b'\xff\xff\xff\x00\x00\xff\xff\xff\x00\x00\xff\xff\xff\x00\x00\xfc'\
+b'\x00\x00\x00\x01\xfc\x00\x00\x00\x01\xf8\x00\x00\x00\x01\xf8\x00'\
+b'\x00\x00\x01\xf8\x00\x00\x00\x01\xf8\x00\x00\x00\x03\xf8\x00\x00'\
+b'\x00\x03\xf0\x00\x00\x00\x03\xf0\x00\x00\x00\x03\xf0\x7f\x00\x00'\
+b'\x03\xf3\xff\xc0\x00\x07\xf7\xff\xf0\x00\x07\xff\xff\xf8\x00\x07'\
+b'\xff\xff\xfc\x00\x07\xff\xff\xfe\x00\x07\xfe\x03\xff\x00\x0f\xf8'\
+b'\x00\xff\x00\x0f\xf0\x00\x7f\x80\x0f\xe0\x00\x3f\x80\x01\xc0\x00'\
+b'\x1f\x80\x00\x00\x00\x1f\xc0\x00\x00\x00\x0f\xc0\x00\x00\x00\x0f'\
+b'\xc0\x00\x00\x00\x0f\xc0\x00\x00\x00\x0f\xc0\x00\x00\x00\x0f\xc0'\
+b'\x00\x00\x00\x0f\xc0\x00\x00\x00\x0f\xc0\x00\x00\x00\x0f\xc0\x1f'\
+b'\x80\x00\x1f\x80\x1f\x80\x00\x1f\x80\x1f\xc0\x00\x1f\x80\x0f\xc0'\
+b'\x00\x3f\x00\x0f\xe0\x00\x7f\x00\x07\xf0\x00\xfe\x00\x07\xfc\x03'\
+b'\xfe\x00\x03\xff\xff\xfc\x00\x01\xff\xff\xf8\x00\x00\xff\xff\xf0'\
+b'\x00\x00\x7f\xff\xe0\x00\x00\x1f\xff\x80\x00\x00\x07\xfc\x00\x00'\
+b'\x25\x00\x00\x00\x00\x00\x00\x00\x01\xfe\x00\x00\x00\x0f\xff\xc0'\
+b'\x00\x00\x3f\xff\xf0\x00\x00\x7f\xff\xf8\x00\x00\xff\xff\xfc\x00'\
+b'\x01\xff\xff\xfe\x00\x03\xff\x03\xfe\x00\x03\xf8\x00\xff\x00\x07'\
+b'\xf0\x00\x7f\x00\x07\xf0\x00\x3f\x00\x0f\xe0\x00\x3f\x80\x0f\xc0'\
+b'\x00\x1f\x80\x0f\xc0\x00\x00\x00\x1f\x80\x00\x00\x00\x1f\x80\x00'\
+b'\x00\x00\x1f\x80\x00\x00\x00\x1f\x80\x00\x00\x00\x1f\x00\xff\x00'\
+b'\x00\x3f\x07\xff\xc0\x00\x3f\x0f\xff\xf0\x00\x3f\x3f\xff\xf8\x00'\
+b'\x3f\x7f\xff\xfc\x00\x3f\x7f\xff\xfe\x00\x3f\xfe\x03\xff\x00\x3f'\
+b'\xf0\x00\xff\x00\x3f\xe0\x00\x7f\x80\x3f\xc0\x00\x3f\x80\x3f\x80'\
+b'\x00\x1f\x80\x3f\x80\x00\x1f\xc0\x3f\x00\x00\x0f\xc0\x3f\x00\x00'\
+b'\x0f\xc0\x3f\x00\x00\x0f\xc0\x3f\x00\x00\x0f\xc0\x1f\x00\x00\x0f'\
+b'\xc0\x1f\x00\x00\x0f\xc0\x1f\x00\x00\x0f\xc0\x1f\x80\x00\x1f\xc0'\
+b'\x1f\x80\x00\x1f\x80\x0f\xc0\x00\x1f\x80\x0f\xc0\x00\x3f\x80\x07'\
+b'\xe0\x00\x7f\x00\x07\xf8\x00\xff\x00\x03\xfe\x03\xfe\x00\x01\xff'\
+b'\xff\xfc\x00\x01\xff\xff\xfc\x00\x00\x7f\xff\xf8\x00\x00\x3f\xff'\
+b'\xe0\x00\x00\x0f\xff\xc0\x00\x00\x03\xfe\x00\x00\x25\x00\x00\x00'\
+b'\x00\x00\x00\x00\x00\x00\x00\x00\x1f\xff\xff\xff\xc0\x1f\xff\xff'\
+b'\xff\xc0\x1f\xff\xff\xff\xc0\x1f\xff\xff\xff\xc0\x1f\xff\xff\xff'\
+b'\xc0\x1f\xff\xff\xff\x80\x00\x00\x00\x0f\x80\x00\x00\x00\x1f\x00'\
+b'\x00\x00\x00\x3e\x00\x00\x00\x00\x7c\x00\x00\x00\x00\xfc\x00\x00'\
+b'\x00\x01\xf8\x00\x00\x00\x01\xf0\x00\x00\x00\x03\xf0\x00\x00\x00'\
+b'\x07\xe0\x00\x00\x00\x07\xc0\x00\x00\x00\x0f\xc0\x00\x00\x00\x1f'\
+b'\x80\x00\x00\x00\x1f\x80\x00\x00\x00\x3f\x00\x00\x00\x00\x3f\x00'\
+b'\x00\x00\x00\x7e\x00\x00\x00\x00\x7e\x00\x00\x00\x00\xfc\x00\x00'\
+b'\x00\x00\xfc\x00\x00\x00\x01\xf8\x00\x00\x00\x01\xf8\x00\x00\x00'\
+b'\x03\xf0\x00\x00\x00\x03\xf0\x00\x00\x00\x03\xf0\x00\x00\x00\x07'\
+b'\xe0\x00\x00\x00\x07\xe0\x00\x00\x00\x07\xe0\x00\x00\x00\x0f\xc0'\
+b'\x00\x00\x00\x0f\xc0\x00\x00\x00\x0f\xc0\x00\x00\x00\x0f\xc0\x00'\
+b'\x00\x00\x1f\x80\x00\x00\x00\x1f\x80\x00\x00\x00\x1f\x80\x00\x00'\
+b'\x00\x1f\x80\x00\x00\x00\x1f\x80\x00\x00\x00\x3f\x00\x00\x00\x00'\
+b'\x3f\x00\x00\x00\x00\x3f\x00\x00\x00\x00\x3f\x00\x00\x00\x00\x3f'\
+b'\x00\x00\x00\x00\x00\x00\x00\x00\x25\x00\x00\x00\x00\x00\x00\x00'\
+b'\x03\xfe\x00\x00\x00\x1f\xff\x80\x00\x00\x3f\xff\xe0\x00\x00\x7f'\
+b'\xff\xf0\x00\x00\xff\xff\xf8\x00\x01\xff\xff\xfc\x00\x03\xfe\x03'\
+b'\xfe\x00\x03\xf8\x00\xfe\x00\x03\xf0\x00\x7e\x00\x07\xf0\x00\x7f'\
+b'\x00\x07\xe0\x00\x3f\x00\x07\xe0\x00\x3f\x00\x07\xe0\x00\x3f\x00'\
+b'\x07\xe0\x00\x3f\x00\x07\xe0\x00\x3f\x00\x07\xf0\x00\x7f\x00\x03'\
+b'\xf0\x00\x7e\x00\x03\xf8\x00\xfe\x00\x01\xfe\x03\xfc\x00\x00\xff'\
+b'\xff\xf8\x00\x00\x7f\xff\xf0\x00\x00\x1f\xff\xc0\x00\x00\x3f\xff'\
+b'\xe0\x00\x00\xff\xff\xf8\x00\x01\xff\xff\xfc\x00\x03\xfe\x03\xfe'\
+b'\x00\x07\xf8\x00\xff\x00\x07\xe0\x00\x7f\x00\x0f\xe0\x00\x3f\x80'\
+b'\x0f\xc0\x00\x1f\x80\x1f\xc0\x00\x1f\xc0\x1f\x80\x00\x0f\xc0\x1f'\
+b'\x80\x00\x0f\xc0\x1f\x80\x00\x0f\xc0\x1f\x80\x00\x0f\xc0\x1f\x80'\
+b'\x00\x0f\xc0\x1f\x80\x00\x0f\xc0\x1f\xc0\x00\x1f\xc0\x0f\xc0\x00'\
+b'\x1f\x80\x0f\xc0\x00\x3f\x80\x0f\xe0\x00\x3f\x80\x07\xf8\x00\xff'\
+b'\x00\x07\xfe\x03\xff\x00\x03\xff\xff\xfe\x00\x01\xff\xff\xfc\x00'\
+b'\x00\xff\xff\xf8\x00\x00\x7f\xff\xf0\x00\x00\x1f\xff\xc0\x00\x00'\
+b'\x03\xfe\x00\x00\x25\x00\x00\x00\x00\x00\x00\x00\x03\xfc\x00\x00'\
+b'\x00\x1f\xff\x00\x00\x00\x7f\xff\xc0\x00\x00\xff\xff\xf0\x00\x01'\
+b'\xff\xff\xf8\x00\x03\xff\xff\xfc\x00\x03\xfe\x03\xfc\x00\x07\xf8'\
+b'\x00\xfe\x00\x0f\xf0\x00\x7e\x00\x0f\xe0\x00\x3f\x00\x0f\xe0\x00'\
+b'\x1f\x00\x1f\xc0\x00\x1f\x80\x1f\xc0\x00\x0f\x80\x1f\x80\x00\x0f'\
+b'\x80\x1f\x80\x00\x0f\x80\x1f\x80\x00\x0f\xc0\x1f\x80\x00\x0f\xc0'\
 b'\x1f\x80\x00\x0f\xc0\x1f\x80\x00\x0f\xc0\x1f\x80\x00\x0f\xc0\x1f'\
-b'\x80\x00\x0f\xc0\x1f\xc0\x00\x1f\xc0\x0f\xc0\x00\x1f\x80\x0f\xc0'\
-b'\x00\x3f\x80\x0f\xe0\x00\x3f\x80\x07\xf8\x00\xff\x00\x07\xfe\x03'\
-b'\xff\x00\x03\xff\xff\xfe\x00\x01\xff\xff\xfc\x00\x00\xff\xff\xf8'\
-b'\x00\x00\x7f\xff\xf0\x00\x00\x1f\xff\xc0\x00\x00\x03\xfe\x00\x00'\
-b'\x25\x00\x00\x00\x00\x00\x00\x00\x03\xfc\x00\x00\x00\x1f\xff\x00'\
-b'\x00\x00\x7f\xff\xc0\x00\x00\xff\xff\xf0\x00\x01\xff\xff\xf8\x00'\
-b'\x03\xff\xff\xfc\x00\x03\xfe\x03\xfc\x00\x07\xf8\x00\xfe\x00\x0f'\
-b'\xf0\x00\x7e\x00\x0f\xe0\x00\x3f\x00\x0f\xe0\x00\x1f\x00\x1f\xc0'\
-b'\x00\x1f\x80\x1f\xc0\x00\x0f\x80\x1f\x80\x00\x0f\x80\x1f\x80\x00'\
-b'\x0f\x80\x1f\x80\x00\x0f\xc0\x1f\x80\x00\x0f\xc0\x1f\x80\x00\x0f'\
-b'\xc0\x1f\x80\x00\x0f\xc0\x1f\x80\x00\x0f\xc0\x1f\xc0\x00\x1f\xc0'\
-b'\x0f\xc0\x00\x1f\xc0\x0f\xe0\x00\x3f\xc0\x0f\xf0\x00\x7f\xc0\x07'\
-b'\xf8\x00\xff\xc0\x07\xfe\x03\xff\xc0\x03\xff\xff\xff\xc0\x01\xff'\
-b'\xff\xef\xc0\x00\xff\xff\xcf\xc0\x00\x7f\xff\x0f\xc0\x00\x1f\xfe'\
-b'\x0f\xc0\x00\x07\xf0\x0f\xc0\x00\x00\x00\x1f\x80\x00\x00\x00\x1f'\
-b'\x80\x00\x00\x00\x1f\x80\x00\x00\x00\x1f\x80\x00\x00\x00\x3f\x80'\
-b'\x0f\xc0\x00\x3f\x00\x0f\xc0\x00\x3f\x00\x0f\xe0\x00\x7e\x00\x07'\
-b'\xe0\x00\xfe\x00\x07\xf0\x01\xfc\x00\x03\xfc\x07\xfc\x00\x03\xff'\
-b'\xff\xf8\x00\x01\xff\xff\xf0\x00\x00\xff\xff\xe0\x00\x00\x7f\xff'\
-b'\xc0\x00\x00\x3f\xff\x00\x00\x00\x07\xf8\x00\x00'
-
-_index =\
-b'\x00\x00\xfc\x00\x00\x00\x00\x00\x94\x01\x90\x02\x8c\x03\x88\x04'\
-b'\x84\x05\x80\x06\x7c\x07\x78\x08\x74\x09\x70\x0a\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x6c\x0b'
-
-_mvfont = memoryview(_font)
-_mvi = memoryview(_index)
-ifb = lambda l : l[0] | (l[1] << 8)
+b'\xc0\x00\x1f\xc0\x0f\xc0\x00\x1f\xc0\x0f\xe0\x00\x3f\xc0\x0f\xf0'\
+b'\x00\x7f\xc0\x07\xf8\x00\xff\xc0\x07\xfe\x03\xff\xc0\x03\xff\xff'\
+b'\xff\xc0\x01\xff\xff\xef\xc0\x00\xff\xff\xcf\xc0\x00\x7f\xff\x0f'\
+b'\xc0\x00\x1f\xfe\x0f\xc0\x00\x07\xf0\x0f\xc0\x00\x00\x00\x1f\x80'\
+b'\x00\x00\x00\x1f\x80\x00\x00\x00\x1f\x80\x00\x00\x00\x1f\x80\x00'\
+b'\x00\x00\x3f\x80\x0f\xc0\x00\x3f\x00\x0f\xc0\x00\x3f\x00\x0f\xe0'\
+b'\x00\x7e\x00\x07\xe0\x00\xfe\x00\x07\xf0\x01\xfc\x00\x03\xfc\x07'\
+b'\xfc\x00\x03\xff\xff\xf8\x00\x01\xff\xff\xf0\x00\x00\xff\xff\xe0'\
+b'\x00\x00\x7f\xff\xc0\x00\x00\x3f\xff\x00\x00\x00\x07\xf8\x00\x00'\
+b'\x25\x00\x00\x03\xfe\x00\x00\x00\x1f\xff\xc0\x00\x00\x7f\xff\xf0'\
+b'\x00\x00\xff\xff\xf8\x00\x01\xff\xff\xfc\x00\x03\xff\xff\xfe\x00'\
+b'\x07\xfe\x03\xff\x00\x07\xf8\x00\xff\x80\x0f\xf0\x00\x7f\x80\x0f'\
+b'\xe0\x00\x3f\x80\x0f\xc0\x00\x1f\xc0\x1f\xc0\x00\x1f\xc0\x1f\xc0'\
+b'\x00\x0f\xc0\x1f\x80\x00\x0f\xc0\x03\x80\x00\x0f\xc0\x00\x00\x00'\
+b'\x0f\xc0\x00\x00\x00\x0f\xc0\x00\x00\x00\x1f\x80\x00\x00\x00\x3f'\
+b'\x80\x00\x00\x00\x7f\x00\x00\x00\x00\xff\x00\x00\x00\x01\xfe\x00'\
+b'\x00\x00\x03\xfc\x00\x00\x00\x07\xf8\x00\x00\x00\x0f\xf0\x00\x00'\
+b'\x00\x1f\xe0\x00\x00\x00\x3f\xc0\x00\x00\x00\x7f\x80\x00\x00\x00'\
+b'\x7f\x00\x00\x00\x00\xfe\x00\x00\x00\x00\xfc\x00\x00\x00\x01\xfc'\
+b'\x00\x00\x00\x01\xfc\x00\x00\x00\x01\xf8\x00\x00\x00\x01\xf8\x00'\
+b'\x00\x00\x01\xf8\x00\x00\x00\x01\xf8\x00\x00\x00\x01\xf8\x00\x00'\
+b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\xf8\x00\x00\x00\x01'\
+b'\xf8\x00\x00\x00\x01\xf8\x00\x00\x00\x01\xf8\x00\x00\x00\x01\xf8'\
+b'\x00\x00\x00\x01\xf8\x00\x00\x00\x00\x00\x00\x00'
 
-def get_ch(ch):
-    oc = ord(ch)
-    ioff = 2 * (oc - 45 + 1) if oc >= 45 and oc <= 63 else 0
-    doff = ifb(_mvi[ioff : ])
-    width = ifb(_mvfont[doff : ])
+_codes =\
+b'\x2d\x00\x30\x00\x31\x00\x32\x00\x33\x00\x34\x00\x35\x00\x36\x00'\
+b'\x37\x00\x38\x00\x39\x00'
 
-    next_offs = doff + 2 + ((width - 1)//8 + 1) * 50
-    return _mvfont[doff + 2:next_offs], 50, width
- 
+get_ch = index.build(_font, 50, 45, _codes)
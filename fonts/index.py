@@ -0,0 +1,44 @@
+# Glyph lookup shared by the font modules in fonts/.
+#
+# A module's _font holds its glyphs back to back, each a uint16 width (little
+# endian) then the bitmap, with the default glyph last. The glyphs are for
+# min_ch()..max_ch() in order or, in a font that is a subset, for the uint16
+# character codes in _codes. build() slices every glyph once at import, so
+# get_ch() is one table lookup returning a ready (memoryview, height, width).
+
+
+def glyphs(font, height):
+    """Every glyph in font, in order, as (memoryview, height, width)."""
+    mv = memoryview(font)
+    table = []
+    o = 0
+    while o < len(font):
+        width = font[o] | font[o + 1] << 8
+        end = o + 2 + ((width + 7) >> 3) * height
+        table.append((mv[o + 2:end], height, width))
+        o = end
+    return table
+
+
+def build(font, height, min_ch, codes=None):
+    """get_ch() for a font: dense if codes is None, else sparse."""
+    table = glyphs(font, height)
+    default = table.pop()
+
+    if codes is None:
+        table = tuple(table)
+        n = len(table)
+
+        def get_ch(ch):
+            i = ord(ch) - min_ch
+            return table[i] if 0 <= i < n else default
+
+        return get_ch
+
+    get = {chr(codes[2 * i] | codes[2 * i + 1] << 8): glyph
+           for i, glyph in enumerate(table)}.get
+
+    def get_ch(ch):
+        return get(ch, default)
+
+    return get_ch
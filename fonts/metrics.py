@@ -0,0 +1,73 @@
+# Per-font metric tables for measuring text without decoding glyphs.
+#
+# For each character from min_ch() to max_ch(), plus one trailing slot for
+# the font's default glyph, `widths` holds the advance width and `blanks`
+# the number of blank columns on the right (width less Writer._truelen).
+# A font module can ship the two array('B') tables itself as `widths` and
+# `blanks`; otherwise they are built from get_ch() the first time the font
+# is measured.
+from array import array
+import accel
+
+_cache = {}  # font module: Metrics
+
+
+def of(font):
+    m = _cache.get(font)
+    if m is None:
+        m = _cache[font] = Metrics(font)
+    return m
+
+
+class Metrics:
+    def __init__(self, font):
+        self.lo = font.min_ch()
+        self.n = font.max_ch() - self.lo + 1  # Index of the default glyph
+        self.widths = getattr(font, "widths", None)
+        self.blanks = getattr(font, "blanks", None)
+        if self.widths is None or self.blanks is None:
+            if font.reverse() or getattr(font, "inverted", lambda: False)():
+                raise ValueError("Transformed font without metric tables")
+            self._build(font.get_ch)
+
+    def _build(self, get_ch):
+        self.widths = array("B", bytes(self.n + 1))
+        self.blanks = array("B", bytes(self.n + 1))
+        for i in range(self.n + 1):
+            # Past max_ch() get_ch() returns the default glyph.
+            glyph, ht, wd = get_ch(chr(self.lo + i))
+            self.widths[i] = wd
+            self.blanks[i] = wd - accel.truelen(glyph, ht, wd)
+
+    def index(self, char):
+        i = ord(char) - self.lo
+        return i if 0 <= i < self.n else self.n
+
+    def width(self, char):
+        return self.widths[self.index(char)]
+
+    def truelen(self, char):
+        i = self.index(char)
+        return self.widths[i] - self.blanks[i]
+
+    # Same results as accel.stringlen: width of string in pixels or, with oh,
+    # whether it overhangs wd when started at column sc.
+    def stringlen(self, string, sc=0, wd=0, oh=False):
+        if not len(string):
+            return 0
+        widths = self.widths
+        lo = self.lo
+        n = self.n
+        l = 0
+        for char in string[:-1]:
+            i = ord(char) - lo
+            l += widths[i if 0 <= i < n else n]
+            if oh and l + sc > wd:
+                return True  # All done. Save time.
+        i = self.index(string[-1])
+        w = widths[i]
+        if oh and l + sc + w > wd:
+            l += w - self.blanks[i]  # Last char might have blank cols on RHS
+        else:
+            l += w
+        return l + sc > wd if oh else l
@@ -0,0 +1,184 @@
+# Fonts kept in binary files on flash and read a glyph at a time, so only
+# the index (and an optional few hot glyphs) is held in RAM. Written by
+# tools/fontbin.py from font_to_py modules.
+#
+# File layout, little endian:
+#   header  "PWFN", version, flags, height, max_width, baseline,
+#           min_ch, max_ch, count (see HEADER)
+#   codes   only with FLAG_SPARSE: count - 1 ascending uint16 character
+#           codes, for fonts that are a subset of min_ch..max_ch
+#   metrics only with FLAG_METRICS: the uint8 widths then blanks tables
+#           described in fonts/metrics.py
+#   index   count + 1 uint32 file offsets; entry i is character min_ch + i
+#           (or codes[i]), entry count - 1 is the default glyph and the last
+#           entry is the end of the glyph data
+#   glyphs  uint16 width, then the bitmap as font_to_py lays it out. In
+#           fonts with FLAG_PACKED, a width with bit 15 set is followed by
+#           the bitmap's rows, each XORed with the row above, as PackBits
+#           (see accel.unpack). FLAG_REVERSE and FLAG_INVERTED fonts hold
+#           glyphs ready for the display: leftmost pixel in bit 0
+#           (MONO_HMSB) and/or 0 for ink.
+from array import array
+from collections import OrderedDict
+import struct
+import utime
+import accel
+
+MAGIC = b"PWFN"
+VERSION = 1
+HEADER = "<4sBBHHHHHH"  # 18 bytes
+FLAG_HMAP = 0x01
+FLAG_REVERSE = 0x02
+FLAG_SPARSE = 0x04
+FLAG_PACKED = 0x08
+FLAG_INVERTED = 0x10
+FLAG_METRICS = 0x20
+PACKED = 0x8000  # In a glyph's width
+
+try:
+    _DIR = __file__.rsplit("/", 1)[0]
+except NameError:  # Frozen
+    _DIR = "fonts"
+
+
+class FontFile:
+    def __init__(self, path, cache=0):
+        self.path = path
+        self._f = open(path, "rb")
+        hdr = self._f.read(struct.calcsize(HEADER))
+        (magic, version, self._flags, self._height, self._max_width,
+         self._baseline, self._min_ch, self._max_ch, count) = struct.unpack(HEADER, hdr)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not a font file: " + path)
+
+        self._count = count
+        # Glyph slot for each code from min_ch; sparse fonts map the codes
+        # they lack to the default glyph.
+        self._slots = None
+        if self._flags & FLAG_SPARSE:
+            codes = array("H", bytes(2 * (count - 1)))
+            self._f.readinto(codes)
+            span = self._max_ch - self._min_ch + 1
+            self._slots = array("B" if count <= 256 else "H", bytes(span))
+            for i in range(span):
+                self._slots[i] = count - 1
+            for i, code in enumerate(codes):
+                self._slots[code - self._min_ch] = i
+
+        if self._flags & FLAG_METRICS:
+            span = self._max_ch - self._min_ch + 2
+            self.widths = array("B", bytes(span))
+            self.blanks = array("B", bytes(span))
+            self._f.readinto(self.widths)
+            self._f.readinto(self.blanks)
+
+        self._index = array("I", bytes(4 * (count + 1)))
+        self._f.readinto(self._index)
+        size = 0
+        for i in range(count):
+            size = max(size, self._index[i + 1] - self._index[i])
+        self._buf = bytearray(size)
+        self._mv = memoryview(self._buf)
+
+        # Packed glyphs are decoded into a second buffer.
+        self._glyph = None
+        if self._flags & FLAG_PACKED:
+            self._glyph = bytearray(((self._max_width + 7) >> 3) * self._height)
+            self._glyph_mv = memoryview(self._glyph)
+        self.decodes = 0
+        self.decode_us = 0
+
+        self._cache_size = cache
+        self._cache = OrderedDict()  # char: (bytes, width)
+
+    def close(self):
+        self._f.close()
+
+    def height(self):
+        return self._height
+
+    def baseline(self):
+        return self._baseline
+
+    def max_width(self):
+        return self._max_width
+
+    def hmap(self):
+        return bool(self._flags & FLAG_HMAP)
+
+    def reverse(self):
+        return bool(self._flags & FLAG_REVERSE)
+
+    def inverted(self):
+        return bool(self._flags & FLAG_INVERTED)
+
+    def monospaced(self):
+        return False
+
+    def min_ch(self):
+        return self._min_ch
+
+    def max_ch(self):
+        return self._max_ch
+
+    # As font_to_py's get_ch. Unless the character is in the hot-glyph cache
+    # the bitmap is only valid until the next call.
+    def get_ch(self, ch):
+        hot = self._cache.pop(ch, None) if self._cache_size else None
+        if hot is not None:
+            self._cache[ch] = hot
+            return hot[0], self._height, hot[1]
+
+        i = ord(ch) - self._min_ch
+        if self._slots is not None:
+            i = self._slots[i] if 0 <= i < len(self._slots) else self._count - 1
+        elif not 0 <= i < self._count - 1:
+            i = self._count - 1
+        start = self._index[i]
+        n = self._index[i + 1] - start
+        self._f.seek(start)
+        self._f.readinto(self._mv[:n])
+        width = self._buf[0] | self._buf[1] << 8
+        if width & PACKED:
+            width &= ~PACKED
+            t = utime.ticks_us()
+            size = accel.unpack(self._glyph, self._mv, 2, n, (width + 7) >> 3)
+            self.decode_us += utime.ticks_diff(utime.ticks_us(), t)
+            self.decodes += 1
+            glyph = self._glyph_mv[:size]
+        else:
+            glyph = self._mv[2:n]
+
+        if self._cache_size:
+            if len(self._cache) >= self._cache_size:
+                self._cache.pop(next(iter(self._cache)))
+            glyph = bytes(glyph)
+            self._cache[ch] = (glyph, width)
+        return glyph, self._height, width
+
+    def stats(self):
+        """Glyph bytes on flash against unpacked, and time spent decoding."""
+        stored = self._index[self._count] - self._index[0]
+        unpacked = 0
+        width = bytearray(2)
+        for i in range(self._count):
+            self._f.seek(self._index[i])
+            self._f.readinto(width)
+            w = (width[0] | width[1] << 8) & ~PACKED
+            unpacked += 2 + ((w + 7) >> 3) * self._height
+        return {
+            "stored": stored,
+            "unpacked": unpacked,
+            "decodes": self.decodes,
+            "decode_us": self.decode_us,
+        }
+
+
+# Font `name` from fonts/<name>.fnt if there is one, else the fonts.<name>
+# module.
+def load(name, cache=0):
+    try:
+        return FontFile(_DIR + "/" + name + ".fnt", cache)
+    except OSError:
+        pass
+    return getattr(__import__("fonts." + name), name)
@@ -0,0 +1,215 @@
+# CPython stand-in for MicroPython's `framebuf`, limited to the monochrome
+# horizontal formats used by eink.py and writer.py.
+#
+# With NumPy installed, drawing works on whole bit planes (unpacked rows of
+# 0/1 values) so a full layout renders in milliseconds; without it a
+# per-pixel fallback is used. Both write the same bytes into the caller's
+# buffer.
+#
+# text() uses a copy of MicroPython's built-in 8x8 font (font_petme128_8x8):
+# eight column bytes per character, least significant bit at the top, for
+# chr(32) to chr(127). Anything else is drawn as chr(127), as on the device.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+MONO_VLSB = 0
+MONO_HLSB = 3
+MONO_HMSB = 4
+
+_CELL = 8
+
+_FONT = bytes.fromhex(
+    '00000000000000000000004f4f0000000007070000070700147f7f14147f7f14'
+    '00242e6b6b3a1200006333180c66630000327f4d4d7772500000000406030100'
+    '00001c3e63410000000041633e1c0000082a3e1c1c3e2a080008083e3e080800'
+    '000080e0600000000008080808080800000000606000000000406030180c0602'
+    '003e7f49457f3e000040447f7f40400000627351494f460000226349497f3600'
+    '00181814167f7f1000276745457d3900003e7f49497b3200000303797d070300'
+    '00367f49497f360000266f49497f3e000000002424000000000080e464000000'
+    '00081c3663414100001414141414140000414163361c080000020351590f0600'
+    '003e7f414d4f2e00007c7e0b0b7e7c00007f7f49497f3600003e7f4141632200'
+    '007f7f41633e1c00007f7f4949414100007f7f0909010100003e7f41497b3a00'
+    '007f7f08087f7f000000417f7f410000002060417f3f0100007f7f1c36634100'
+    '007f7f4040404000007f7f060c067f7f007f7f0e1c7f7f00003e7f41417f3e00'
+    '007f7f09090f0600001e3f21617f5e00007f7f19396f460000266f49497b3200'
+    '0001017f7f010100003f7f40407f3f00001f3f60603f1f00007f7f3018307f7f'
+    '0063771c1c77630000070f78780f0700006171594d47430000007f7f41410000'
+    '0002060c18306040000041417f7f000000080c06060c0800c0c0c0c0c0c0c0c0'
+    '000001030604000000207454547c7800007f7f44447c380000387c44446c2800'
+    '00387c44447f7f0000387c54545c580000087e7f090302000098bca4a4fc7c00'
+    '007f7f04047c78000000007d7d0000000040c08080fd7d00007f7f30386c4400'
+    '0000417f7f400000007c7c1830187c7c007c7c04047c780000387c44447c3800'
+    '00fcfc24243c180000183c2424fcfc00007c7c04040c080000485c5454742000'
+    '04043f7f44642000003c7c40407c3c00001c3c60603c1c00001c7c3018307c1c'
+    '00446c38386c4400009cbca0a0fc7c00004464745c4c44000008083e77414100'
+    '000000ffff000000004141773e0808000002030103020301aa55aa55aa55aa55'
+)
+
+
+class _FrameBuffer:
+    def __init__(self, buffer, width, height, format, stride=None):
+        if format not in (MONO_HLSB, MONO_HMSB):
+            raise ValueError('unsupported format')
+
+        self.buffer = buffer
+        self.width = width
+        self.height = height
+        self.format = format
+        self.stride = (stride or width) + 7 & ~7
+
+    def _locate(self, x, y):
+        i = (y * self.stride + x) >> 3
+        if self.format == MONO_HLSB:
+            return i, 0x80 >> (x & 7)
+        return i, 1 << (x & 7)
+
+    def _clip(self, x, y, w, h):
+        return max(x, 0), max(y, 0), min(x + w, self.width), min(y + h, self.height)
+
+    def pixel(self, x, y, c=None):
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return None
+
+        i, mask = self._locate(x, y)
+        if c is None:
+            return 1 if self.buffer[i] & mask else 0
+
+        if c & 1:
+            self.buffer[i] |= mask
+        else:
+            self.buffer[i] &= ~mask & 0xFF
+
+    def fill(self, c):
+        self.fill_rect(0, 0, self.width, self.height, c)
+
+    def hline(self, x, y, w, c):
+        self.fill_rect(x, y, w, 1, c)
+
+    def vline(self, x, y, h, c):
+        self.fill_rect(x, y, 1, h, c)
+
+    def rect(self, x, y, w, h, c, f=False):
+        if f:
+            self.fill_rect(x, y, w, h, c)
+            return
+        self.fill_rect(x, y, w, 1, c)
+        self.fill_rect(x, y + h - 1, w, 1, c)
+        self.fill_rect(x, y, 1, h, c)
+        self.fill_rect(x + w - 1, y, 1, h, c)
+
+    def text(self, s, x, y, c=1):
+        for ch in s:
+            code = ord(ch)
+            if not 32 <= code <= 127:
+                code = 127
+            o = (code - 32) * _CELL
+            for col in range(_CELL):
+                bits = _FONT[o + col]
+                for row in range(_CELL):
+                    if bits >> row & 1:
+                        self.pixel(x + col, y + row, c)
+            x += _CELL
+
+
+class _PyFrameBuffer(_FrameBuffer):
+    def fill_rect(self, x, y, w, h, c):
+        x0, y0, x1, y1 = self._clip(x, y, w, h)
+        for yy in range(y0, y1):
+            for xx in range(x0, x1):
+                self.pixel(xx, yy, c)
+
+    def blit(self, fbuf, x, y, key=-1, palette=None):
+        for sy in range(fbuf.height):
+            dy = y + sy
+            if not 0 <= dy < self.height:
+                continue
+            for sx in range(fbuf.width):
+                dx = x + sx
+                if not 0 <= dx < self.width:
+                    continue
+                c = fbuf.pixel(sx, sy)
+                if c == key:
+                    continue
+                if palette is not None:
+                    c = palette.pixel(c, 0)
+                self.pixel(dx, dy, c)
+
+    def scroll(self, xstep, ystep):
+        copy = _PyFrameBuffer(bytearray(self.buffer), self.width, self.height,
+                              self.format, self.stride)
+        for y in range(self.height):
+            for x in range(self.width):
+                sx = x - xstep
+                sy = y - ystep
+                if 0 <= sx < self.width and 0 <= sy < self.height:
+                    self.pixel(x, y, copy.pixel(sx, sy))
+
+
+class _NpFrameBuffer(_FrameBuffer):
+    def __init__(self, buffer, width, height, format, stride=None):
+        super().__init__(buffer, width, height, format, stride)
+        self._order = 'big' if format == MONO_HLSB else 'little'
+        row = self.stride >> 3
+        self._rows = np.frombuffer(buffer, dtype=np.uint8, count=row * height)
+        self._rows = self._rows.reshape(height, row)
+
+    # Rows y0..y1 as a (rows, stride) array of 0/1. Bits past the width are
+    # carried through unchanged, as the device never touches them.
+    def _bits(self, y0, y1):
+        return np.unpackbits(self._rows[y0:y1], axis=1, bitorder=self._order)
+
+    def _store(self, y0, bits):
+        self._rows[y0:y0 + bits.shape[0]] = np.packbits(
+            bits, axis=1, bitorder=self._order)
+
+    def fill_rect(self, x, y, w, h, c):
+        x0, y0, x1, y1 = self._clip(x, y, w, h)
+        if x0 >= x1 or y0 >= y1:
+            return
+
+        # Rows that are covered end to end are set a byte at a time.
+        if x0 == 0 and x1 == self.width == self.stride:
+            self._rows[y0:y1] = 0xFF if c & 1 else 0x00
+            return
+
+        bits = self._bits(y0, y1)
+        bits[:, x0:x1] = c & 1
+        self._store(y0, bits)
+
+    def blit(self, fbuf, x, y, key=-1, palette=None):
+        x0, y0, x1, y1 = self._clip(x, y, fbuf.width, fbuf.height)
+        if x0 >= x1 or y0 >= y1:
+            return
+
+        if isinstance(fbuf, _NpFrameBuffer):
+            src = fbuf._bits(y0 - y, y1 - y)[:, x0 - x:x1 - x]
+        else:
+            src = np.array([[fbuf.pixel(sx, sy) for sx in range(x0 - x, x1 - x)]
+                            for sy in range(y0 - y, y1 - y)], dtype=np.uint8)
+
+        keep = src != key
+        if palette is not None:
+            src = np.array([palette.pixel(0, 0), palette.pixel(1, 0)],
+                           dtype=np.uint8)[src]
+
+        bits = self._bits(y0, y1)
+        window = bits[:, x0:x1]
+        window[keep] = src[keep]
+        self._store(y0, bits)
+
+    def scroll(self, xstep, ystep):
+        # Pixels shifted in from outside keep their old value, as on device.
+        bits = self._bits(0, self.height)
+        shifted = bits.copy()
+        w, h = self.width, self.height
+        dx0, dx1 = max(xstep, 0), min(w + xstep, w)
+        dy0, dy1 = max(ystep, 0), min(h + ystep, h)
+        if dx0 < dx1 and dy0 < dy1:
+            shifted[dy0:dy1, dx0:dx1] = bits[dy0 - ystep:dy1 - ystep,
+                                             dx0 - xstep:dx1 - xstep]
+        self._store(0, shifted)
+
+
+FrameBuffer = _PyFrameBuffer if np is None else _NpFrameBuffer
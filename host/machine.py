@@ -0,0 +1,86 @@
+# CPython stand-in for the parts of MicroPython's `machine` module used by
+# eink.py. SPI writes are forwarded to the modelled controller in ssd1680.py.
+import micropython
+import ssd1680
+
+# Wiring from eink.py.
+_RST_PIN = 12
+_DC_PIN = 8
+_CS_PIN = 9
+_BUSY_PIN = 13
+
+_pins = {}
+
+
+class Pin:
+    IN = 0
+    OUT = 1
+    PULL_UP = 1
+    IRQ_FALLING = 4
+    IRQ_RISING = 8
+
+    def __init__(self, id, mode=IN, pull=None, value=None):
+        self.id = id
+        self._value = 0 if value is None else value
+        _pins[id] = self
+
+    def value(self, value=None):
+        if value is None:
+            return self._value
+
+        if self.id == _RST_PIN and self._value == 0 and value:
+            ssd1680.panel.hardware_reset()
+        elif self.id == _CS_PIN and self._value == 1 and not value:
+            ssd1680.panel.select()
+        self._value = 1 if value else 0
+
+    def __call__(self, value=None):
+        return self.value(value)
+
+    # Soft IRQs only. The modelled controller finishes a refresh as soon as it
+    # starts, so the BUSY falling edge is delivered on the next sleep/idle.
+    def irq(self, handler=None, trigger=IRQ_FALLING | IRQ_RISING, hard=False):
+        if self.id != _BUSY_PIN:
+            return
+
+        if handler is None or not trigger & Pin.IRQ_FALLING:
+            ssd1680.panel.on_idle = None
+        else:
+            ssd1680.panel.on_idle = lambda: micropython.schedule(handler, self)
+
+
+def idle():
+    micropython.run_scheduled()
+
+
+class _Memory:
+    # Peripheral registers read as zero (idle, FIFOs empty); writes are dropped.
+    def __getitem__(self, addr):
+        return 0
+
+    def __setitem__(self, addr, value):
+        pass
+
+
+mem8 = mem16 = mem32 = _Memory()
+
+
+def _level(id, default):
+    pin = _pins.get(id)
+    return default if pin is None else pin._value
+
+
+class SPI:
+    def __init__(self, id, **kwargs):
+        self.id = id
+        self.init(**kwargs)
+
+    def init(self, baudrate=None, **kwargs):
+        if baudrate is not None:
+            ssd1680.panel.baudrate = baudrate
+
+    def write(self, data):
+        if _level(_CS_PIN, 1):
+            return  # Not selected
+
+        ssd1680.panel.write(_level(_DC_PIN, 1), bytes(data))
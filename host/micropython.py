@@ -0,0 +1,20 @@
+# CPython stand-in for the `micropython` module.
+#
+# Scheduled callbacks (and soft pin IRQs, see machine.py) run the next time
+# the firmware sleeps or idles, as they would on the device.
+
+_scheduled = []
+
+
+def const(value):
+    return value
+
+
+def schedule(func, arg):
+    _scheduled.append((func, arg))
+
+
+def run_scheduled():
+    while _scheduled:
+        func, arg = _scheduled.pop(0)
+        func(arg)
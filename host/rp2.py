@@ -0,0 +1,62 @@
+# CPython stand-in for the DMA part of MicroPython's `rp2` module.
+#
+# A triggered transfer completes at once: bytes written to an SPI data
+# register go to the stand-in SPI bus (machine.py) and the completion IRQ is
+# scheduled to run on the next sleep/idle, as a soft IRQ would. As on the
+# device, the IRQ is only raised if the control word clears irq_quiet.
+import machine
+import micropython
+
+_SPI_DR = {0x4003C008: 0, 0x40040008: 1}
+
+
+class DMA:
+    def __init__(self):
+        self._handler = None
+        self._ctrl = {"irq_quiet": True}
+        self.transfers = 0  # Completed transfers
+        self.bytes = 0
+        self._closed = False
+
+    def pack_ctrl(self, default=None, **kwargs):
+        ctrl = dict(default or {"irq_quiet": True})
+        ctrl.update(kwargs)
+        return ctrl
+
+    def unpack_ctrl(self, ctrl):
+        return dict(ctrl)
+
+    def config(self, read=None, write=None, count=None, ctrl=None, trigger=False):
+        if self._closed:
+            raise OSError("DMA channel closed")
+
+        self._read = read
+        self._write = write
+        self._count = count
+        if ctrl is not None:
+            self._ctrl = ctrl
+        if trigger:
+            self.active(1)
+
+    def active(self, value=None):
+        if value is None:
+            return False
+        if not value:
+            return
+
+        data = bytes(memoryview(self._read)[:self._count])
+        if self._write in _SPI_DR:
+            machine.SPI(_SPI_DR[self._write]).write(data)
+        elif isinstance(self._write, (bytearray, memoryview)):
+            memoryview(self._write)[:self._count] = data
+
+        self.transfers += 1
+        self.bytes += self._count
+        if self._handler is not None and not self._ctrl.get("irq_quiet", True):
+            micropython.schedule(self._handler, self)
+
+    def irq(self, handler=None, hard=False):
+        self._handler = handler
+
+    def close(self):
+        self._closed = True
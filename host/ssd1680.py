@@ -0,0 +1,289 @@
+# Host-side model of the SSD1680 panel controller driven by eink.py.
+#
+# It decodes the command stream sent over the stand-in SPI bus (see
+# machine.py) into the controller's RAM and the image shown on the panel,
+# and counts what it cost: bytes, SPI transactions, CS toggles, refresh
+# cycles by type and a modelled BUSY time.
+import struct
+import zlib
+
+# Modelled BUSY time per operation, in ms. Rough figures for the 2.66" B
+# panel; they are for comparing driver changes, not predicting the device.
+BUSY_MS = {
+    "full": 15000,  # OTP waveform
+    "fast": 7000,  # Fast full refresh
+    "partial": 400,  # Partial LUT
+    "load": 100,  # 0x20 that only loads settings (LUT, temperature)
+    "lut": 10,  # 0x32 LUT write
+    "swreset": 10,  # 0x12
+    "hwreset": 10,  # Reset pin
+}
+
+_COUNTERS = (
+    "bytes",  # Everything on MOSI
+    "data_bytes",  # Bytes with DC high
+    "ram_bytes",  # Bytes written to 0x24/0x26
+    "commands",
+    "transactions",  # spi.write calls with CS low
+    "cs_toggles",  # CS falling edges
+    "hwresets",
+    "swresets",
+    "loads",
+    "refreshes",
+    "full",
+    "fast",
+    "partial",
+    "busy_ms",
+)
+
+
+class Controller:
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.wide = width // 8 + (1 if width % 8 else 0)
+        self.bw_ram = bytearray(b'\xff' * (self.wide * height))
+        self.red_ram = bytearray(self.wide * height)
+        self.frame = None  # (black, red) pixel rows of the last refresh
+        self.baudrate = 4_000_000
+        self.sleeping = False
+        self.on_idle = None  # Called when BUSY falls after a refresh
+        self.reset_stats()
+        self.reset()
+
+    @property
+    def refreshes(self):
+        return self.stats["refreshes"]
+
+    def reset_stats(self):
+        self.stats = dict.fromkeys(_COUNTERS, 0)
+
+    def report(self):
+        """Counters plus the modelled SPI time, as a dict."""
+        stats = dict(self.stats)
+        stats["spi_ms"] = round(self.stats["bytes"] * 8 * 1000 / self.baudrate, 1)
+        return stats
+
+    def hardware_reset(self):
+        self.stats["hwresets"] += 1
+        self.stats["busy_ms"] += BUSY_MS["hwreset"]
+        self.reset()
+
+    def reset(self):
+        # RAM is retained over a reset; registers are not.
+        self.mode = 0x03
+        self.update_control = (0x00, 0x00)
+        self.display_control = 0xFF
+        self.custom_lut = False
+        self.temperature = None
+        self.x_start = 0
+        self.x_end = self.wide - 1
+        self.y_start = 0
+        self.y_end = self.height - 1
+        self.x = 0
+        self.y = 0
+        self.sleeping = False
+        self._command = None
+        self._args = bytearray()
+
+    def select(self):
+        self.stats["cs_toggles"] += 1
+
+    def write(self, dc, data):
+        self.stats["transactions"] += 1
+        self.stats["bytes"] += len(data)
+        if dc:
+            self.stats["data_bytes"] += len(data)
+
+        if self.sleeping:
+            return  # Only a hardware reset wakes the controller
+
+        if dc == 0:
+            for b in data:
+                self._finish()
+                self._command = b
+                self._args = bytearray()
+                self.stats["commands"] += 1
+                self._start()
+            return
+
+        if self._command == 0x24:
+            self._write_ram(self.bw_ram, data)
+        elif self._command == 0x26:
+            self._write_ram(self.red_ram, data)
+        else:
+            self._args += data
+
+    def _start(self):
+        if self._command == 0x12:
+            self.stats["swresets"] += 1
+            self.stats["busy_ms"] += BUSY_MS["swreset"]
+            self.reset()
+        elif self._command == 0x20:
+            self.activate()
+        elif self._command == 0x10:
+            self.sleeping = True
+
+    def _finish(self):
+        command = self._command
+        a = self._args
+        if command == 0x11 and len(a) >= 1:
+            self.mode = a[0]
+        elif command == 0x22 and len(a) >= 1:
+            self.display_control = a[0]
+        elif command == 0x21 and len(a) >= 2:
+            self.update_control = (a[0], a[1])
+        elif command == 0x1A and len(a) >= 2:
+            self.temperature = (a[0] << 4 | a[1] >> 4) / 16
+        elif command == 0x32 and len(a) >= 153:
+            self.custom_lut = True
+            self.stats["busy_ms"] += BUSY_MS["lut"]
+        elif command == 0x44 and len(a) >= 2:
+            self.x_start = a[0] & 0x1f
+            self.x_end = a[1] & 0x1f
+        elif command == 0x45 and len(a) >= 4:
+            self.y_start = a[0] | (a[1] & 0x01) << 8
+            self.y_end = a[2] | (a[3] & 0x01) << 8
+        elif command == 0x4E and len(a) >= 1:
+            self.x = a[0] & 0x1f
+        elif command == 0x4F and len(a) >= 2:
+            self.y = a[0] | (a[1] & 0x01) << 8
+
+    def _write_ram(self, ram, data):
+        self.stats["ram_bytes"] += len(data)
+        x_step = 1 if self.mode & 0x01 else -1
+        y_step = 1 if self.mode & 0x02 else -1
+        for b in data:
+            if 0 <= self.x < self.wide and 0 <= self.y < self.height:
+                ram[self.y * self.wide + self.x] = b
+
+            # Address counter: X first, wrapping inside the window.
+            if self.x == self.x_end:
+                self.x = self.x_start
+                if self.y == self.y_end:
+                    self.y = self.y_start
+                else:
+                    self.y += y_step
+            else:
+                self.x += x_step
+
+    # Master activation (0x20): runs the 0x22 display update sequence, which
+    # may only load settings rather than drive the panel.
+    def activate(self):
+        self._finish()
+        control = self.display_control
+        if not control & 0x04:
+            self.stats["loads"] += 1
+            self.stats["busy_ms"] += BUSY_MS["load"]
+        else:
+            if control & 0x10 or not (self.custom_lut or self.temperature):
+                kind = "full"  # LUT loaded from OTP for the real temperature
+            elif control & 0x08:
+                kind = "partial"
+            else:
+                kind = "fast"
+            self.stats[kind] += 1
+            self.stats["busy_ms"] += BUSY_MS[kind]
+            self.refresh()
+
+        if self.on_idle is not None:
+            self.on_idle()
+
+    def refresh(self):
+        red_option = self.update_control[0] >> 4
+        black = []
+        red = []
+        for y in range(self.height):
+            o = y * self.wide
+            black_row = bytearray(self.width)
+            red_row = bytearray(self.width)
+            for x in range(self.width):
+                mask = 0x80 >> (x & 7)
+                bw = self.bw_ram[o + (x >> 3)] & mask
+                rd = self.red_ram[o + (x >> 3)] & mask
+                if red_option == 0x08:
+                    rd = not rd
+                elif red_option == 0x04:
+                    rd = 0
+                if rd:
+                    red_row[x] = 1
+                elif not bw:
+                    black_row[x] = 1
+            black.append(bytes(black_row))
+            red.append(bytes(red_row))
+
+        self.frame = (black, red)
+        self.stats["refreshes"] += 1
+
+
+def _rgb_rows(frame):
+    black, red = frame
+    for black_row, red_row in zip(black, red):
+        row = bytearray()
+        for b, r in zip(black_row, red_row):
+            row += b'\xff\x00\x00' if r else b'\x00\x00\x00' if b else b'\xff\xff\xff'
+        yield bytes(row)
+
+
+def write_ppm(path, frame):
+    """Write a (black, red) frame as a colour PPM."""
+    black = frame[0]
+    with open(path, 'wb') as f:
+        f.write(f'P6\n{len(black[0])} {len(black)}\n255\n'.encode())
+        for row in _rgb_rows(frame):
+            f.write(row)
+
+
+def write_png(path, frame):
+    """Write a (black, red) frame as an RGB PNG."""
+    black = frame[0]
+    width = len(black[0])
+    height = len(black)
+    raw = b''.join(b'\x00' + row for row in _rgb_rows(frame))
+
+    def chunk(kind, data):
+        body = kind + data
+        return struct.pack('>I', len(data)) + body + struct.pack('>I', zlib.crc32(body))
+
+    with open(path, 'wb') as f:
+        f.write(b'\x89PNG\r\n\x1a\n')
+        f.write(chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0)))
+        f.write(chunk(b'IDAT', zlib.compress(raw, 9)))
+        f.write(chunk(b'IEND', b''))
+
+
+def write_pbm(path, rows):
+    """Write pixel rows (1 = ink) as a binary PBM."""
+    height = len(rows)
+    width = len(rows[0]) if rows else 0
+    with open(path, 'wb') as f:
+        f.write(f'P4\n{width} {height}\n'.encode())
+        for row in rows:
+            packed = bytearray((width + 7) // 8)
+            for x, v in enumerate(row):
+                if v:
+                    packed[x >> 3] |= 0x80 >> (x & 7)
+            f.write(packed)
+
+
+def read_pbm(path):
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    fields = data.split(maxsplit=3)
+    if fields[0] != b'P4':
+        raise ValueError(f'{path}: not a binary PBM')
+    width = int(fields[1])
+    height = int(fields[2])
+    raw = fields[3]
+    wide = (width + 7) // 8
+    rows = []
+    for y in range(height):
+        packed = raw[y * wide:(y + 1) * wide]
+        rows.append(bytes(
+            1 if packed[x >> 3] & (0x80 >> (x & 7)) else 0 for x in range(width)))
+    return rows
+
+
+# The panel the stand-in SPI bus is wired to.
+panel = Controller(152, 296)
@@ -0,0 +1,10 @@
+# CPython stand-in for MicroPython's `uctypes`. Raw memory access has no
+# host equivalent; writer.py imports these names but does not call them.
+
+
+def addressof(obj):
+    raise NotImplementedError('uctypes.addressof is not available on the host')
+
+
+def bytearray_at(addr, size):
+    raise NotImplementedError('uctypes.bytearray_at is not available on the host')
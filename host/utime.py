@@ -0,0 +1,35 @@
+# CPython stand-in for MicroPython's `utime`. Sleeps return immediately so
+# host runs are not held up by the panel's busy waits, but run any scheduled
+# callbacks as a real sleep would.
+import time
+import micropython
+
+_start = time.monotonic_ns()
+
+
+def sleep(seconds):
+    micropython.run_scheduled()
+
+
+def sleep_ms(ms):
+    micropython.run_scheduled()
+
+
+def sleep_us(us):
+    micropython.run_scheduled()
+
+
+def ticks_ms():
+    return (time.monotonic_ns() - _start) // 1_000_000
+
+
+def ticks_us():
+    return (time.monotonic_ns() - _start) // 1_000
+
+
+def ticks_diff(end, start):
+    return end - start
+
+
+def ticks_add(ticks, delta):
+    return ticks + delta
@@ -0,0 +1,156 @@
+# Screen layouts as data, compiled once into fixed positions.
+#
+# A layout is a list of Fields, drawn in order. build() works out each
+# field's position rule for the screen and measures the text that never
+# changes, so draw() only measures the values of an update. Every field also
+# gets a fixed bounding box (bounds()).
+from fonts import metrics
+
+LEFT = 0
+CENTER = 1
+RIGHT = 2
+AFTER = 3  # Just after the anchor field's text
+BEFORE = 4  # Just before the anchor field's text
+
+
+class Field:
+    """One piece of text on the screen.
+
+    `text` is a string, or text(weather, battery) giving one (None leaves
+    the field out). It is aligned LEFT (at `col`), CENTER or RIGHT within
+    `region`, an (offset, width) pair of fractions of the screen width; or
+    AFTER/BEFORE the text of the field named `anchor`, `gap` pixels away.
+
+    With `limit`, the field is drawn in red when value(weather, battery) is
+    outside that entry of the limits passed to draw(). `height` is the rows
+    the field may take if its text wraps; by default one line of the font.
+    """
+
+    def __init__(self, name, font, row, text, align=LEFT, col=0,
+                 region=(0, 1), anchor=None, gap=0, limit=None, value=None,
+                 height=None):
+        self.name = name
+        self.font = font
+        self.row = row
+        self.text = text
+        self.align = align
+        self.col = col
+        self.region = region
+        self.anchor = anchor
+        self.gap = gap
+        self.limit = limit
+        self.value = value
+        self.height = height
+
+
+def _half(n):
+    # n / 2 rounded half to even, as round() does.
+    h = n >> 1
+    return h + (h & 1) if n & 1 else h
+
+
+class Box:
+    """A Field placed on a screen of the given size."""
+
+    def __init__(self, field, font, screen_width):
+        self.field = field
+        self.metrics = metrics.of(font)
+        o = screen_width * field.region[0]
+        self.x = int(o)
+        self.width = int(screen_width * field.region[1])
+        self.height = field.height or font.height()
+
+        # The column for text w pixels wide is round((a - m * w) / 2), worked
+        # out as it always was (see column()) but without floats.
+        align = field.align
+        if align == CENTER:
+            a, self._m = self.width + 2 * o, 1
+        elif align == RIGHT:
+            a, self._m = 2 * (self.width + o), 2
+        else:
+            a, self._m = 2 * (o + field.col), 0
+        self._exact = a == int(a)
+        self._a = int(a) if self._exact else int(a + 1)
+
+        self.anchor = None  # Box of field.anchor
+        self.drawn = False
+        self.text = field.text if isinstance(field.text, str) else None
+        # The same on every update: fixed text in a fixed place and colour.
+        self.static = self.text is not None and field.align < AFTER \
+            and field.limit is None
+        self.w = self.metrics.stringlen(self.text) if self.text is not None else 0
+        self.col = self.column(self.w) if self.text is not None else 0
+
+    def column(self, w):
+        if self._exact:
+            return _half(self._a - self._m * w)
+        return (self._a - self._m * w) >> 1
+
+    def bounds(self):
+        return (self.x, self.field.row, self.width, self.height)
+
+
+def build(fields, fonts, screen_width):
+    """Boxes for fields, with fonts mapping each field's font to the font."""
+    boxes = []
+    by_name = {}
+    for field in fields:
+        box = Box(field, fonts[field.font], screen_width)
+        box.anchor = by_name.get(field.anchor)
+        by_name[field.name] = box
+        boxes.append(box)
+    return boxes
+
+
+def bounds(boxes):
+    """{name: (x, y, width, height)} of every field."""
+    return {box.field.name: box.bounds() for box in boxes}
+
+
+def draw(boxes, writers, weather, battery, limits, set_textpos, static=None):
+    """Draw an update.
+
+    writers maps each font to its (black, red) Writer; set_textpos is the
+    Writer class's. With static True or False, only the boxes that are (or
+    are not) static are drawn.
+    """
+    for box in boxes:
+        if static is not None and box.static != static:
+            continue
+        field = box.field
+        box.drawn = False
+        s = box.text
+        if s is None:
+            s = field.text(weather, battery)
+            if s is None:
+                continue
+
+        writer = writers[field.font][0]
+        if field.limit is not None:
+            value = field.value(weather, battery)
+            lims = limits[field.limit]
+            if value <= lims["low"] or value >= lims["high"]:
+                writer = writers[field.font][1]
+
+        if box.text is not None and field.align < AFTER:
+            col = box.col
+            w = box.w
+        else:
+            w = box.w if box.text is not None else box.metrics.stringlen(s)
+            anchor = box.anchor
+            if field.align == AFTER:
+                if not anchor.drawn:
+                    continue
+                col = anchor.col + anchor.w + field.gap
+            elif field.align == BEFORE:
+                if not anchor.drawn:
+                    continue
+                col = anchor.col - w + field.gap
+            else:
+                col = box.column(w)
+
+        box.col = col
+        box.w = w
+        box.drawn = True
+        set_textpos(writer.device, field.row, col)
+        writer.printstring(s)
@@ -14,6 +14,7 @@ import util
 import mqtt
 
 _debug_mode = True
+_trace_mode = False  # Log every string drawn on the screen
 
 WIFI_SSID = settings.WIFI_SSID
 WIFI_PASSWD = settings.WIFI_PASSWD
@@ -374,5 +375,5 @@ if __name__ == "__main__":
     wdt = watchdog.WatchdogTimer(120)
     print("Watchdog set.")
 
-    screen.debug_mode(_debug_mode)
+    screen.debug_mode(_debug_mode, _trace_mode)
     main(wdt)
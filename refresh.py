@@ -0,0 +1,102 @@
+import json
+
+POLICY_FILE = "refresh.json"
+
+
+class RefreshPolicy:
+    """Decides when an update should clear ghosting with an extra full cycle.
+
+    Updates are normally drawn directly over the previous frame. A clear
+    (Clear() then display()) is done every `clear_every` updates, or when
+    more than `clear_change` of the frame changed. Either can be disabled
+    with 0/None; disabling both gives plain direct updates.
+
+    `fingerprint` identifies the frame on the panel, set by shown() once a
+    refresh has finished; a frame with the same fingerprint is not sent
+    again and only counts as a skip. Skips are saved with the next update,
+    not on their own.
+
+    Counters are kept in POLICY_FILE so a reset does not restart the cycle.
+    """
+
+    def __init__(self, clear_every=12, clear_change=0.5, path=POLICY_FILE):
+        self.clear_every = clear_every
+        self.clear_change = clear_change
+        self.path = path
+
+        self.since_clear = 0
+        self.updates = 0
+        self.clears = 0
+        self.skips = 0
+        self.fingerprint = None
+        self.load()
+
+    def unchanged(self, fingerprint):
+        """True (and counted as a skip) if the frame is already shown."""
+        if fingerprint != self.fingerprint:
+            return False
+
+        self.skips += 1
+        return True
+
+    def should_clear(self, changed):
+        if self.clear_every and self.since_clear + 1 >= self.clear_every:
+            return True
+
+        # `changed` is None when the panel contents are unknown (after a
+        # reboot). That is not a reason to clear on its own.
+        if self.clear_change is not None and changed is not None \
+                and changed > self.clear_change:
+            return True
+
+        return False
+
+    # Called as a refresh starts. Until shown() the panel may hold anything
+    # (a reset mid-refresh leaves it half drawn), so no fingerprint is kept.
+    def record(self, cleared):
+        self.fingerprint = None
+        self.updates += 1
+        if cleared:
+            self.clears += 1
+            self.since_clear = 0
+        else:
+            self.since_clear += 1
+
+        self.save()
+
+    def shown(self, fingerprint):
+        """The refresh has finished; the panel shows this frame."""
+        self.fingerprint = fingerprint
+        self.save()
+
+    def stats(self):
+        return {
+            "since_clear": self.since_clear,
+            "updates": self.updates,
+            "clears": self.clears,
+            "skips": self.skips,
+        }
+
+    def load(self):
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+
+            self.since_clear = data["since_clear"]
+            self.updates = data["updates"]
+            self.clears = data["clears"]
+            self.skips = data.get("skips", 0)
+            self.fingerprint = data.get("fingerprint")
+
+        except (OSError, ValueError, KeyError):
+            pass
+
+    def save(self):
+        try:
+            with open(self.path, "w") as f:
+                data = self.stats()
+                data["fingerprint"] = self.fingerprint
+                json.dump(data, f)
+                f.flush()
+        except OSError as e:
+            print(f"RefreshPolicy: Failed to save counters: {e}")
@@ -1,64 +1,94 @@
-import eink
+import binascii
+import display
 import time
 import gc
 import util
 from writer import Writer
-from fonts import arial10, arial35, arial50
+from fonts import store
 import mqtt
+import settings
+from refresh import RefreshPolicy
+import layout
+from layout import Field, CENTER, RIGHT, AFTER, BEFORE
 
 _debug_mode = False
 
 
-def debug_mode(enabled: bool):
-    global _debug_mode
+# Writer that records what is drawn where. The log is printed once per
+# update, after the refresh has started, so tracing does not hold up drawing
+# on the UART.
+class TraceWriter(Writer):
+    log = []
 
-    _debug_mode = enabled
-
-
-class DebugWriter(Writer):
     @staticmethod
     def set_textpos(device, row=None, col=None):
-        global _debug_mode
-
-        if _debug_mode:
-            print("set_textpos", (device, row, col))
+        TraceWriter.log.append(("set_textpos", row, col))
+        return Writer.set_textpos(device, row, col)
 
-        Writer.set_textpos(device, row, col)
+    def printstring(self, string, invert=True):
+        TraceWriter.log.append(("printstring", string, invert))
+        Writer.printstring(self, string, invert)
 
     @staticmethod
-    def get_textpos(device):
-        return Writer.get_textpos(device)
+    def dump():
+        for entry in TraceWriter.log:
+            print(*entry)
+        TraceWriter.log = []
 
-    def __init__(self, *args, **kwargs):
-        self.writer = Writer(*args, **kwargs)
 
-    def __getattr__(self, attr):
-        return getattr(self.writer, attr)
+# Writer class used to draw. Writer.printstring already draws black on
+# white (invert=True); only with tracing on is anything between
+# update_display() and Writer.
+_Writer = Writer
 
-    def printstring(self, string, invert=True):
-        global _debug_mode
 
-        if _debug_mode:
-            print("printstring: ", (string, invert))
+def debug_mode(enabled: bool, trace: bool = False):
+    global _debug_mode, _Writer
 
-        self.writer.printstring(string, invert)
+    _debug_mode = enabled
+    _Writer = TraceWriter if trace else Writer
 
 
+# A frame buffer with the width and height Writer needs. The drawing methods
+# are bound once here rather than looked up through the proxy on each call.
 class ProxyDevice:
-    def __init__(self, device):
+    def __init__(self, device, width, height):
         self.device = device
-        self.height = 296
-        self.width = 152
+        self.height = height
+        self.width = width
+        self.blit = device.blit
+        self.fill_rect = device.fill_rect
+        self.scroll = device.scroll
 
     def __getattr__(self, attr):
         return getattr(self.device, attr)
 
 
-epd = eink.EPD_2in9_B()
-epd.invert_x = True
-epd.invert_y = True
-black_proxy = ProxyDevice(epd.imageblack)
-red_proxy = ProxyDevice(epd.imagered)
+# The panel is mounted upside down.
+epd = display.create(
+    getattr(settings, "DISPLAY_DRIVER", "eink.EPD_2in9_B"),
+    dma=getattr(settings, "DISPLAY_DMA", False),
+    fast=getattr(settings, "DISPLAY_FAST_REFRESH", False),
+    rotate=180,
+)
+black_plane = epd.plane("black")
+red_plane = epd.plane("red")
+black_proxy = ProxyDevice(black_plane, epd.width, epd.height)
+red_proxy = ProxyDevice(red_plane, epd.width, epd.height)
+
+# Fonts are read from fonts/*.fnt when present, a glyph at a time.
+_hot_glyphs = getattr(settings, "FONT_HOT_GLYPHS", 0)
+arial10 = store.load("arial10", _hot_glyphs)
+arial35 = store.load("arial35", _hot_glyphs)
+arial50 = store.load("arial50", _hot_glyphs)
+
+Writer.glyphs.resize(getattr(settings, "GLYPH_CACHE_BYTES", 8192))
+Writer.line_mode = getattr(settings, "TEXT_LINE_MODE", False)
+
+policy = RefreshPolicy(
+    clear_every=getattr(settings, "REFRESH_CLEAR_EVERY", 12),
+    clear_change=getattr(settings, "REFRESH_CLEAR_CHANGE", 0.5),
+)
 
 
 def degrees_to_compass(deg):
@@ -84,30 +114,152 @@ def degrees_to_compass(deg):
     return sectors[int(round((deg % 360) / 22.5, 0))]
 
 
-def center_string(font, s, x, dw=None, o=None):
-    if dw is None:
-        dw = font.device.width
+def _hour_minute(t):
+    (_, _, _, hour, minute, *_) = util.localtime(t)
+    return f"{hour}:{minute}"
+
+
+def _timestamp(weather, battery):
+    (year, month, day, hour, minute, second, *_) = util.localtime(weather["timestamp"])
+    return f"{year}-{month:02d}-{day:02d} {hour:02d}:{minute:02d}:{second:02d}"
+
+
+def _battery(weather, battery):
+    if battery["charging"]:
+        return None
+    return f"{battery['level'] * 100:.0f}%"
+
+
+def _gusts(weather, battery):
+    return round(weather["wind"]["gusts"])
+
+
+FONTS = {"arial10": arial10, "arial35": arial35, "arial50": arial50}
+
+# Drawn in this order; values outside `limits` are drawn in red.
+FIELDS = (
+    # Current temperature and Feels like
+    Field("temp", "arial50", 10, lambda w, b: str(round(w["temperature"]["current"])),
+          col=3, limit="temp", value=lambda w, b: round(w["temperature"]["current"])),
+    Field("feels_label", "arial10", 10, "Feels like", RIGHT),
+    Field("feels", "arial35", 25, lambda w, b: str(round(w["temperature"]["feelsLike"])),
+          RIGHT, limit="temp", value=lambda w, b: round(w["temperature"]["feelsLike"])),
+    # Humidity
+    Field("humidity", "arial35", 70, lambda w, b: f"{w['humidity']}%", CENTER,
+          limit="humidity", value=lambda w, b: w["humidity"]),
+    # High and Low
+    Field("high", "arial35", 105, lambda w, b: str(round(w["temperature"]["max"])),
+          CENTER, region=(0, 0.4)),
+    Field("high_label", "arial10", 110, "Hi", AFTER, anchor="high", gap=3),
+    Field("low", "arial35", 105, lambda w, b: str(round(w["temperature"]["min"])),
+          CENTER, region=(0.6, 0.4)),
+    Field("low_label", "arial10", 120, "Lo", BEFORE, anchor="low", gap=-3),
+    # Wind speed + direction
+    Field("wind", "arial35", 145, lambda w, b: str(round(w["wind"]["speed"])),
+          CENTER, region=(0, 1 / 3), limit="wind",
+          value=lambda w, b: round(w["wind"]["speed"])),
+    Field("gusts", "arial35", 145,
+          lambda w, b: str(_gusts(w, b)) if "gusts" in w["wind"] else None,
+          CENTER, region=(0.66, 1 / 3), limit="gusts", value=_gusts),
+    Field("gusts_label", "arial10", 147, "gust >", CENTER),
+    Field("direction", "arial10", 162, lambda w, b: degrees_to_compass(w["wind"]["degrees"]),
+          CENTER),
+    # Sunrise and sunset
+    Field("sunrise", "arial10", 185, lambda w, b: "Sunrise: " + _hour_minute(w["sunrise"]),
+          CENTER, region=(0, 0.5)),
+    Field("sunset", "arial10", 197, lambda w, b: "Sunset: " + _hour_minute(w["sunset"]),
+          CENTER, region=(0, 0.5)),
+    # Pressure
+    Field("pressure", "arial10", 185, lambda w, b: f"{w['pressure']} hPa", CENTER,
+          region=(0.5, 0.5)),
+    # Overcast?
+    Field("conditions", "arial35", 215,
+          lambda w, b: ", ".join([entry["description"] for entry in w["conditions"]]),
+          height=70),
+    # Last update time, battery; pinned at bottom
+    Field("updated", "arial10", epd.height - 10, _timestamp, CENTER),
+    Field("battery", "arial10", epd.height - 10, _battery, RIGHT),
+)
+
+boxes = layout.build(FIELDS, FONTS, epd.width)
+
+# The static fields are drawn once into BACKGROUND, which holds every plane
+# in order after a signature of what was drawn. Each update restores it with
+# one readinto per plane; a change to the layout or to a font file makes the
+# signature differ and the file is drawn again.
+BACKGROUND = "background.bin"
+
+
+_background_sig = None
 
-    dw = int(dw)
-    w = font.stringlen(s)
-    c = (dw / 2) - (w / 2)
-    c += o or 0
-    c = int(round(c, 0))
-    DebugWriter.set_textpos(font.device, x, c)
-    return (w, c)
 
+# Size and CRC32 of a font's file, so regenerated glyphs redraw the
+# background. Fonts without a file (frozen modules) add nothing.
+def _font_signature(font, sig):
+    path = getattr(font, "path", None) or getattr(font, "__file__", None)
+    if path is None:
+        return sig
 
-def right_string(font, s, x, dw=None, o=None):
-    if dw is None:
-        dw = font.device.width
+    buf = bytearray(256)
+    size = 0
+    try:
+        with open(path, "rb") as f:
+            while True:
+                n = f.readinto(buf)
+                if not n:
+                    break
+                size += n
+                sig = binascii.crc32(memoryview(buf)[:n], sig)
+    except OSError:
+        return sig
+    return binascii.crc32(f"{path}{size}".encode(), sig)
+
+
+def _background_signature():
+    global _background_sig
+
+    if _background_sig is not None:
+        return _background_sig
+
+    sig = binascii.crc32(f"{epd.width}x{epd.height}{epd.planes}".encode())
+    fonts = []
+    for box in boxes:
+        if box.static:
+            f = box.field
+            sig = binascii.crc32(f"{f.name}{f.font}{f.row}{box.col}{box.w}{box.text}".encode(), sig)
+            if f.font not in fonts:
+                fonts.append(f.font)
+    for name in fonts:
+        sig = _font_signature(FONTS[name], sig)
+
+    _background_sig = sig
+    return sig
+
+
+def _restore_background(writers):
+    sig = _background_signature()
+    try:
+        with open(BACKGROUND, "rb") as f:
+            if int.from_bytes(f.read(4), "little") == sig:
+                n = 0
+                for name in epd.planes:
+                    buf = epd.buffer(name)
+                    n += f.readinto(buf) == len(buf)
+                if n == len(epd.planes):
+                    return
+    except OSError:
+        pass
 
-    dw = int(dw)
-    w = font.stringlen(s)
-    r = dw - w
-    r += o or 0
-    r = int(round(r, 0))
-    DebugWriter.set_textpos(font.device, x, r)
-    return (w, r)
+    for name in epd.planes:
+        epd.plane(name).fill(0xFF)
+    layout.draw(boxes, writers, None, None, None, _Writer.set_textpos, static=True)
+    try:
+        with open(BACKGROUND, "wb") as f:
+            f.write(sig.to_bytes(4, "little"))
+            for name in epd.planes:
+                f.write(epd.buffer(name))
+    except OSError as e:
+        print("update_display: Background not saved:", e)
 
 
 # Totaly arbitrary values to put something on the screen.
@@ -150,167 +302,103 @@ def debug_update_display(gusts=88.88):
     update_display(weather, limits, battery_stats)
 
 
-def update_display(weather, limits, battery_stats):
-    global epd, black_proxy, red_proxy
-
-    gc.collect()
-
-    def within_limits(name, value):
-        lims = limits[name]
-        if value <= lims["low"]:
-            return False
-
-        if value >= lims["high"]:
-            return False
-
-        return True
-
-    epd.imageblack.fill(0xFF)
-    epd.imagered.fill(0xFF)
+# Show the frame buffers without blocking, clearing ghosting first when the
+# refresh policy asks for it. The panel is put to sleep and `callback` is
+# called once the refresh has finished, when the frame's CRC32 is recorded as
+# the one on the panel. A frame that matches it is not sent at all; the
+# panel is put to sleep if need be and `callback` is called straight away.
+def present(callback=None):
+    global epd, policy
 
-    w50black: Writer = DebugWriter(black_proxy, arial50)
-    w50red: Writer = DebugWriter(red_proxy, arial50)
-    w35black: Writer = DebugWriter(black_proxy, arial35)
-    w35red: Writer = DebugWriter(red_proxy, arial35)
-    w10black: Writer = DebugWriter(black_proxy, arial10)
-    w10red: Writer = DebugWriter(red_proxy, arial10)
-
-    line = 10
+    def done(_):
+        epd.sleep()
+        policy.shown(fingerprint)
+        if _debug_mode:
+            print("present: wake", getattr(epd, "stats", None))
+        if callback is not None:
+            callback()
+
+    fingerprint = 0
+    for name in epd.planes:
+        fingerprint = binascii.crc32(epd.buffer(name), fingerprint)
+
+    if policy.unchanged(fingerprint):
+        # After a reboot the controller is initialised but was never put to
+        # sleep; nothing else will do it.
+        if not epd.asleep:
+            epd.sleep()
+        if _debug_mode:
+            print("present: unchanged", policy.stats())
+        if callback is not None:
+            callback()
+        return
 
-    # Current temperature and Feels like
-    val = round(weather["temperature"]["current"])
-    writer = w50black if within_limits("temp", val) else w50red
-    s = str(val)
-    DebugWriter.set_textpos(writer.device, line, 3)
-    writer.printstring(s)
+    clear = policy.should_clear(epd.changed())
+    policy.record(clear)
 
-    s = "Feels like"
-    right_string(w10black, s, line)
-    w10black.printstring(s)
+    if _debug_mode:
+        print("present: ", ("clear" if clear else "direct"), policy.stats())
+        print("present: glyphs", Writer.glyphs.stats())
+        for font in (arial10, arial35, arial50):
+            if hasattr(font, "stats"):
+                print("present: font", font.stats())
 
-    val = round(weather["temperature"]["feelsLike"])
-    writer = w35black if within_limits("temp", val) else w35red
-    s = str(val)
-    right_string(writer, s, line + 15)
-    writer.printstring(s)
+    if clear:
+        epd.clear(callback=lambda _: epd.display(callback=done, deep=True))
+    else:
+        epd.display(callback=done)
 
-    line += 60
 
-    # Humidity
-    val = weather["humidity"]
-    writer = w35black if within_limits("humidity", val) else w35red
-    s = f"{val}%"
-    center_string(writer, s, line)
-    writer.printstring(s)
-    line += 35
+def update_display(weather, limits, battery_stats):
+    global epd, black_plane, red_plane, black_proxy, red_proxy
 
-    # High and Low
-    s = str(round(weather["temperature"]["max"]))
-    (w, l) = center_string(w35black, s, line, dw=black_proxy.width * 0.4)
-    w35black.printstring(s)
-    s = "Hi"
-    DebugWriter.set_textpos(black_proxy, line + 5, l + w + 3)
-    w10black.printstring(s)
-    s = str(round(weather["temperature"]["min"]))
-    (w, l) = center_string(
-        w35black, s, line, dw=black_proxy.width * 0.4, o=black_proxy.width * 0.6
-    )
-    w35black.printstring(s)
-    s = "Lo"
-    right_string(w10black, s, line + 15, dw=l, o=-3)
-    w10black.printstring(s)
-    line += 40
+    if epd.busy:
+        print("update_display: Refresh in progress; skipped.")
+        return
 
-    # Wind speed + direction
-    val = round(weather["wind"]["speed"])
-    writer = w35black if within_limits("wind", val) else w35red
-    s = str(round(weather["wind"]["speed"]))
-    center_string(writer, s, line, dw=black_proxy.width / 3)
-    writer.printstring(s)
-
-    if "gusts" in weather["wind"]:
-        val = round(weather["wind"]["gusts"])
-        writer = w35black if within_limits("gusts", val) else w35red
-        s = str(val)
-        center_string(
-            writer, s, line, dw=black_proxy.width / 3, o=black_proxy.width * 0.66
-        )
-        writer.printstring(s)
-
-    s = "gust >"
-    center_string(w10black, s, line + 2)
-    w10black.printstring(s)
-    s = degrees_to_compass(weather["wind"]["degrees"])
-    center_string(w10black, s, line + 17)
-    w10black.printstring(s)
-    line += 40
+    gc.collect()
 
-    # Sunrise and sunset
-    (_, _, _, hour, minute, *_) = util.localtime(weather["sunrise"])
-    s = f"Sunrise: {hour}:{minute}"
-    center_string(w10black, s, line, dw=black_proxy.width / 2)
-    w10black.printstring(s)
+    writers = {}
+    for name, font in FONTS.items():
+        writers[name] = (_Writer(black_proxy, font), _Writer(red_proxy, font))
 
-    (_, _, _, hour, minute, *_) = util.localtime(weather["sunset"])
-    s = f"Sunset: {hour}:{minute}"
-    center_string(w10black, s, line + 12, dw=black_proxy.width / 2)
-    w10black.printstring(s)
+    _restore_background(writers)
+    layout.draw(boxes, writers, weather, battery_stats, limits, _Writer.set_textpos,
+                static=False)
 
-    # Pressure
-    s = f"{weather['pressure']} hPa"
-    center_string(w10black, s, line, dw=black_proxy.width / 2, o=black_proxy.width / 2)
-    w10black.printstring(s)
-    line += 30
+    def updated():
+        mqtt.publish(mqtt.TOPIC_UPDATED, str(weather))
+        gc.collect()
 
-    # Overcast?
-    s = ", ".join([entry["description"] for entry in weather["conditions"]])
-    DebugWriter.set_textpos(black_proxy, line, 0)
-    w35black.printstring(s)
+    present(updated)
 
-    # Last update time, voltage; pinned at bottom
-    line = black_proxy.height - 10
-    (year, month, day, hour, minute, second, *_) = util.localtime(weather["timestamp"])
-    s = f"{year}-{month:02d}-{day:02d} {hour:02d}:{minute:02d}:{second:02d}"
-    center_string(w10black, s, line)
-    w10black.printstring(s)
-
-    if not battery_stats["charging"]:
-        p = battery_stats["level"] * 100
-        s = f"{p:.0f}%"
-        right_string(w10black, s, line)
-        w10black.printstring(s)
-
-    epd.reset()
-    epd.Clear(0xFF, 0xFF)
-    epd.display()
-    epd.sleep()
-
-    mqtt.publish(mqtt.TOPIC_UPDATED, str(weather))
-    gc.collect()
+    if _Writer is TraceWriter:
+        TraceWriter.dump()
 
 
 def show_error(msg=None):
     global time_set
-    global epd
+    global epd, black_plane, red_plane
 
     print(f"ERROR: {msg}")
 
-    epd.imageblack.fill(0xFF)
-    epd.imagered.fill(0xFF)
-    epd.imagered.text("Error :(", 0, 10, 0x00)
-    epd.imagered.text("Faild to load", 0, 25, 0x00)
+    if epd.busy:
+        print("show_error: Refresh in progress; skipped.")
+        return
+
+    black_plane.fill(0xFF)
+    red_plane.fill(0xFF)
+    red_plane.text("Error :(", 0, 10, 0x00)
+    red_plane.text("Faild to load", 0, 25, 0x00)
 
     try:
         now = time.gmtime()
-        epd.imageblack.text(f"{now[0]}-{now[1]}-{now[2]}", 0, 40, 0x00)
-        epd.imageblack.text(f"{now[3]}:{now[4]}:{now[5]}", 0, 55, 0x00)
+        black_plane.text(f"{now[0]}-{now[1]}-{now[2]}", 0, 40, 0x00)
+        black_plane.text(f"{now[3]}:{now[4]}:{now[5]}", 0, 55, 0x00)
     except:
         pass
 
     if msg is not None:
-        epd.imagered.text(msg, 0, 70, 0x00)
+        red_plane.text(msg, 0, 70, 0x00)
 
-    epd.reset()
-    epd.Clear(0xFF, 0xFF)
-    epd.display()
-    epd.sleep()
+    present()
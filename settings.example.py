@@ -28,3 +28,33 @@ MQTT_CLIENT_ID = "pico-weather-" + random_string(5)
 MQTT_USER = "pico-weather"
 MQTT_PASSWD = ""
 MQTT_HOST = ""
+
+# Screen refresh policy. Updates are drawn directly over the previous frame;
+# ghosting is cleared with an extra full refresh every N updates (0 = never)
+# or when more than this share of the screen changes (None = never).
+REFRESH_CLEAR_EVERY = 12
+REFRESH_CLEAR_CHANGE = 0.5
+
+# Display driver, as "module.Class". See display.py.
+DISPLAY_DRIVER = "eink.EPD_2in9_B"
+
+# Send frames to the display with DMA instead of the CPU.
+DISPLAY_DMA = False
+
+# Use the fast full-refresh waveform for normal updates. Periodic clears
+# always use the panel's slower built-in waveform. Opt-in: it overrides the
+# temperature setting and has not been checked for red ghosting on this
+# 3-colour panel.
+DISPLAY_FAST_REFRESH = False
+
+# Memory for rendered glyphs kept between updates, in bytes. The large
+# digits are a few hundred bytes each.
+GLYPH_CACHE_BYTES = 8192
+
+# Draw each run of text off-screen and blit it once, instead of a blit per
+# character. Measure with bench.text() before turning it on.
+TEXT_LINE_MODE = False
+
+# Raw glyphs kept in RAM per font read from a fonts/*.fnt file. Rendered
+# glyphs are cached anyway (GLYPH_CACHE_BYTES), so this is rarely needed.
+FONT_HOT_GLYPHS = 0
@@ -0,0 +1,99 @@
+# DMA-driven SPI transmit for the RP2040.
+#
+# Feeds a buffer to an SPI peripheral's TX FIFO with one of the rp2 DMA
+# channels while the CPU carries on. The buffer is sent in chunks of at most
+# `chunk` bytes; each chunk's completion IRQ starts the next and the last one
+# calls the completion callback. Only transmit is supported; received bytes
+# are discarded.
+import rp2
+from machine import mem32, idle
+
+_SPI_BASE = (0x4003C000, 0x40040000)
+_SSPDR = 0x008
+_SSPSR = 0x00C
+_SSPICR = 0x020
+
+_SSPSR_RNE = 0x04  # Receive FIFO not empty
+_SSPSR_BSY = 0x10  # Busy shifting data
+
+_DREQ_SPI_TX = (16, 18)
+
+CHUNK = 4096
+
+
+class SPIDMA:
+    def __init__(self, spi_id=1, chunk=CHUNK):
+        self.chunk = chunk
+        self._base = _SPI_BASE[spi_id]
+        self._dma = rp2.DMA()
+        self._ctrl = self._dma.pack_ctrl(
+            size=0,  # Bytes
+            inc_read=True,
+            inc_write=False,
+            treq_sel=_DREQ_SPI_TX[spi_id],
+            irq_quiet=False,  # Quiet by default; _irq chains the chunks
+        )
+        self._dma.irq(handler=self._irq)
+
+        self._buf = None
+        self._offset = 0
+        self._callback = None
+        self.busy = False
+
+    def write(self, buf, callback=None):
+        """Start sending `buf`; returns immediately.
+
+        `buf` must not be modified until the transfer completes. When the
+        last byte has left the SPI peripheral callback() is called.
+        """
+        if self.busy:
+            raise OSError("SPIDMA: transfer in progress")
+
+        self._buf = memoryview(buf)
+        self._offset = 0
+        self._callback = callback
+        self.busy = True
+        self._next()
+
+    def wait(self):
+        while self.busy:
+            idle()
+
+    def close(self):
+        self._dma.irq(handler=None)
+        self._dma.close()
+
+    def _next(self):
+        start = self._offset
+        end = min(start + self.chunk, len(self._buf))
+        if start == end:
+            self._finish()
+            return
+
+        self._offset = end
+        self._dma.config(
+            read=self._buf[start:end],
+            write=self._base + _SSPDR,
+            count=end - start,
+            ctrl=self._ctrl,
+            trigger=True,
+        )
+
+    def _irq(self, _):
+        self._next()
+
+    def _finish(self):
+        # DMA is done when the last byte is in the FIFO, not on the wire.
+        base = self._base
+        while mem32[base + _SSPSR] & _SSPSR_BSY:
+            pass
+        while mem32[base + _SSPSR] & _SSPSR_RNE:
+            mem32[base + _SSPDR]
+        mem32[base + _SSPICR] = 0x01  # Clear receive overrun
+
+        self._buf = None
+        self.busy = False
+        callback = self._callback
+        self._callback = None
+        if callback is not None:
+            callback()
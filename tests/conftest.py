@@ -0,0 +1,9 @@
+# The tests run the firmware on the host through tools/hostenv.py, which
+# must be imported before any firmware module.
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))), 'tools'))
+
+import hostenv  # noqa: E402,F401
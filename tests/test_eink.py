@@ -0,0 +1,28 @@
+import eink
+import hostenv
+
+
+def _epd():
+    import screen
+
+    hostenv.wait(screen.epd)
+    return screen.epd
+
+
+def test_wake_counts_once_per_restart():
+    epd = _epd()
+    epd.sleep()
+    epd.stats.update(init_ms=400, saved_ms=0)
+
+    epd.wake()
+    saved = epd.stats["saved_ms"]
+    wake_ms = epd.stats["wake_ms"]
+    assert epd.state == eink.STATE_READY
+    assert saved == 400 - wake_ms
+
+    # Already ready, as display() and transfer() find it in one update.
+    epd.wake()
+    epd.wake()
+    assert epd.stats["saved_ms"] == saved
+    assert epd.stats["wake_ms"] == wake_ms
+    epd.sleep()
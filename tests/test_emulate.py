@@ -0,0 +1,56 @@
+# What an update costs on the modelled controller (host/ssd1680.py), as
+# reported by tools/emulate.py. A full frame is 2 x 5624 bytes of RAM.
+import hostenv
+import pytest
+import ssd1680
+
+
+@pytest.fixture
+def panel():
+    import screen
+
+    hostenv.wait(screen.epd)
+    # Contents unknown, as after a reboot, and no periodic clear due.
+    screen.epd._prev_black = None
+    screen.epd._prev_red = None
+    screen.policy.fingerprint = None
+    screen.policy.since_clear = 0
+    ssd1680.panel.reset_stats()
+    yield ssd1680.panel
+    screen.epd.configure(partial=True, fast=False)
+
+
+def _update(panel, gusts):
+    panel.reset_stats()
+    hostenv.render(gusts=gusts)
+    return panel.report()
+
+
+@pytest.mark.parametrize('fast', [False, True])
+def test_full_update(panel, fast):
+    import screen
+
+    screen.epd.configure(partial=True, fast=fast)
+    stats = _update(panel, 5)
+
+    assert stats['refreshes'] == 1
+    assert stats['fast' if fast else 'full'] == 1
+    assert stats['ram_bytes'] == 11248
+    assert 11248 < stats['bytes'] < 11400
+
+
+def test_black_only_change_is_partial(panel):
+    _update(panel, 5)
+    stats = _update(panel, 6)
+
+    assert stats['refreshes'] == 1
+    assert stats['partial'] == 1
+    assert stats['bytes'] < 512
+
+
+def test_unchanged_frame_sends_nothing(panel):
+    _update(panel, 5)
+    stats = _update(panel, 5)
+
+    assert stats['bytes'] == 0
+    assert stats['refreshes'] == 0
@@ -0,0 +1,58 @@
+# The NumPy and pure-Python stand-ins must write the same bytes.
+import random
+
+import framebuf
+import pytest
+
+pytestmark = pytest.mark.skipif(framebuf.np is None, reason='NumPy not installed')
+
+W, H = 37, 29  # Not a multiple of 8
+
+
+def _pair(fmt, w=W, h=H):
+    bufs = (bytearray(((w + 7) // 8) * h), bytearray(((w + 7) // 8) * h))
+    return (bufs, framebuf._PyFrameBuffer(bufs[0], w, h, fmt),
+            framebuf._NpFrameBuffer(bufs[1], w, h, fmt))
+
+
+@pytest.mark.parametrize('fmt', [framebuf.MONO_HLSB, framebuf.MONO_HMSB])
+def test_backends_agree(fmt):
+    rnd = random.Random(fmt)
+    (a, b), py, np_ = _pair(fmt)
+
+    for _ in range(200):
+        op = rnd.choice(('fill', 'fill_rect', 'pixel', 'blit', 'scroll', 'text'))
+        c = rnd.randint(0, 1)
+        if op == 'fill':
+            args = (c,)
+        elif op == 'fill_rect':
+            args = (rnd.randint(-10, W), rnd.randint(-10, H),
+                    rnd.randint(0, 40), rnd.randint(0, 40), c)
+        elif op == 'pixel':
+            args = (rnd.randint(-2, W + 1), rnd.randint(-2, H + 1), c)
+        elif op == 'scroll':
+            args = (rnd.randint(-8, 8), rnd.randint(-8, 8))
+        elif op == 'text':
+            s = ''.join(chr(rnd.randint(30, 130)) for _ in range(rnd.randint(1, 5)))
+            args = (s, rnd.randint(-8, W), rnd.randint(-8, H), c)
+        else:
+            w, h = rnd.randint(1, 20), rnd.randint(1, 20)
+            src = bytearray(rnd.randbytes(((w + 7) // 8) * h))
+            key = rnd.choice((-1, 0, 1))
+            x, y = rnd.randint(-10, W), rnd.randint(-10, H)
+            py.blit(framebuf._PyFrameBuffer(bytearray(src), w, h, fmt), x, y, key)
+            np_.blit(framebuf._NpFrameBuffer(bytearray(src), w, h, fmt), x, y, key)
+            assert a == b, op
+            continue
+
+        getattr(py, op)(*args)
+        getattr(np_, op)(*args)
+        assert a == b, (op, args)
+
+
+def test_text_uses_builtin_font():
+    fb = framebuf.FrameBuffer(bytearray(8), 8, 8, framebuf.MONO_HLSB)
+    fb.text('A', 0, 0, 1)
+
+    columns = [sum(fb.pixel(x, y) << y for y in range(8)) for x in range(8)]
+    assert bytes(columns) == bytes.fromhex('007c7e0b0b7e7c00')
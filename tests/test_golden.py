@@ -0,0 +1,29 @@
+import time
+
+import framebuf
+import golden
+import hostenv
+import pytest
+
+
+@pytest.mark.parametrize('name', golden.FIXTURES)
+def test_matches_golden_images(name):
+    black, red = golden.FIXTURES[name]()
+
+    assert golden.compare(f'{name}_black.pbm', black)
+    assert golden.compare(f'{name}_red.pbm', red)
+
+
+# The host renders a layout update in about 20 ms with NumPy; the budget
+# leaves room for slow CI machines while still catching a per-pixel path
+# creeping back in.
+@pytest.mark.skipif(framebuf.np is None, reason='NumPy not installed')
+def test_render_time():
+    hostenv.render(gusts=1)  # Import and first-update costs
+    times = []
+    for step in range(5):
+        start = time.perf_counter()
+        hostenv.render(gusts=2 + step)
+        times.append(time.perf_counter() - start)
+
+    assert sorted(times)[len(times) // 2] < 0.25
@@ -0,0 +1,43 @@
+# The compiled layout against the golden frames: every pixel drawn falls in
+# the bounding box of a field, and every field with text draws in its box.
+import os
+
+import golden
+import layout
+import pytest
+import ssd1680
+
+
+@pytest.fixture(scope='module')
+def ink():
+    import screen
+
+    frames = [ssd1680.read_pbm(os.path.join(golden.GOLDEN, f'weather_{plane}.pbm'))
+              for plane in screen.epd.planes]
+    height, width = len(frames[0]), len(frames[0][0])
+    # The panel is mounted upside down (rotate=180); back to drawing order.
+    return {(width - 1 - x, height - 1 - y)
+            for rows in frames
+            for y, row in enumerate(rows)
+            for x, p in enumerate(row) if p}
+
+
+def _inside(box, x, y):
+    bx, by, bw, bh = box
+    return bx <= x < bx + bw and by <= y < by + bh
+
+
+def test_ink_is_within_field_bounds(ink):
+    import screen
+
+    bounds = layout.bounds(screen.boxes).values()
+    stray = [p for p in ink if not any(_inside(b, *p) for b in bounds)]
+    assert not stray
+
+
+def test_every_field_draws_in_its_box(ink):
+    import screen
+
+    for name, box in layout.bounds(screen.boxes).items():
+        assert any(_inside(box, *p) for p in ink), name
+
@@ -0,0 +1,56 @@
+import shutil
+
+
+def test_font_file_changes_background_signature(tmp_path):
+    import screen
+
+    font = screen.arial10
+    copy = tmp_path / 'arial10.fnt'
+    shutil.copyfile(font.path, copy)
+    path = font.path
+    try:
+        font.path = str(copy)
+        before = screen._font_signature(font, 0)
+        data = bytearray(copy.read_bytes())
+        data[-1] ^= 0xFF
+        copy.write_bytes(data)
+        assert screen._font_signature(font, 0) != before
+    finally:
+        font.path = path
+
+
+def _saved(policy):
+    import json
+
+    with open(policy.path) as f:
+        return json.load(f)
+
+
+def test_fingerprint_recorded_once_refresh_finishes():
+    import hostenv
+    import screen
+
+    hostenv.wait(screen.epd)
+    screen.debug_update_display(gusts=7)
+    assert screen.epd.busy
+    assert screen.policy.fingerprint is None
+    assert _saved(screen.policy)['fingerprint'] is None
+
+    hostenv.wait(screen.epd)
+    assert screen.policy.fingerprint is not None
+    assert _saved(screen.policy)['fingerprint'] == screen.policy.fingerprint
+
+
+def test_skip_sleeps_panel_without_saving():
+    import hostenv
+    import screen
+
+    hostenv.render(gusts=8)
+    saved = _saved(screen.policy)
+    skips = screen.policy.skips
+    screen.epd.wake()  # As after a reboot: initialised, not asleep
+
+    hostenv.render(gusts=8)
+    assert screen.policy.skips == skips + 1
+    assert screen.epd.asleep
+    assert _saved(screen.policy) == saved
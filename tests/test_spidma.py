@@ -0,0 +1,56 @@
+import machine
+import pytest
+from spidma import SPIDMA
+
+FRAME = 5624  # One 152x296 plane
+
+
+@pytest.fixture
+def sent(monkeypatch):
+    writes = []
+    monkeypatch.setattr(machine.SPI, 'write', lambda self, data: writes.append(bytes(data)))
+    return writes
+
+
+# Runs the scheduled IRQs a bounded number of times rather than calling
+# wait(), so a transfer whose IRQ never fires fails instead of hanging.
+def _settle(dma, limit=100):
+    for _ in range(limit):
+        if not dma.busy:
+            return
+        machine.idle()
+
+
+@pytest.mark.parametrize('chunk', [4096, 1000, FRAME, 8192])
+def test_write_sends_frame_in_chunks(sent, chunk):
+    frame = bytes(i & 0xFF for i in range(FRAME))
+    done = []
+    dma = SPIDMA(1, chunk=chunk)
+
+    dma.write(frame, lambda: done.append(True))
+    _settle(dma)
+
+    assert not dma.busy
+    assert done == [True]
+    assert [len(w) for w in sent] == [
+        min(chunk, FRAME - i) for i in range(0, FRAME, chunk)]
+    assert b''.join(sent) == frame
+    dma.close()
+
+
+def test_chunk_irq_is_not_quiet():
+    dma = SPIDMA(1)
+    assert dma._dma.unpack_ctrl(dma._ctrl)['irq_quiet'] is False
+    dma.close()
+
+
+def test_write_while_busy_raises(sent):
+    dma = SPIDMA(1, chunk=1000)
+    dma.write(bytes(3000))
+
+    with pytest.raises(OSError):
+        dma.write(bytes(10))
+
+    _settle(dma)
+    assert not dma.busy
+    dma.close()
@@ -0,0 +1,73 @@
+# Writer._wrap against the recursive rfind/rstrip word wrap it replaced.
+import framebuf
+import pytest
+from fonts import arial10, arial35
+from writer import Writer
+
+STRINGS = (
+    '',
+    ' ',
+    'few clouds',
+    'Feels like -88.88',
+    'scattered clouds, light rain',
+    'overcast clouds, moderate rain, mist',
+    '  leading and trailing spaces  ',
+    'a  b   c    d',
+    'Supercalifragilisticexpialidocious',
+    'short Supercalifragilisticexpialidocious word',
+    'tab\tseparated words with a long tail',
+    'Sunrise: 07:21 Sunset: 18:30 1015 hPa',
+)
+
+
+def _writer(font, width):
+    device = framebuf.FrameBuffer(bytearray(width * 296 // 8 + 296), width, 296,
+                                  framebuf.MONO_HMSB)
+    return device, Writer(device, font)
+
+
+# The wrap Writer._printline used to do, as the list of lines printed.
+def _old_lines(w, device, string, col):
+    lines = []
+    while True:
+        Writer.set_textpos(device, 0, col)
+        rstr = None
+        if w.stringlen(string, True):
+            pos = 0
+            lstr = string[:]
+            while w.stringlen(lstr, True):
+                pos = lstr.rfind(' ')
+                lstr = lstr[:pos].rstrip()
+            if pos > 0:
+                rstr = string[pos + 1:]
+                string = lstr
+        lines.append(string)
+        if rstr is None:
+            return lines
+        string = rstr
+        col = 0
+
+
+@pytest.mark.parametrize('font', [arial10, arial35], ids=['arial10', 'arial35'])
+@pytest.mark.parametrize('width', [40, 96, 152])
+def test_wrap_matches_old_implementation(font, width):
+    device, w = _writer(font, width)
+
+    for string in STRINGS:
+        for col in (0, 5, width // 2, width - 3):
+            expected = _old_lines(w, device, string, col)
+            lines = [string[start:end] for start, end in w._wrap(string, col)]
+            assert lines == expected, (string, col)
+
+
+def test_cached_glyphs_are_not_decoded_again():
+    import hostenv
+    import screen
+
+    fonts = [f for f in (screen.arial10, screen.arial35, screen.arial50)
+             if hasattr(f, 'stats')]
+    hostenv.render(gusts=3)
+    decodes = [f.stats()['decodes'] for f in fonts]
+
+    hostenv.render(gusts=3)
+    assert [f.stats()['decodes'] for f in fonts] == decodes
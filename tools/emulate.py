@@ -0,0 +1,78 @@
+# Run the screen through the modelled SSD1680 controller and report what each
+# update cost: bytes and transactions on the SPI bus, CS toggles, refresh
+# cycles by type and the modelled BUSY time (see BUSY_MS in host/ssd1680.py),
+# along with how long the host took to render and emulate it.
+#
+#   python3 tools/emulate.py                 # boot + 3 updates, text report
+#   python3 tools/emulate.py -n 10 -o out    # also write out/step-N.png
+#   python3 tools/emulate.py --ppm -o out    # PPM instead of PNG
+import argparse
+import os
+import sys
+import time
+
+import hostenv
+import ssd1680
+
+_COLUMNS = (
+    ('bytes', 'bytes'),
+    ('ram_bytes', 'ram'),
+    ('transactions', 'txns'),
+    ('cs_toggles', 'cs'),
+    ('full', 'full'),
+    ('fast', 'fast'),
+    ('partial', 'part'),
+    ('loads', 'load'),
+    ('spi_ms', 'spi ms'),
+    ('busy_ms', 'busy ms'),
+    ('render_ms', 'host ms'),
+)
+
+
+def _row(label, stats):
+    return f'{label:>6}' + ''.join(f'{stats[k]:>9}' for k, _ in _COLUMNS)
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-n', '--updates', type=int, default=3,
+                        help='updates after the first (boot) one')
+    parser.add_argument('-o', '--output', help='directory for panel images')
+    parser.add_argument('--ppm', action='store_true', help='write PPM, not PNG')
+    args = parser.parse_args(argv)
+
+    output = None
+    if args.output:
+        output = os.path.join(hostenv.CWD, args.output)
+        os.makedirs(output, exist_ok=True)
+
+    panel = ssd1680.panel
+    totals = dict.fromkeys((k for k, _ in _COLUMNS), 0)
+    print(f'{"step":>6}' + ''.join(f'{h:>9}' for _, h in _COLUMNS))
+
+    # The first step includes driver init (screen is imported by render());
+    # later ones change the gusts reading so successive frames differ.
+    for step in range(args.updates + 1):
+        start = time.perf_counter()
+        frame = hostenv.render(gusts=88.88 - step)
+        elapsed = time.perf_counter() - start
+        stats = panel.report()
+        stats['render_ms'] = round(elapsed * 1000, 1)
+        panel.reset_stats()
+        print(_row(step, stats))
+        for k in totals:
+            totals[k] += stats[k]
+
+        if output is not None:
+            ext = 'ppm' if args.ppm else 'png'
+            write = ssd1680.write_ppm if args.ppm else ssd1680.write_png
+            write(os.path.join(output, f'step-{step}.{ext}'), frame)
+
+    totals['spi_ms'] = round(totals['spi_ms'], 1)
+    totals['render_ms'] = round(totals['render_ms'], 1)
+    print(_row('total', totals))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,176 @@
+# Convert font_to_py modules into the binary font files read by
+# fonts/store.py.
+#
+#   python3 tools/fontbin.py fonts/arial35.py fonts/arial50.py
+#   python3 tools/fontbin.py --packed fonts/arial50.py
+#
+# Each fonts/<name>.py is written as fonts/<name>.fnt. tools/subset.py
+# writes the fonts the screen actually uses.
+import importlib.util
+import os
+import struct
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [os.path.join(ROOT, 'host'), ROOT]  # fonts.store needs utime
+
+import accel  # noqa: E402
+from fonts import store  # noqa: E402
+
+
+def load_module(path):
+    name = os.path.splitext(os.path.basename(path))[0]
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def packbits(data):
+    """PackBits: runs of 2+ equal bytes as (257 - n, byte), else literals."""
+    out = bytearray()
+    i = 0
+    n = len(data)
+    while i < n:
+        j = i
+        while j < n and j - i < 128 and data[j] == data[i]:
+            j += 1
+        if j - i >= 2:
+            out += bytes((257 - (j - i), data[i]))
+            i = j
+            continue
+        j = i + 1
+        while j < n and j - i < 128 and not (j + 1 < n and data[j] == data[j + 1]):
+            j += 1
+        out.append(j - i - 1)
+        out += data[i:j]
+        i = j
+    return bytes(out)
+
+
+def pack(glyph, stride):
+    """Glyph rows XORed with the row above, then PackBits."""
+    delta = bytearray(glyph)
+    for i in range(len(delta) - 1, stride - 1, -1):
+        delta[i] ^= glyph[i - stride]
+    return packbits(delta)
+
+
+def select(font, chars=None):
+    """The glyphs to keep from a font, as (codes, glyphs, default).
+
+    glyphs maps each code to its (bitmap, width); default is the glyph
+    get_ch() returns for characters the font lacks. Codes that only give
+    the default glyph are left out; with `chars`, so is everything else.
+    """
+    def glyph(code):
+        bitmap, _, width = font.get_ch(chr(code))
+        return bytes(bitmap), width
+
+    # One past max_ch() get_ch() returns the default glyph.
+    default = glyph(font.max_ch() + 1)
+    codes = range(font.min_ch(), font.max_ch() + 1)
+    if chars is not None:
+        codes = sorted({ord(c) for c in chars} & set(codes))
+    glyphs = {code: glyph(code) for code in codes}
+    codes = [code for code in codes if glyphs[code] != default]
+    if not codes:
+        raise ValueError('no characters in the font')
+    return codes, glyphs, default
+
+
+def contiguous(codes):
+    return codes == list(range(codes[0], codes[-1] + 1))
+
+
+_REVERSE = bytes(int(f'{b:08b}'[::-1], 2) for b in range(256))
+
+
+def transform(glyph, invert=False, reverse=False):
+    """Glyph bitmap with its bits inverted and/or each byte bit-reversed."""
+    if invert:
+        glyph = bytes(b ^ 0xFF for b in glyph)
+    if reverse:
+        glyph = glyph.translate(_REVERSE)
+    return glyph
+
+
+def encode(font, chars=None, packed=False, invert=False, reverse=False):
+    """Font file contents for a font_to_py font module (or FontFile).
+
+    With `chars`, only those characters (and the default glyph) are kept.
+    Fonts with gaps in their range get a sparse code table. With `packed`,
+    glyphs are stored compressed where that makes them smaller.
+
+    `invert` stores glyphs as 0 for ink, as Writer draws black on white, and
+    `reverse` stores the leftmost pixel in bit 0 (MONO_HMSB), as eink.py's
+    frame buffers are when the panel is rotated 180 degrees. Writer then uses
+    the glyphs without transforming them. The metric tables read by
+    fonts/metrics.py are always included.
+    """
+    source_invert = getattr(font, 'inverted', lambda: False)()
+    source_reverse = font.reverse()
+
+    def plain(glyph):
+        return transform(glyph, source_invert, source_reverse)
+
+    def record(glyph, width):
+        glyph = transform(plain(glyph), invert, reverse)
+        if packed:
+            data = pack(glyph, (width + 7) >> 3)
+            if len(data) < len(glyph):
+                return struct.pack('<H', width | store.PACKED) + data
+        return struct.pack('<H', width) + glyph
+
+    codes, glyphs, default = select(font, chars)
+    lo = codes[0]
+    hi = codes[-1]
+    sparse = b''
+    if not contiguous(codes):
+        sparse = struct.pack(f'<{len(codes)}H', *codes)
+    records = [record(*glyphs[code]) for code in codes] + [record(*default)]
+
+    # Width and blank right-hand columns for lo..hi and the default glyph.
+    widths = bytearray()
+    blanks = bytearray()
+    for code in range(lo, hi + 2):
+        glyph, width = glyphs.get(code, default)
+        widths.append(width)
+        blanks.append(width - accel.truelen(plain(glyph), font.height(), width))
+
+    count = len(records)
+    flags = (store.FLAG_HMAP if font.hmap() else 0) | \
+        (store.FLAG_REVERSE if reverse else 0) | \
+        (store.FLAG_SPARSE if sparse else 0) | \
+        (store.FLAG_PACKED if any(r[1] & 0x80 for r in records) else 0) | \
+        (store.FLAG_INVERTED if invert else 0) | \
+        store.FLAG_METRICS
+    baseline = font.baseline() if hasattr(font, 'baseline') else font.height()
+    header = struct.pack(store.HEADER, store.MAGIC, store.VERSION, flags,
+                         font.height(), font.max_width(), baseline, lo, hi, count)
+    header += sparse + widths + blanks
+
+    offset = len(header) + 4 * (count + 1)
+    index = bytearray()
+    for record in records:
+        index += struct.pack('<I', offset)
+        offset += len(record)
+    index += struct.pack('<I', offset)
+    return header + index + b''.join(records)
+
+
+def main(argv):
+    packed = '--packed' in argv
+    for path in argv:
+        if path.startswith('--'):
+            continue
+        data = encode(load_module(path), packed=packed)
+        out = os.path.splitext(path)[0] + '.fnt'
+        with open(out, 'wb') as f:
+            f.write(data)
+        print(f'{out}: {len(data)} bytes')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,67 @@
+# Rewrite font modules in the layout read by fonts/index.py.
+#
+#   python3 tools/fontpy.py fonts/arial10.py fonts/arial35.py fonts/arial50.py
+#
+# The modules are rewritten in place, keeping their header comments; glyphs
+# and metrics are unchanged. Running it again is harmless.
+import os
+import struct
+import sys
+
+import fontbin
+
+_FUNCTIONS = ('height', 'baseline', 'max_width', 'hmap', 'reverse',
+              'monospaced')
+
+
+def _literal(name, data):
+    lines = [f'{name} =\\']
+    for i in range(0, len(data), 16):
+        chunk = ''.join(f'\\x{b:02x}' for b in data[i:i + 16])
+        lines.append(f"b'{chunk}'\\")
+    lines[-1] = lines[-1][:-1]
+    return '\n'.join(lines) + '\n'
+
+
+def source(font, header):
+    codes, glyphs, default = fontbin.select(font)
+    data = b''.join(struct.pack('<H', width) + glyph
+                    for glyph, width in [glyphs[code] for code in codes] + [default])
+
+    note = '# Glyph layout: see fonts/index.py (tools/fontpy.py).'
+    out = [line for line in header if line.startswith('#') and line != note]
+    out.append(note)
+    out.append('from fonts import index\n')
+    if hasattr(font, 'version'):
+        out.append(f'version = {font.version!r}\n')
+    for name in _FUNCTIONS:
+        if hasattr(font, name):
+            out.append(f'def {name}():\n    return {getattr(font, name)()!r}\n')
+    out.append(f'def min_ch():\n    return {codes[0]}\n')
+    out.append(f'def max_ch():\n    return {codes[-1]}\n')
+    out.append(_literal('_font', data))
+    if fontbin.contiguous(codes):
+        out.append('_codes = None\n')
+    else:
+        out.append(_literal('_codes', struct.pack(f'<{len(codes)}H', *codes)))
+    out.append(f'get_ch = index.build(_font, {font.height()}, {codes[0]}, _codes)')
+    return '\n'.join(out) + '\n'
+
+
+def main(argv):
+    for path in argv:
+        with open(path) as f:
+            header = []
+            for line in f:
+                if not line.startswith('#'):
+                    break
+                header.append(line.rstrip('\n'))
+        text = source(fontbin.load_module(path), header)
+        with open(path, 'w') as f:
+            f.write(text)
+        print(f'{path}: {os.path.getsize(path)} bytes')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,74 @@
+# Host-side golden image check for the screen layout.
+#
+# Renders each fixture (the debug layout and the error screen) through the
+# driver into the modelled panel controller (host/ssd1680.py) and compares
+# the refreshed image with the PBM files in tools/golden/.
+#
+#   python3 tools/golden.py            # compare, exit 1 on mismatch
+#   python3 tools/golden.py --update   # rewrite the golden images
+import os
+import sys
+
+import hostenv
+import ssd1680
+
+GOLDEN = os.path.join(hostenv.ROOT, 'tools', 'golden')
+
+
+def compare(name, rows):
+    path = os.path.join(GOLDEN, name)
+    expected = ssd1680.read_pbm(path)
+    diff = sum(
+        a != b
+        for row, exp in zip(rows, expected)
+        for a, b in zip(row, exp)
+    )
+    if len(rows) != len(expected) or len(rows[0]) != len(expected[0]):
+        print(f'{name}: size differs')
+        return False
+    if diff:
+        print(f'{name}: {diff} pixels differ')
+        return False
+    print(f'{name}: OK')
+    return True
+
+
+def render_error():
+    """Draw show_error() with a fixed clock and return the refreshed frame."""
+    import screen
+
+    gmtime = screen.time.gmtime
+    screen.time.gmtime = lambda *args: (2025, 10, 9, 22, 2, 51, 3, 282)
+    try:
+        screen.show_error("No data")
+    finally:
+        screen.time.gmtime = gmtime
+    hostenv.wait(screen.epd)
+    return ssd1680.panel.frame
+
+
+FIXTURES = {
+    'weather': hostenv.render,
+    'error': render_error,
+}
+
+
+def main(argv):
+    ok = True
+    for name, render in FIXTURES.items():
+        black, red = render()
+        if '--update' in argv:
+            ssd1680.write_pbm(os.path.join(GOLDEN, f'{name}_black.pbm'), black)
+            ssd1680.write_pbm(os.path.join(GOLDEN, f'{name}_red.pbm'), red)
+            continue
+
+        ok = compare(f'{name}_black.pbm', black) and ok
+        ok = compare(f'{name}_red.pbm', red) and ok
+
+    if '--update' in argv:
+        print('Golden images updated.')
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
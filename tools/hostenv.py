@@ -0,0 +1,55 @@
+# Shared set-up for the host tools: puts the CPython stand-ins in host/ ahead
+# of the firmware on sys.path and gives the firmware what it expects from
+# the device (settings, UTC clock, a flash directory, no network).
+#
+# Import this before any firmware module.
+import importlib.util
+import os
+import sys
+import tempfile
+import time
+import types
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [os.path.join(ROOT, 'host'), ROOT]
+
+# Timestamps in the layout are rendered in UTC, as on the device.
+os.environ['TZ'] = 'UTC'
+time.tzset()
+
+# Rendering does not need the MQTT client (or the network stack it imports).
+sys.modules['mqtt'] = types.SimpleNamespace(
+    TOPIC_UPDATED='updated', publish=lambda topic, payload: None)
+
+# Use the example settings if there is no local settings.py.
+try:
+    import settings  # noqa: F401
+except ImportError:
+    spec = importlib.util.spec_from_file_location(
+        'settings', os.path.join(ROOT, 'settings.example.py'))
+    sys.modules['settings'] = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(sys.modules['settings'])
+
+# Files the firmware keeps on flash (refresh counters etc.) go to a scratch
+# directory rather than the working tree. Paths given on the command line
+# are resolved against CWD before the change.
+CWD = os.getcwd()
+_flash = tempfile.TemporaryDirectory()
+os.chdir(_flash.name)
+
+import ssd1680  # noqa: E402
+import utime  # noqa: E402
+
+
+def wait(epd):
+    while epd.busy:
+        utime.sleep_ms(10)
+
+
+def render(**kwargs):
+    """Draw the debug layout and return the (black, red) frame it refreshed."""
+    import screen
+
+    screen.debug_update_display(**kwargs)
+    wait(screen.epd)
+    return ssd1680.panel.frame
@@ -0,0 +1,188 @@
+# Cut the fonts down to the characters the screen can show.
+#
+# The character set for each font is traced by drawing the layout
+# (screen.update_display) for a sweep of weather payloads, plus the
+# OpenWeatherMap condition descriptions and any extra characters given.
+# Subset fonts are written as fonts/<name>.fnt (see fonts/store.py) from
+# the full fonts/<name>.py, with glyphs compressed unless --raw is given,
+# and a report of the flash and RAM saved.
+#
+# Unless --plain is given, glyphs are stored as the screen draws them: 0 for
+# ink (Writer prints black on white) and leftmost pixel in bit 0, matching
+# the MONO_HMSB frame buffers of the panel as mounted (rotate=180).
+#
+#   python3 tools/subset.py                       # write fonts/*.fnt
+#   python3 tools/subset.py --dry-run             # report only
+#   python3 tools/subset.py --extra arial35='?!'  # keep more characters
+import argparse
+import os
+import string
+import struct
+import sys
+
+import hostenv
+import fontbin
+from fonts import store
+
+FONTS = ('arial10', 'arial35', 'arial50')
+
+# Condition descriptions from https://openweathermap.org/weather-conditions.
+CONDITIONS = (
+    'thunderstorm with light rain', 'thunderstorm with rain',
+    'thunderstorm with heavy rain', 'light thunderstorm', 'thunderstorm',
+    'heavy thunderstorm', 'ragged thunderstorm',
+    'thunderstorm with light drizzle', 'thunderstorm with drizzle',
+    'thunderstorm with heavy drizzle', 'light intensity drizzle', 'drizzle',
+    'heavy intensity drizzle', 'light intensity drizzle rain',
+    'drizzle rain', 'heavy intensity drizzle rain', 'shower rain and drizzle',
+    'heavy shower rain and drizzle', 'shower drizzle', 'light rain',
+    'moderate rain', 'heavy intensity rain', 'very heavy rain',
+    'extreme rain', 'freezing rain', 'light intensity shower rain',
+    'shower rain', 'heavy intensity shower rain', 'ragged shower rain',
+    'light snow', 'snow', 'heavy snow', 'sleet', 'light shower sleet',
+    'shower sleet', 'light rain and snow', 'rain and snow',
+    'light shower snow', 'shower snow', 'heavy shower snow', 'mist', 'smoke',
+    'haze', 'sand/dust whirls', 'fog', 'sand', 'dust', 'volcanic ash',
+    'squalls', 'tornado', 'clear sky', 'few clouds', 'scattered clouds',
+    'broken clouds', 'overcast clouds',
+)
+
+# Kept whatever the trace says: the condition font gets every lower case
+# letter in case the API adds a description.
+EXTRA = {
+    'arial35': string.ascii_lowercase + ' ,',
+}
+
+
+def payloads():
+    """Weather payloads covering the range of every field on the screen."""
+    base = {
+        'pressure': 1015,
+        'snow': None,
+        'sunrise': 1760013668,
+        'sunset': 1760053805,
+        'cloudCoverage': 0,
+        'conditions': [{'main': 'Clouds', 'description': 'few clouds'}],
+        'temperature': {'current': 0, 'max': 0, 'min': 0, 'feelsLike': 0},
+        'humidity': 55,
+        'wind': {'degrees': 0, 'speed': 0, 'gusts': 0},
+        'rain': None,
+        'visibility': 10000,
+        'timestamp': 1760047371,
+    }
+    for i in range(100):
+        t = i - 45
+        yield dict(
+            base,
+            pressure=950 + i,
+            temperature={'current': t, 'max': t, 'min': -t, 'feelsLike': t},
+            humidity=i,
+            wind={'degrees': i * 36 % 360, 'speed': i, 'gusts': i + 9},
+            # Hours and minutes through the day.
+            sunrise=base['sunrise'] + i * 877,
+            sunset=base['sunset'] + i * 877,
+            timestamp=base['timestamp'] + i * 86400 * 7 + i * 877,
+            conditions=[{'main': '', 'description': CONDITIONS[i % len(CONDITIONS)]}],
+        )
+
+
+def trace():
+    """Characters printed per font over the payload sweep."""
+    import screen
+    from writer import Writer
+
+    names = {id(getattr(screen, name)): name for name in FONTS}
+    used = {name: set() for name in FONTS}
+    printstring = Writer.printstring
+
+    def record(self, s, invert=True):
+        used[names[id(self.font)]].update(s)
+        printstring(self, s, invert)
+
+    Writer.printstring = record
+    limits = {
+        'temp': {'low': -15, 'high': 25},
+        'humidity': {'low': -1, 'high': 80},
+        'wind': {'low': -1, 'high': 10},
+        'gusts': {'low': -1, 'high': 20},
+    }
+    try:
+        for charging in (True, False):
+            battery = {'charging': charging, 'level': 0.5}
+            for weather in payloads():
+                screen.update_display(weather, limits, battery)
+                hostenv.wait(screen.epd)
+                battery['level'] = (battery['level'] + 0.37) % 1
+    finally:
+        Writer.printstring = printstring
+
+    for text in CONDITIONS:
+        used['arial35'].update(text)
+    return used
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--extra', action='append', default=[],
+                        metavar='FONT=CHARS', help='characters to keep as well')
+    parser.add_argument('--raw', action='store_true',
+                        help='store glyphs uncompressed')
+    parser.add_argument('--plain', action='store_true',
+                        help='store glyphs as font_to_py does, not ready '
+                             'for the display')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='report without writing the font files')
+    args = parser.parse_args(argv)
+
+    extra = dict(EXTRA)
+    for item in args.extra:
+        name, _, chars = item.partition('=')
+        extra[name] = extra.get(name, '') + chars
+
+    used = trace()
+    fonts_dir = os.path.join(hostenv.ROOT, 'fonts')
+    print(f'{"font":8} {"glyphs":>9} {"module":>7} {"file":>13} {"file RAM":>11}')
+    for name in FONTS:
+        font = fontbin.load_module(os.path.join(fonts_dir, name + '.py'))
+        chars = used[name] | set(extra.get(name, ''))
+        full = fontbin.encode(font)
+        subset = fontbin.encode(font, chars, packed=not args.raw,
+                                invert=not args.plain, reverse=not args.plain)
+
+        # RAM: a module holds its glyph data and codes (plus a tuple per
+        # glyph); a font file its index (and sparse slot map) plus one or
+        # two glyph buffers and the metric tables.
+        module_ram = len(font._font) + len(font._codes or b'')
+        before = _glyphs(full)
+        after = _glyphs(subset)
+        print(f'{name:8} {before:>4}>{after:<4} {module_ram:>7} '
+              f'{len(full):>6}>{len(subset):<6} {_ram(full):>5}>{_ram(subset):<5}'
+              f'  {"".join(sorted(chars))!r}')
+
+        if not args.dry_run:
+            with open(os.path.join(fonts_dir, name + '.fnt'), 'wb') as f:
+                f.write(subset)
+    return 0
+
+
+def _glyphs(data):
+    return struct.unpack_from(store.HEADER, data)[-1]
+
+
+def _ram(data):
+    (_, _, flags, height, max_width, _, lo, hi, count) = struct.unpack_from(
+        store.HEADER, data)
+    index = 4 * (count + 1)
+    slots = hi - lo + 1 if flags & store.FLAG_SPARSE else 0
+    tables = 2 * (hi - lo + 2) if flags & store.FLAG_METRICS else 0
+    offsets = struct.unpack_from(f'<{count + 1}I', data,
+                                 struct.calcsize(store.HEADER) + tables
+                                 + (2 * (count - 1) if slots else 0))
+    buf = max(b - a for a, b in zip(offsets, offsets[1:]))
+    if flags & store.FLAG_PACKED:
+        buf += ((max_width + 7) >> 3) * height  # Decode buffer
+    return index + slots + tables + buf
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
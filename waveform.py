@@ -0,0 +1,113 @@
+# Waveform (LUT) selection for SSD1680 panels.
+#
+# The controller refreshes with a waveform loaded from OTP unless a custom
+# LUT has been written with command 0x32. Waveforms tracks what is loaded
+# and switches between:
+#
+# OTP      The panel's built-in full waveform. Slowest; used for deep cleans.
+# FAST     A fast full refresh. Uses a registered custom LUT if there is one,
+#          otherwise the OTP waveform for a high temperature, which the
+#          controller runs with a shorter sequence.
+# PARTIAL  The registered partial LUT; black/white only.
+#
+# Custom LUTs are 159 bytes: 153 of waveform for 0x32, then the 0x3F,
+# gate (0x03), source (0x04, 3 bytes) and VCOM (0x2C) settings.
+
+OTP = 0
+FAST = 1
+PARTIAL = 2
+
+# Display update control (0x22) for a refresh with each waveform. None
+# leaves the controller's default, which loads the LUT from OTP.
+_UPDATE_CONTROL = {
+    OTP: None,
+    FAST: 0xC7,  # Display mode 1 with the loaded LUT
+    PARTIAL: 0x0F,  # Display mode 2 with the loaded LUT
+}
+
+# Temperature written to 0x1A to pick the fast OTP waveform, in 1/16 C.
+FAST_TEMPERATURE = 0x640
+
+
+class Waveforms:
+    def __init__(self, epd):
+        self.epd = epd
+        self.luts = {}
+        self.loaded = OTP
+
+    def register(self, mode, lut):
+        if len(lut) != 159:
+            raise ValueError(f"LUT must be 159 bytes, not {len(lut)}")
+
+        self.luts[mode] = lut
+        if self.loaded == mode:
+            self.loaded = None  # Reload on next select()
+
+    def reset(self):
+        # A hardware reset drops any custom LUT.
+        self.loaded = OTP
+
+    def update_control(self):
+        return _UPDATE_CONTROL.get(self.loaded)
+
+    def select(self, mode):
+        if mode == self.loaded:
+            return
+
+        epd = self.epd
+        if self.loaded != OTP:
+            epd._restart()  # Only a reset brings back the OTP waveform
+
+        if mode == FAST:
+            lut = self.luts.get(FAST)
+            if lut is not None:
+                self.load(lut)
+            else:
+                self._load_fast_otp()
+        elif mode == PARTIAL:
+            self.load(self.luts[PARTIAL])
+
+            epd.send_command(0x37)
+            epd.send_buffer(b'\x00\x00\x00\x00\x00\x40\x00\x00\x00\x00')
+
+            epd.send_command(0x3C)  # border waveform
+            epd.send_data(0x80)
+
+            epd.send_command(0x22)
+            epd.send_data(0xC0)  # Enable clock and analog
+            epd.send_command(0x20)
+            epd.ReadBusy()
+
+        self.loaded = mode
+
+    def load(self, lut):
+        epd = self.epd
+        epd.send_command(0x32)
+        epd.send_buffer(bytes(lut[0:153]))
+        epd.ReadBusy()
+
+        epd.send_command(0x3F)
+        epd.send_data(lut[153])
+        epd.send_command(0x03)  # gate voltage
+        epd.send_data(lut[154])
+        epd.send_command(0x04)  # source voltage
+        epd.send_buffer(bytes(lut[155:158]))
+        epd.send_command(0x2C)  # VCOM
+        epd.send_data(lut[158])
+
+    def _load_fast_otp(self):
+        epd = self.epd
+        epd.send_command(0x18)  # Internal temperature sensor
+        epd.send_data(0x80)
+        epd.send_command(0x22)
+        epd.send_data(0xB1)  # Load temperature and LUT
+        epd.send_command(0x20)
+        epd.ReadBusy()
+
+        epd.send_command(0x1A)  # Override the temperature
+        epd.send_data(FAST_TEMPERATURE >> 4)
+        epd.send_data((FAST_TEMPERATURE & 0x0F) << 4)
+        epd.send_command(0x22)
+        epd.send_data(0x91)  # Load LUT for that temperature
+        epd.send_command(0x20)
+        epd.ReadBusy()
@@ -24,7 +24,10 @@
 import framebuf
 from uctypes import bytearray_at, addressof
 from sys import implementation
+from collections import OrderedDict
 import os
+import accel
+from fonts import metrics
 
 __version__ = (0, 5, 1)
 
@@ -38,10 +41,63 @@ class DisplayState():
 def _get_id(device):
     return id(device)
 
+# Ready-to-blit glyph FrameBuffers keyed by (font, char, invert, clip width),
+# least recently used first. Entries are dropped once the glyph buffers
+# exceed the byte budget.
+class GlyphCache():
+    def __init__(self, budget=8192):
+        self.budget = budget
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # key: (fbc, nbytes)
+
+    def get(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries[key] = entry  # Now most recently used
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key, fbc, nbytes):
+        if nbytes > self.budget:
+            return
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.size -= old[1]
+        while self._entries and self.size + nbytes > self.budget:
+            self.size -= self._entries.pop(next(iter(self._entries)))[1]
+        self._entries[key] = (fbc, nbytes)
+        self.size += nbytes
+
+    def resize(self, budget):
+        self.budget = budget
+        while self._entries and self.size > budget:
+            self.size -= self._entries.pop(next(iter(self._entries)))[1]
+
+    def clear(self):
+        self._entries = OrderedDict()
+        self.size = 0
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "glyphs": len(self._entries),
+            "bytes": self.size,
+        }
+
 # Basic Writer class for monochrome displays
 class Writer():
 
     state = {}  # Holds a display state for each device
+    glyphs = GlyphCache()  # Shared by all instances
+    _lines = {}  # Line scratch buffers: (width, height, map): (buf, fb)
+    # Compose runs of text off-screen and blit each once. Off by default
+    # until bench.text() shows a gain on the device.
+    line_mode = False
 
     @staticmethod
     def set_textpos(device, row=None, col=None):
@@ -72,6 +128,9 @@ class Writer():
         if self.devid not in Writer.state:
             Writer.state[self.devid] = DisplayState()
         self.font = font
+        self.metrics = metrics.of(font)
+        # Fonts built for the display store 0 for ink (see fonts/store.py).
+        self.inverted = font.inverted() if hasattr(font, 'inverted') else False
         if font.height() >= device.height or font.max_width() >= device.width:
             raise ValueError('Font too large for screen')
         # Allow to work with reverse or normal font mapping
@@ -138,63 +197,84 @@ class Writer():
                 self._printchar('\n')
 
     def _printline(self, string, invert):
-        rstr = None
-        if self.wrap and self.stringlen(string, True):  # Length > self.screenwidth
-            pos = 0
-            lstr = string[:]
-            while self.stringlen(lstr, True):  # Length > self.screenwidth
-                pos = lstr.rfind(' ')
-                lstr = lstr[:pos].rstrip()
-            if pos > 0:
-                rstr = string[pos + 1:]
-                string = lstr
-                
+        if not self.wrap:
+            self._printsegment(string, invert)
+            return
+        first = True
+        for start, end in self._wrap(string, self._getstate().text_col):
+            if not first:
+                self._printchar('\n')
+            first = False
+            if start == 0 and end == len(string):
+                self._printsegment(string, invert)
+            elif start < end:
+                self._printsegment(string[start:end], invert)
+
+    def _printsegment(self, string, invert):
+        if not (self.line_mode and self._printrun(string, invert)):
+            for char in string:
+                self._printchar(char, invert)
+
+    # Word wrap in one pass over string, yielding (start, end) indices of each
+    # line; the first starts at column sc, the rest at column 0. A line that
+    # overhangs the screen is broken at the last space that leaves its text
+    # (less trailing whitespace) on screen. If there is no such space the
+    # rest of the string is one line and _printchar breaks or clips it.
+    def _wrap(self, string, sc):
+        m = self.metrics
+        widths = m.widths
+        blanks = m.blanks
+        lo = m.lo
+        n = m.n
+        wd = self.screenwidth
+        start = 0  # First char of the current line
+        l = sc  # Column after the chars so far in the current line
+        ink = 0  # End of the last non-blank char
+        brk = -1  # Last space in the line that could be broken at
+        brk_end = 0  # Line end if broken there: ink at brk
+        brk_col = 0  # Column after brk
+        over = False  # The line overhangs; looking for the end of the blanks
+        i = 0
         for char in string:
-            self._printchar(char, invert)
-        if rstr is not None:
-            self._printchar('\n')
-            self._printline(rstr, invert)  # Recurse
+            j = ord(char) - lo
+            if not 0 <= j < n:
+                j = n
+            w = widths[j]
+            blank = char.isspace()
+            if not over and l + w - blanks[j] > wd:
+                over = True
+            if over and not blank:
+                if brk <= start:
+                    break  # No break: the rest is one line
+                yield start, brk_end
+                # Continue from the space with the chars since then.
+                start = brk + 1
+                l -= brk_col
+                brk = -1
+                over = l + w - blanks[j] > wd
+                if over:
+                    break  # A word wider than the screen
+            if char == ' ':
+                brk = i
+                brk_end = ink
+                brk_col = l + w
+            elif not blank:
+                ink = i + 1
+            l += w
+            i += 1
+
+        if over and brk > start:
+            yield start, brk_end
+            start = brk + 1
+        yield start, len(string)
 
     def stringlen(self, string, oh=False):
-        if not len(string):
-            return 0
-        sc = self._getstate().text_col  # Start column
-        wd = self.screenwidth
-        l = 0
-        for char in string[:-1]:
-            _, _, char_width = self.font.get_ch(char)
-            l += char_width
-            if oh and l + sc > wd:
-                return True  # All done. Save time.
-        char = string[-1]
-        _, _, char_width = self.font.get_ch(char)
-        if oh and l + sc + char_width > wd:
-            l += self._truelen(char)  # Last char might have blank cols on RHS
-        else:
-            l += char_width  # Public method. Return same value as old code.
-        return l + sc > wd if oh else l
+        return self.metrics.stringlen(string, self._getstate().text_col,
+                                      self.screenwidth, oh)
 
     # Return the printable width of a glyph less any blank columns on RHS
     def _truelen(self, char):
-        glyph, ht, wd = self.font.get_ch(char)
-        div, mod = divmod(wd, 8)
-        gbytes = div + 1 if mod else div  # No. of bytes per row of glyph
-        mc = 0  # Max non-blank column
-        data = glyph[(wd - 1) // 8]  # Last byte of row 0
-        for row in range(ht):  # Glyph row
-            for col in range(wd -1, -1, -1):  # Glyph column
-                gbyte, gbit = divmod(col, 8)
-                if gbit == 0:  # Next glyph byte
-                    data = glyph[row * gbytes + gbyte]
-                if col <= mc:
-                    break
-                if data & (1 << (7 - gbit)):  # Pixel is lit (1)
-                    mc = col  # Eventually gives rightmost lit pixel
-                    break
-            if mc + 1 == wd:
-                break  # All done: no trailing space
-        # print('Truelen', char, wd, mc + 1)  # TEST 
-        return mc + 1
+        return self.metrics.truelen(char)
 
     def _get_char(self, char, recurse):
         if not recurse:  # Handle tabs
@@ -214,7 +294,10 @@ class Writer():
         if char == '\n':
             self._newline()
             return
-        glyph, char_height, char_width = self.font.get_ch(char)
+        # Sizes come from the metric tables; the glyph itself is only fetched
+        # (see _glyph) when it is not already in the cache.
+        char_height = self.height
+        char_width = self.metrics.width(char)
         s = self._getstate()
         np = None  # Allow restriction on printable columns
         if s.text_row + char_height > self.screenheight:
@@ -229,7 +312,7 @@ class Writer():
                     return
             else:
                 self._newline()
-        self.glyph = glyph
+        self.glyph = char
         self.char_height = char_height
         self.char_width = char_width
         self.clip_width = char_width if np is None else np
@@ -241,15 +324,62 @@ class Writer():
         self._get_char(char, recurse)
         if self.glyph is None:
             return  # All done
-        buf = bytearray(self.glyph)
-        if invert:
-            for i, v in enumerate(buf):
-                buf[i] = 0xFF & ~ v
-        fbc = framebuf.FrameBuffer(buf, self.clip_width, self.char_height, self.map)
+        fbc = self._glyph(char, self.char_height, self.char_width,
+                          self.clip_width, invert)
         self.device.blit(fbc, s.text_col, s.text_row)
         s.text_col += self.char_width
         self.cpos += 1
 
+    # Ready-to-blit FrameBuffer for a glyph, from the cache if possible. The
+    # font is only asked for the glyph (a file read and decode for .fnt
+    # fonts) on a miss.
+    def _glyph(self, char, height, width, clip, invert):
+        key = (self.font, char, invert, clip)
+        fbc = Writer.glyphs.get(key)
+        if fbc is None:
+            buf = bytearray(self.font.get_ch(char)[0])
+            if invert != self.inverted:
+                accel.invert(buf, len(buf))
+            # Rows of a clipped glyph are still width apart.
+            fbc = framebuf.FrameBuffer(buf, clip, height, self.map, width)
+            Writer.glyphs.put(key, fbc, len(buf))
+        return fbc
+
+    # Draw a run of characters that fits on the current line with a single
+    # device blit. The glyphs are composed in a scratch line buffer shared by
+    # writers of the same height. Returns False, having drawn nothing, if the
+    # run needs tabs, wrapping, clipping or scrolling; _printchar handles those.
+    def _printrun(self, string, invert):
+        if '\t' in string:
+            return False
+        s = self._getstate()
+        height = self.font.height()
+        if s.text_row + height > self.screenheight:
+            return False
+        width = self.metrics.stringlen(string)
+        if width == 0 or s.text_col + width > self.screenwidth:
+            return False
+
+        key = (self.screenwidth, height, self.map)
+        line = Writer._lines.get(key)
+        if line is None:
+            buf = bytearray(((self.screenwidth + 7) >> 3) * height)
+            line = (buf, framebuf.FrameBuffer(buf, self.screenwidth, height, self.map))
+            Writer._lines[key] = line
+        buf, scratch = line
+
+        width_of = self.metrics.width
+        x = 0
+        for char in string:
+            char_width = width_of(char)
+            scratch.blit(self._glyph(char, height, char_width, char_width, invert), x, 0)
+            x += char_width
+        run = framebuf.FrameBuffer(buf, width, height, self.map, self.screenwidth)
+        self.device.blit(run, s.text_col, s.text_row)
+        s.text_col += width
+        self.cpos += len(string)
+        return True
+
     def tabsize(self, value=None):
         if value is not None:
             self.tab = value